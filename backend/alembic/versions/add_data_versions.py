@@ -0,0 +1,56 @@
+"""add user_data.data_versions: per-table change counters for list ETags
+
+A statement-level trigger on resources, resource_contents and resource_cards bumps the
+"resources" counter in the writing transaction, so the new version becomes visible together
+with the data it describes (rating recalculations update resources and bump it too; renamed
+technologies / skill levels / mentors reach the lists through their resource_cards rows).
+
+Revision ID: add_data_versions
+Revises: add_users_version
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_data_versions"
+down_revision: Union[str, None] = "add_users_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRACKED_TABLES = ("resources", "resource_contents", "resource_cards")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_versions",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("name"),
+        schema="user_data",
+    )
+    op.execute("INSERT INTO user_data.data_versions (name, version) VALUES ('resources', 0)")
+    op.execute(
+        """
+CREATE OR REPLACE FUNCTION user_data.bump_data_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE user_data.data_versions SET version = version + 1 WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+    )
+    for table in TRACKED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER data_version_bump AFTER INSERT OR UPDATE OR DELETE ON user_data.{table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION user_data.bump_data_version('resources')"
+        )
+
+
+def downgrade() -> None:
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS data_version_bump ON user_data.{table}")
+    op.execute("DROP FUNCTION IF EXISTS user_data.bump_data_version()")
+    op.drop_table("data_versions", schema="user_data")
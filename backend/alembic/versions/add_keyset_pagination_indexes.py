@@ -0,0 +1,58 @@
+"""Composite indexes for keyset pagination of resources and favorites
+
+Revision ID: add_keyset_indexes
+Revises: add_resources_trgm
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_keyset_indexes"
+down_revision: Union[str, None] = "add_resources_trgm"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_data_resources_created_at_id",
+        "resources",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        schema="user_data",
+    )
+    op.create_index(
+        "ix_user_data_resources_team_updated_at_id",
+        "resources",
+        ["team_id", sa.text("updated_at DESC"), sa.text("id DESC")],
+        unique=False,
+        schema="user_data",
+    )
+    op.create_index(
+        "ix_user_data_favorites_user_created_at_resource",
+        "favorites",
+        ["user_id", sa.text("created_at DESC"), sa.text("resource_id DESC")],
+        unique=False,
+        schema="user_data",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_data_favorites_user_created_at_resource",
+        table_name="favorites",
+        schema="user_data",
+    )
+    op.drop_index(
+        "ix_user_data_resources_team_updated_at_id",
+        table_name="resources",
+        schema="user_data",
+    )
+    op.drop_index(
+        "ix_user_data_resources_created_at_id",
+        table_name="resources",
+        schema="user_data",
+    )
@@ -0,0 +1,92 @@
+"""composite (filter, created_at) and partial top-rated indexes matched to listing queries
+
+Replaces the single-column filter indexes on user_data.resources: each is the leading
+column of a (column, created_at DESC, id DESC) index, which also serves the ORDER BY.
+
+Revision ID: add_query_shape_indexes
+Revises: add_resource_contents
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_query_shape_indexes"
+down_revision: Union[str, None] = "add_resource_contents"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FILTER_COLUMNS = ("technology_id", "team_id", "skill_level_id", "mentor_id", "resource_type")
+
+
+def upgrade() -> None:
+    for column in FILTER_COLUMNS:
+        op.create_index(
+            f"ix_user_data_resources_{column}_created_at_id",
+            "resources",
+            [column, sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            schema="user_data",
+        )
+        op.drop_index(
+            f"ix_user_data_resources_{column}",
+            table_name="resources",
+            schema="user_data",
+        )
+    op.create_index(
+        "ix_user_data_resources_rated_top",
+        "resources",
+        [sa.text("average_rating DESC"), sa.text("ratings_count DESC")],
+        unique=False,
+        schema="user_data",
+        postgresql_where=sa.text("ratings_count > 0"),
+    )
+    op.create_index(
+        "ix_user_data_resources_skill_level_rated_top",
+        "resources",
+        ["skill_level_id", sa.text("average_rating DESC"), sa.text("ratings_count DESC")],
+        unique=False,
+        schema="user_data",
+        postgresql_where=sa.text("ratings_count > 0"),
+    )
+    op.create_index(
+        "ix_user_data_ratings_five_star_resource_id",
+        "ratings",
+        ["resource_id"],
+        unique=False,
+        schema="user_data",
+        postgresql_where=sa.text("score = 5"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_data_ratings_five_star_resource_id",
+        table_name="ratings",
+        schema="user_data",
+    )
+    op.drop_index(
+        "ix_user_data_resources_skill_level_rated_top",
+        table_name="resources",
+        schema="user_data",
+    )
+    op.drop_index(
+        "ix_user_data_resources_rated_top",
+        table_name="resources",
+        schema="user_data",
+    )
+    for column in reversed(FILTER_COLUMNS):
+        op.create_index(
+            f"ix_user_data_resources_{column}",
+            "resources",
+            [column],
+            unique=False,
+            schema="user_data",
+        )
+        op.drop_index(
+            f"ix_user_data_resources_{column}_created_at_id",
+            table_name="resources",
+            schema="user_data",
+        )
@@ -0,0 +1,44 @@
+"""add user_data.rating_deltas (write-behind rating aggregates journal)
+
+Revision ID: add_rating_deltas
+Revises: add_resources_popularity_score
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "add_rating_deltas"
+down_revision: Union[str, None] = "add_resources_popularity_score"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rating_deltas",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("resource_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("score_delta", sa.Integer(), nullable=False),
+        sa.Column("count_delta", sa.Integer(), nullable=False),
+        sa.Column("recount", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["resource_id"], ["user_data.resources.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        schema="user_data",
+    )
+    op.create_index(
+        "ix_user_data_rating_deltas_resource_id",
+        "rating_deltas",
+        ["resource_id"],
+        unique=False,
+        schema="user_data",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_data_rating_deltas_resource_id", table_name="rating_deltas", schema="user_data")
+    op.drop_table("rating_deltas", schema="user_data")
@@ -0,0 +1,58 @@
+"""unique (user_id, resource_id) on user_data.ratings (single-statement rating upsert)
+
+Revision ID: add_ratings_user_resource_unique
+Revises: add_resources_ratings_sum
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "add_ratings_user_resource_unique"
+down_revision: Union[str, None] = "add_resources_ratings_sum"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Duplicates from concurrent first votes: keep each user's latest rating of a resource
+    op.execute(
+        """
+        DELETE FROM user_data.ratings r
+        USING (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, resource_id ORDER BY rating_date DESC, id DESC
+            ) AS rn
+            FROM user_data.ratings
+        ) ranked
+        WHERE ranked.id = r.id AND ranked.rn > 1
+        """
+    )
+    op.create_unique_constraint(
+        "uq_user_data_ratings_user_resource",
+        "ratings",
+        ["user_id", "resource_id"],
+        schema="user_data",
+    )
+    # Aggregates counted the removed duplicates: recompute them exactly
+    op.execute(
+        """
+        UPDATE user_data.resources r
+        SET ratings_sum = coalesce(agg.total, 0),
+            ratings_count = coalesce(agg.cnt, 0),
+            average_rating = coalesce(round(agg.total::numeric / nullif(agg.cnt, 0), 2), 0)
+        FROM user_data.resources r2
+        LEFT JOIN (
+            SELECT resource_id, sum(score) AS total, count(*) AS cnt
+            FROM user_data.ratings
+            GROUP BY resource_id
+        ) agg ON agg.resource_id = r2.id
+        WHERE r2.id = r.id
+          AND (r.ratings_sum, r.ratings_count) IS DISTINCT FROM (coalesce(agg.total, 0), coalesce(agg.cnt, 0))
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_user_data_ratings_user_resource", "ratings", schema="user_data", type_="unique")
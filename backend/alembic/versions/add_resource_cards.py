@@ -0,0 +1,203 @@
+"""add user_data.resource_cards: denormalized list read model kept in sync by triggers
+
+One row per resource with technology / skill level names and the mentor name split into
+first/last. Triggers keep it current:
+- resources INSERT/UPDATE (including rating aggregate updates) upsert the resource's card;
+  DELETE cascades through the foreign key.
+- technologies / skill_levels / mentors name changes are copied onto their cards.
+
+Revision ID: add_resource_cards
+Revises: add_query_shape_indexes
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "add_resource_cards"
+down_revision: Union[str, None] = "add_query_shape_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FILTER_COLUMNS = ("technology_id", "team_id", "skill_level_id", "mentor_id", "resource_type")
+
+# Same split as MentorNested: first whitespace-separated word, then the rest; NULL without a mentor
+_MENTOR_FIRST = "CASE WHEN {name} IS NOT NULL THEN coalesce(substring(btrim({name}) from '^\\S+'), '') END"
+_MENTOR_LAST = "CASE WHEN {name} IS NOT NULL THEN coalesce(substring(btrim({name}) from '^\\S+\\s+(.*)$'), '') END"
+
+_CARD_SELECT = f"""
+    SELECT r.id, r.title, r.description, r.resource_type,
+           r.technology_id, t.name,
+           r.skill_level_id, s.name,
+           r.mentor_id, {_MENTOR_FIRST.format(name="m.name")}, {_MENTOR_LAST.format(name="m.name")},
+           r.team_id, r.average_rating, r.ratings_count, r.created_at, r.updated_at
+    FROM user_data.resources r
+    LEFT JOIN reference.technologies t ON t.id = r.technology_id
+    LEFT JOIN reference.skill_levels s ON s.id = r.skill_level_id
+    LEFT JOIN reference.mentors m ON m.id = r.mentor_id
+"""
+
+_CARD_COLUMNS = """
+    id, title, description, resource_type,
+    technology_id, technology_name,
+    skill_level_id, skill_level_name,
+    mentor_id, mentor_first_name, mentor_last_name,
+    team_id, average_rating, ratings_count, created_at, updated_at
+"""
+
+_UPSERT_CARD_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION user_data.resource_cards_sync_resource() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO user_data.resource_cards ({_CARD_COLUMNS})
+    {_CARD_SELECT}
+    WHERE r.id = NEW.id
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        description = EXCLUDED.description,
+        resource_type = EXCLUDED.resource_type,
+        technology_id = EXCLUDED.technology_id,
+        technology_name = EXCLUDED.technology_name,
+        skill_level_id = EXCLUDED.skill_level_id,
+        skill_level_name = EXCLUDED.skill_level_name,
+        mentor_id = EXCLUDED.mentor_id,
+        mentor_first_name = EXCLUDED.mentor_first_name,
+        mentor_last_name = EXCLUDED.mentor_last_name,
+        team_id = EXCLUDED.team_id,
+        average_rating = EXCLUDED.average_rating,
+        ratings_count = EXCLUDED.ratings_count,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+_REFERENCE_FUNCTIONS = {
+    "technologies": """
+CREATE OR REPLACE FUNCTION user_data.resource_cards_sync_technology() RETURNS trigger AS $$
+BEGIN
+    UPDATE user_data.resource_cards SET technology_name = NEW.name WHERE technology_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    "skill_levels": """
+CREATE OR REPLACE FUNCTION user_data.resource_cards_sync_skill_level() RETURNS trigger AS $$
+BEGIN
+    UPDATE user_data.resource_cards SET skill_level_name = NEW.name WHERE skill_level_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    "mentors": f"""
+CREATE OR REPLACE FUNCTION user_data.resource_cards_sync_mentor() RETURNS trigger AS $$
+BEGIN
+    UPDATE user_data.resource_cards
+    SET mentor_first_name = {_MENTOR_FIRST.format(name="NEW.name")},
+        mentor_last_name = {_MENTOR_LAST.format(name="NEW.name")}
+    WHERE mentor_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+}
+
+_REFERENCE_TRIGGER_FUNCTIONS = {
+    "technologies": "resource_cards_sync_technology",
+    "skill_levels": "resource_cards_sync_skill_level",
+    "mentors": "resource_cards_sync_mentor",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resource_cards",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("title", sa.String(length=512), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column(
+            "resource_type",
+            postgresql.ENUM("DOC", "BLUEPRINT", "SNIPPET", name="resourcetype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("technology_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("technology_name", sa.String(length=255), nullable=True),
+        sa.Column("skill_level_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("skill_level_name", sa.String(length=64), nullable=True),
+        sa.Column("mentor_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("mentor_first_name", sa.String(length=255), nullable=True),
+        sa.Column("mentor_last_name", sa.String(length=255), nullable=True),
+        sa.Column("team_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("average_rating", sa.Numeric(precision=3, scale=2), nullable=False),
+        sa.Column("ratings_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["id"], ["user_data.resources.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        schema="user_data",
+    )
+    op.create_index(
+        "ix_user_data_resource_cards_created_at_id",
+        "resource_cards",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        schema="user_data",
+    )
+    op.create_index(
+        "ix_user_data_resource_cards_team_updated_at_id",
+        "resource_cards",
+        ["team_id", sa.text("updated_at DESC"), sa.text("id DESC")],
+        unique=False,
+        schema="user_data",
+    )
+    for column in FILTER_COLUMNS:
+        op.create_index(
+            f"ix_user_data_resource_cards_{column}_created_at_id",
+            "resource_cards",
+            [column, sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            schema="user_data",
+        )
+
+    op.execute(f"INSERT INTO user_data.resource_cards ({_CARD_COLUMNS}) {_CARD_SELECT}")
+
+    op.execute(_UPSERT_CARD_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER resource_cards_sync AFTER INSERT OR UPDATE ON user_data.resources "
+        "FOR EACH ROW EXECUTE FUNCTION user_data.resource_cards_sync_resource()"
+    )
+    for table, function_sql in _REFERENCE_FUNCTIONS.items():
+        op.execute(function_sql)
+        op.execute(
+            f"CREATE TRIGGER resource_cards_sync AFTER UPDATE OF name ON reference.{table} "
+            f"FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name) "
+            f"EXECUTE FUNCTION user_data.{_REFERENCE_TRIGGER_FUNCTIONS[table]}()"
+        )
+
+
+def downgrade() -> None:
+    for table, function in _REFERENCE_TRIGGER_FUNCTIONS.items():
+        op.execute(f"DROP TRIGGER IF EXISTS resource_cards_sync ON reference.{table}")
+        op.execute(f"DROP FUNCTION IF EXISTS user_data.{function}()")
+    op.execute("DROP TRIGGER IF EXISTS resource_cards_sync ON user_data.resources")
+    op.execute("DROP FUNCTION IF EXISTS user_data.resource_cards_sync_resource()")
+    for column in reversed(FILTER_COLUMNS):
+        op.drop_index(
+            f"ix_user_data_resource_cards_{column}_created_at_id",
+            table_name="resource_cards",
+            schema="user_data",
+        )
+    op.drop_index(
+        "ix_user_data_resource_cards_team_updated_at_id",
+        table_name="resource_cards",
+        schema="user_data",
+    )
+    op.drop_index(
+        "ix_user_data_resource_cards_created_at_id",
+        table_name="resource_cards",
+        schema="user_data",
+    )
+    op.drop_table("resource_cards", schema="user_data")
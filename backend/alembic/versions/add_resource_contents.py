@@ -0,0 +1,61 @@
+"""add user_data.resource_contents (text extracted from resource Markdown files) + GIN index
+
+Revision ID: add_resource_contents
+Revises: add_keyset_indexes
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "add_resource_contents"
+down_revision: Union[str, None] = "add_keyset_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with app.models.core.CONTENT_SEARCH_VECTOR_EXPRESSION
+CONTENT_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', headings), 'B') || "
+    "setweight(to_tsvector('english', body), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resource_contents",
+        sa.Column("resource_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("headings", sa.Text(), nullable=False),
+        sa.Column("code_languages", postgresql.ARRAY(sa.String(length=32)), nullable=False),
+        sa.Column("extracted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(CONTENT_SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["resource_id"], ["user_data.resources.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("resource_id"),
+        schema="user_data",
+    )
+    op.create_index(
+        "ix_user_data_resource_contents_search_vector",
+        "resource_contents",
+        ["search_vector"],
+        unique=False,
+        schema="user_data",
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_data_resource_contents_search_vector",
+        table_name="resource_contents",
+        schema="user_data",
+    )
+    op.drop_table("resource_contents", schema="user_data")
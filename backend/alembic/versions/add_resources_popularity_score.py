@@ -0,0 +1,73 @@
+"""add user_data.resources.popularity_score (ranked listings by index scan)
+
+Revision ID: add_resources_popularity_score
+Revises: add_ratings_user_resource_unique
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_resources_popularity_score"
+down_revision: Union[str, None] = "add_ratings_user_resource_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resources",
+        sa.Column("popularity_score", sa.Float(), nullable=False, server_default="0"),
+        schema="user_data",
+    )
+    # Bayesian average with the default prior (mean 3.0, weight 5) and no decay; run
+    # scripts/refresh_popularity.py afterwards when the settings differ
+    op.execute(
+        """
+        UPDATE user_data.resources
+        SET popularity_score = (5 * 3.0 + ratings_sum) / (5 + ratings_count)
+        WHERE ratings_count > 0
+        """
+    )
+    op.drop_index("ix_user_data_resources_rated_top", table_name="resources", schema="user_data")
+    op.drop_index("ix_user_data_resources_skill_level_rated_top", table_name="resources", schema="user_data")
+    op.create_index(
+        "ix_user_data_resources_popular",
+        "resources",
+        [sa.text("popularity_score DESC"), sa.text("id DESC")],
+        unique=False,
+        schema="user_data",
+        postgresql_where=sa.text("ratings_count > 0"),
+    )
+    op.create_index(
+        "ix_user_data_resources_skill_level_popular",
+        "resources",
+        ["skill_level_id", sa.text("popularity_score DESC"), sa.text("id DESC")],
+        unique=False,
+        schema="user_data",
+        postgresql_where=sa.text("ratings_count > 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_data_resources_skill_level_popular", table_name="resources", schema="user_data")
+    op.drop_index("ix_user_data_resources_popular", table_name="resources", schema="user_data")
+    op.create_index(
+        "ix_user_data_resources_rated_top",
+        "resources",
+        [sa.text("average_rating DESC"), sa.text("ratings_count DESC")],
+        unique=False,
+        schema="user_data",
+        postgresql_where=sa.text("ratings_count > 0"),
+    )
+    op.create_index(
+        "ix_user_data_resources_skill_level_rated_top",
+        "resources",
+        ["skill_level_id", sa.text("average_rating DESC"), sa.text("ratings_count DESC")],
+        unique=False,
+        schema="user_data",
+        postgresql_where=sa.text("ratings_count > 0"),
+    )
+    op.drop_column("resources", "popularity_score", schema="user_data")
@@ -0,0 +1,43 @@
+"""add user_data.resources.ratings_sum (incremental rating aggregates)
+
+Revision ID: add_resources_ratings_sum
+Revises: add_data_versions
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_resources_ratings_sum"
+down_revision: Union[str, None] = "add_data_versions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resources",
+        sa.Column("ratings_sum", sa.Integer(), nullable=False, server_default="0"),
+        schema="user_data",
+    )
+    # Start from exact aggregates; later votes apply deltas
+    op.execute(
+        """
+        UPDATE user_data.resources r
+        SET ratings_sum = agg.total,
+            ratings_count = agg.cnt,
+            average_rating = round(agg.total::numeric / agg.cnt, 2)
+        FROM (
+            SELECT resource_id, sum(score) AS total, count(*) AS cnt
+            FROM user_data.ratings
+            GROUP BY resource_id
+        ) agg
+        WHERE agg.resource_id = r.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("resources", "ratings_sum", schema="user_data")
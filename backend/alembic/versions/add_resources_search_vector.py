@@ -0,0 +1,53 @@
+"""add user_data.resources.search_vector (generated tsvector) + GIN index
+
+Revision ID: add_search_vector
+Revises: alter_telegram_bigint
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "add_search_vector"
+down_revision: Union[str, None] = "alter_telegram_bigint"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in sync with app.models.core.SEARCH_VECTOR_EXPRESSION
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resources",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+        schema="user_data",
+    )
+    op.create_index(
+        "ix_user_data_resources_search_vector",
+        "resources",
+        ["search_vector"],
+        unique=False,
+        schema="user_data",
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_data_resources_search_vector",
+        table_name="resources",
+        schema="user_data",
+    )
+    op.drop_column("resources", "search_vector", schema="user_data")
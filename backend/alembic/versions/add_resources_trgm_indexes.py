@@ -0,0 +1,50 @@
+"""pg_trgm + trigram GIN indexes on user_data.resources title/description
+
+Revision ID: add_resources_trgm
+Revises: add_search_vector
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "add_resources_trgm"
+down_revision: Union[str, None] = "add_search_vector"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_user_data_resources_title_trgm",
+        "resources",
+        ["title"],
+        unique=False,
+        schema="user_data",
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_user_data_resources_description_trgm",
+        "resources",
+        ["description"],
+        unique=False,
+        schema="user_data",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_data_resources_description_trgm",
+        table_name="resources",
+        schema="user_data",
+    )
+    op.drop_index(
+        "ix_user_data_resources_title_trgm",
+        table_name="resources",
+        schema="user_data",
+    )
@@ -0,0 +1,28 @@
+"""add user_data.users.version (claims version embedded in access tokens)
+
+Revision ID: add_users_version
+Revises: add_resource_cards
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_users_version"
+down_revision: Union[str, None] = "add_resource_cards"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+        schema="user_data",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "version", schema="user_data")
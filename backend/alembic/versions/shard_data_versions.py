@@ -0,0 +1,95 @@
+"""shard user_data.data_versions counters (no single hot row for every resources write)
+
+With one "resources" row, every write (each vote's aggregate UPDATE included) updated it and
+held its lock until commit, so all votes and edits across all resources queued on that row.
+The counter is now split into DATA_VERSION_SHARDS rows per name; a row-level trigger bumps the
+shard picked by hashtext(resource id), so writes to different resources rarely share a row,
+and the version is the sum of the shards (each only grows, so the sum does too). The existing
+count stays in shard 0, so versions keep increasing across the upgrade.
+
+Revision ID: shard_data_versions
+Revises: add_rating_deltas
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "shard_data_versions"
+down_revision: Union[str, None] = "add_rating_deltas"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DATA_VERSION_SHARDS = 16
+# Tracked table -> column holding the resource id the shard is picked by
+TRACKED_TABLES = {"resources": "id", "resource_contents": "resource_id", "resource_cards": "id"}
+
+
+def upgrade() -> None:
+    op.add_column(
+        "data_versions",
+        sa.Column("shard", sa.SmallInteger(), nullable=False, server_default="0"),
+        schema="user_data",
+    )
+    op.drop_constraint("data_versions_pkey", "data_versions", schema="user_data", type_="primary")
+    op.create_primary_key("data_versions_pkey", "data_versions", ["name", "shard"], schema="user_data")
+    op.execute(
+        "INSERT INTO user_data.data_versions (name, shard, version) "
+        f"SELECT 'resources', s, 0 FROM generate_series(1, {DATA_VERSION_SHARDS - 1}) AS s"
+    )
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS data_version_bump ON user_data.{table}")
+    op.execute("DROP FUNCTION IF EXISTS user_data.bump_data_version()")
+    op.execute(
+        f"""
+CREATE FUNCTION user_data.bump_data_version() RETURNS trigger AS $$
+DECLARE
+    changed jsonb := to_jsonb(CASE WHEN TG_OP = 'DELETE' THEN OLD ELSE NEW END);
+BEGIN
+    UPDATE user_data.data_versions SET version = version + 1
+    WHERE name = TG_ARGV[0]
+      AND shard = abs(hashtext(changed ->> TG_ARGV[1])) % {DATA_VERSION_SHARDS};
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+    )
+    for table, key in TRACKED_TABLES.items():
+        op.execute(
+            f"CREATE TRIGGER data_version_bump AFTER INSERT OR UPDATE OR DELETE ON user_data.{table} "
+            f"FOR EACH ROW EXECUTE FUNCTION user_data.bump_data_version('resources', '{key}')"
+        )
+
+
+def downgrade() -> None:
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS data_version_bump ON user_data.{table}")
+    op.execute("DROP FUNCTION IF EXISTS user_data.bump_data_version()")
+    op.execute(
+        """
+UPDATE user_data.data_versions d SET version = totals.version
+FROM (SELECT name, sum(version) AS version FROM user_data.data_versions GROUP BY name) totals
+WHERE d.name = totals.name AND d.shard = 0
+"""
+    )
+    op.execute("DELETE FROM user_data.data_versions WHERE shard <> 0")
+    op.drop_constraint("data_versions_pkey", "data_versions", schema="user_data", type_="primary")
+    op.create_primary_key("data_versions_pkey", "data_versions", ["name"], schema="user_data")
+    op.drop_column("data_versions", "shard", schema="user_data")
+    op.execute(
+        """
+CREATE FUNCTION user_data.bump_data_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE user_data.data_versions SET version = version + 1 WHERE name = TG_ARGV[0];
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+    )
+    for table in TRACKED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER data_version_bump AFTER INSERT OR UPDATE OR DELETE ON user_data.{table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION user_data.bump_data_version('resources')"
+        )
@@ -1,5 +1,6 @@
 """
-API dependencies: JWT-based get_current_user for protected routes.
+API dependencies: JWT-based get_current_user for protected routes,
+and get_current_principal for handlers that only need the caller's id / team / skill level.
 """
 
 from typing import Annotated
@@ -10,9 +11,9 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import decode_access_token
+from app.core.security import Principal, decode_access_claims, decode_access_token
 from app.models.core import User
-from app.repositories.user_repo import UserRepository
+from app.repositories.user_repo import UserRepository, known_user_version
 
 
 security = HTTPBearer(auto_error=False)
@@ -23,7 +24,8 @@ async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
 ) -> User:
     """
-    Decode JWT from Authorization: Bearer <token> and return the User.
+    Decode JWT from Authorization: Bearer <token> and return the User
+    (a detached copy from the authenticated-user cache; see UserRepository.get_authenticated).
     Raises 401 if missing, invalid, or expired token.
     """
     if credentials is None:
@@ -49,7 +51,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     user_repo = UserRepository(session)
-    user = await user_repo.get_by_id(user_id)
+    user = await user_repo.get_authenticated(user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -75,4 +77,69 @@ async def get_current_user_optional(
     except ValueError:
         return None
     user_repo = UserRepository(session)
-    return await user_repo.get_by_id(user_id)
+    return await user_repo.get_authenticated(user_id)
+
+
+async def _resolve_principal(session: AsyncSession, claims: Principal) -> Principal | None:
+    """
+    The token's own claims when it embeds them and the user's current version (shared cache) is
+    not newer; otherwise, or when the version isn't cached, re-read them from the users row. None
+    if the user is gone.
+    """
+    if claims.user_version is not None:
+        known = await known_user_version(claims.id)
+        if known is not None and known <= claims.user_version:
+            return claims
+    row = await UserRepository(session).get_claims(claims.id)
+    if row is None:
+        return None
+    return Principal(
+        id=row.id,
+        team_id=row.team_id,
+        skill_level_id=row.skill_level_id,
+        user_version=row.version,
+    )
+
+
+async def get_current_principal(
+    session: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+) -> Principal:
+    """
+    Like get_current_user, but returns a Principal (id, team_id, skill_level_id).
+    Tokens with current embedded claims need no database access.
+    """
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    claims = decode_access_claims(credentials.credentials)
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    principal = await _resolve_principal(session, claims)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
+
+
+async def get_current_principal_optional(
+    session: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+) -> Principal | None:
+    """Return current principal if valid JWT present; otherwise None (no 401)."""
+    if credentials is None:
+        return None
+    claims = decode_access_claims(credentials.credentials)
+    if claims is None:
+        return None
+    return await _resolve_principal(session, claims)
@@ -54,7 +54,12 @@ async def auth_telegram(
             first_name=payload.first_name,
             last_name=payload.last_name,
         )
-    access_token = create_access_token(str(user.id))
+    access_token = create_access_token(
+        str(user.id),
+        team_id=user.team_id,
+        skill_level_id=user.skill_level_id,
+        user_version=user.version,
+    )
     return TelegramAuthResponse(
         access_token=access_token,
         token_type="bearer",
@@ -3,11 +3,14 @@
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
+from app.core.database import replica_reads
 from app.core.dependencies import get_reference_service
-from app.models.core import User
+from app.core.etag import json_response
+from app.core.reference_cache import MENTORS
+from app.core.security import Principal
 from app.schemas.reference import MentorRead, MentorCreate, MentorUpdate
 from app.services import ReferenceService
 
@@ -16,21 +19,24 @@ router = APIRouter(prefix="/reference/mentors", tags=["mentors"])
 
 @router.get("", response_model=list[MentorRead])
 async def list_mentors(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[MentorRead]:
-    return await svc.list_mentors()
+) -> Response:
+    snapshot = await svc.catalog(MENTORS)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.post("", response_model=MentorRead, status_code=status.HTTP_201_CREATED)
 async def create_mentor(
     data: MentorCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> MentorRead:
     return await svc.create_mentor(data)
 
 
 @router.get("/{id}", response_model=MentorRead)
+@replica_reads
 async def get_mentor(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
@@ -45,7 +51,7 @@ async def get_mentor(
 async def update_mentor(
     id: UUID,
     data: MentorUpdate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> MentorRead:
     m = await svc.update_mentor(id, data)
@@ -57,7 +63,7 @@ async def update_mentor(
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mentor(
     id: UUID,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> None:
     deleted = await svc.delete_mentor(id)
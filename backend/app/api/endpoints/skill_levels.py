@@ -3,11 +3,14 @@
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
+from app.core.database import replica_reads
 from app.core.dependencies import get_reference_service
-from app.models.core import User
+from app.core.etag import json_response
+from app.core.reference_cache import SKILL_LEVELS
+from app.core.security import Principal
 from app.schemas.reference import SkillLevelRead, SkillLevelCreate, SkillLevelUpdate
 from app.services import ReferenceService
 
@@ -16,21 +19,24 @@ router = APIRouter(prefix="/reference/skill-levels", tags=["skill-levels"])
 
 @router.get("", response_model=list[SkillLevelRead])
 async def list_skill_levels(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[SkillLevelRead]:
-    return await svc.list_skill_levels()
+) -> Response:
+    snapshot = await svc.catalog(SKILL_LEVELS)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.post("", response_model=SkillLevelRead, status_code=status.HTTP_201_CREATED)
 async def create_skill_level(
     data: SkillLevelCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> SkillLevelRead:
     return await svc.create_skill_level(data)
 
 
 @router.get("/{id}", response_model=SkillLevelRead)
+@replica_reads
 async def get_skill_level(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
@@ -45,7 +51,7 @@ async def get_skill_level(
 async def update_skill_level(
     id: UUID,
     data: SkillLevelUpdate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> SkillLevelRead:
     s = await svc.update_skill_level(id, data)
@@ -57,7 +63,7 @@ async def update_skill_level(
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_skill_level(
     id: UUID,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> None:
     deleted = await svc.delete_skill_level(id)
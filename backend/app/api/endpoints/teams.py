@@ -3,11 +3,14 @@
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
+from app.core.database import replica_reads
 from app.core.dependencies import get_reference_service
-from app.models.core import User
+from app.core.etag import json_response
+from app.core.reference_cache import TEAMS
+from app.core.security import Principal
 from app.schemas.reference import TeamRead, TeamCreate, TeamUpdate
 from app.services import ReferenceService
 
@@ -16,21 +19,24 @@ router = APIRouter(prefix="/reference/teams", tags=["teams"])
 
 @router.get("", response_model=list[TeamRead])
 async def list_teams(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[TeamRead]:
-    return await svc.list_teams()
+) -> Response:
+    snapshot = await svc.catalog(TEAMS)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.post("", response_model=TeamRead, status_code=status.HTTP_201_CREATED)
 async def create_team(
     data: TeamCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> TeamRead:
     return await svc.create_team(data)
 
 
 @router.get("/{id}", response_model=TeamRead)
+@replica_reads
 async def get_team(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
@@ -45,7 +51,7 @@ async def get_team(
 async def update_team(
     id: UUID,
     data: TeamUpdate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> TeamRead:
     t = await svc.update_team(id, data)
@@ -57,7 +63,7 @@ async def update_team(
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_team(
     id: UUID,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> None:
     deleted = await svc.delete_team(id)
@@ -3,11 +3,14 @@
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
+from app.core.database import replica_reads
 from app.core.dependencies import get_reference_service
-from app.models.core import User
+from app.core.etag import json_response
+from app.core.reference_cache import TECHNOLOGIES
+from app.core.security import Principal
 from app.schemas.reference import TechnologyRead, TechnologyCreate, TechnologyUpdate
 from app.services import ReferenceService
 
@@ -16,21 +19,24 @@ router = APIRouter(prefix="/reference/technologies", tags=["technologies"])
 
 @router.get("", response_model=list[TechnologyRead])
 async def list_technologies(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[TechnologyRead]:
-    return await svc.list_technologies()
+) -> Response:
+    snapshot = await svc.catalog(TECHNOLOGIES)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.post("", response_model=TechnologyRead, status_code=status.HTTP_201_CREATED)
 async def create_technology(
     data: TechnologyCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> TechnologyRead:
     return await svc.create_technology(data)
 
 
 @router.get("/{id}", response_model=TechnologyRead)
+@replica_reads
 async def get_technology(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
@@ -45,7 +51,7 @@ async def get_technology(
 async def update_technology(
     id: UUID,
     data: TechnologyUpdate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> TechnologyRead:
     t = await svc.update_technology(id, data)
@@ -57,7 +63,7 @@ async def update_technology(
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_technology(
     id: UUID,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
 ) -> None:
     deleted = await svc.delete_technology(id)
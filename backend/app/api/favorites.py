@@ -3,32 +3,62 @@
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
+from app.core.database import replica_reads
 from app.core.dependencies import get_favorite_repo, get_resource_repo
-from app.models.core import User
+from app.core.etag import is_not_modified, make_etag, not_modified, set_etag
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.security import Principal
 from app.repositories.favorite_repo import FavoriteRepository
 from app.repositories.resource_repo import ResourceRepository
-from app.schemas.resource import ResourceRead
+from app.schemas.resource import ResourceCard
+from app.services.resource_service import resource_card_from_row
 
 router = APIRouter(tags=["favorites"])
 
 
-@router.get("/favorites", response_model=list[ResourceRead])
+@router.get("/favorites", response_model=list[ResourceCard])
+@replica_reads
 async def list_favorites(
-    user: Annotated[User, Depends(get_current_user)],
+    request: Request,
+    response: Response,
+    user: Annotated[Principal, Depends(get_current_principal)],
     fav_repo: Annotated[FavoriteRepository, Depends(get_favorite_repo)],
-) -> list[ResourceRead]:
-    """Return resources favorited by the current user."""
-    resources = await fav_repo.get_favorites(user.id)
-    return [ResourceRead.model_validate(r).model_copy(update={"is_favorite": True}) for r in resources]
+    resource_repo: Annotated[ResourceRepository, Depends(get_resource_repo)],
+    limit: int | None = Query(None, ge=1, le=200),
+    cursor: str | None = Query(None, description=f"Keyset cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+) -> list[ResourceCard]:
+    """
+    Return resources favorited by the current user, newest favorite first.
+    Without limit/cursor returns all of them; otherwise one page, with the next page's cursor in X-Next-Cursor.
+    Conditional: the ETag follows the caller's favorites and the resources data version.
+    """
+    if cursor is not None and limit is None:
+        limit = 50
+    etag = make_etag(
+        "favorites", user.id, await fav_repo.favorites_version(user.id), await resource_repo.data_version()
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    try:
+        rows, next_cursor = await fav_repo.get_favorite_cards(user.id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    cards = [resource_card_from_row(row) for row in rows]
+    for card in cards:
+        card.is_favorite = True
+    return cards
 
 
 @router.post("/resources/{resource_id}/favorite")
 async def toggle_favorite(
     resource_id: UUID,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     fav_repo: Annotated[FavoriteRepository, Depends(get_favorite_repo)],
     resource_repo: Annotated[ResourceRepository, Depends(get_resource_repo)],
 ) -> dict[str, bool]:
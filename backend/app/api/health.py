@@ -1,10 +1,40 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+import hmac
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.core.config import settings
+from app.core.database import pool_stats
+from app.core.single_flight import single_flight_stats
 
 router = APIRouter()
 
+HEALTH_TOKEN_HEADER = "X-Health-Token"
+
+
+def _require_stats_token(
+    x_health_token: Annotated[str | None, Header(alias=HEALTH_TOKEN_HEADER)] = None,
+) -> None:
+    if not settings.db_pool_stats_token or x_health_token is None or not hmac.compare_digest(
+        x_health_token.encode(), settings.db_pool_stats_token.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid health token")
+
 
 @router.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/coalescing")
+async def coalescing() -> dict[str, dict[str, int]]:
+    """Per read path: computations executed, requests that joined one in flight, and currently in flight (this worker)."""
+    return single_flight_stats()
+
+
+@router.get("/health/db-pool", dependencies=[Depends(_require_stats_token)])
+async def db_pool() -> dict[str, dict]:
+    """Per engine (primary, replicas): connections checked out / idle / overflow, checkout waits and timeouts."""
+    return pool_stats()
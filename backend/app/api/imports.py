@@ -0,0 +1,49 @@
+"""
+Bulk import of historical ratings and favorites (wiki migration). Rows name arbitrary users, so
+this is an admin path: disabled unless BULK_IMPORT_ENABLED and BULK_IMPORT_TOKEN are set, and
+every request must carry that token in the X-Import-Token header.
+"""
+
+import hmac
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status
+
+from app.core.config import settings
+from app.core.dependencies import get_import_service
+from app.schemas.imports import FavoriteImportRow, ImportResult, RatingImportRow
+from app.services import ImportService
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+
+IMPORT_TOKEN_HEADER = "X-Import-Token"
+
+
+def _require_enabled(
+    x_import_token: Annotated[str | None, Header(alias=IMPORT_TOKEN_HEADER)] = None,
+) -> None:
+    if not settings.bulk_import_enabled or not settings.bulk_import_token:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Bulk import is disabled")
+    if x_import_token is None or not hmac.compare_digest(
+        x_import_token.encode(), settings.bulk_import_token.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid import token")
+
+
+@router.post("/ratings", response_model=ImportResult, dependencies=[Depends(_require_enabled)])
+async def import_ratings(
+    rows: Annotated[list[RatingImportRow], Body(max_length=settings.bulk_import_max_rows)],
+    svc: Annotated[ImportService, Depends(get_import_service)],
+) -> ImportResult:
+    """Upsert a batch of (user, resource, score); each touched resource's aggregates are recomputed once."""
+    return await svc.import_ratings(rows)
+
+
+@router.post("/favorites", response_model=ImportResult, dependencies=[Depends(_require_enabled)])
+async def import_favorites(
+    rows: Annotated[list[FavoriteImportRow], Body(max_length=settings.bulk_import_max_rows)],
+    svc: Annotated[ImportService, Depends(get_import_service)],
+) -> ImportResult:
+    """Add a batch of (user, resource) favorites; existing ones are left as they are."""
+    return await svc.import_favorites(rows)
@@ -5,9 +5,9 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
 from app.core.dependencies import get_rating_service
-from app.models.core import User
+from app.core.security import Principal
 from app.schemas.rating import RateBody, RateResponse
 from app.services import RatingService
 
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/resources", tags=["ratings"])
 async def post_rate(
     resource_id: UUID,
     body: RateBody,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[RatingService, Depends(get_rating_service)],
 ) -> RateResponse:
     """Set rating 1–5 for resource. Creates or updates; returns new average stats."""
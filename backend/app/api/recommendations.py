@@ -2,22 +2,31 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
 from app.core.dependencies import get_recommendation_service
-from app.models.core import User
+from app.core.etag import json_response, make_etag
+from app.core.security import Principal
 from app.schemas.resource import ResourceRead
 from app.services import RecommendationService
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
+_LIST_ADAPTER = TypeAdapter(list[ResourceRead])
+
 
 @router.get("", response_model=list[ResourceRead])
 async def get_recommendations(
-    user: Annotated[User, Depends(get_current_user)],
+    request: Request,
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[RecommendationService, Depends(get_recommendation_service)],
     limit: int = Query(50, ge=1, le=100),
-) -> list[ResourceRead]:
-    """Top resources by average_rating for user's skill_level."""
-    return await svc.get_recommendations(user, limit=limit)
+) -> Response:
+    """Shared precomputed feed, sent from its cached JSON body. Conditional on the feed contents."""
+    feed = await svc.feed()
+    if limit >= len(feed.items):
+        return json_response(request, feed.body, feed.etag)
+    body = _LIST_ADAPTER.dump_json(list(feed.items[:limit]))
+    return json_response(request, body, make_etag("recommendations", body))
@@ -3,9 +3,12 @@
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
+from app.core.database import replica_reads
 from app.core.dependencies import get_reference_service
+from app.core.etag import json_response
+from app.core.reference_cache import MENTORS, SKILL_LEVELS, TEAMS, TECHNOLOGIES
 from app.schemas.reference import (
     TechnologyRead,
     MentorRead,
@@ -19,12 +22,15 @@ router = APIRouter(prefix="/reference", tags=["reference"])
 
 @router.get("/technologies", response_model=list[TechnologyRead])
 async def list_technologies(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[TechnologyRead]:
-    return await svc.list_technologies()
+) -> Response:
+    snapshot = await svc.catalog(TECHNOLOGIES)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.get("/technologies/{id}", response_model=TechnologyRead)
+@replica_reads
 async def get_technology(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
@@ -38,12 +44,15 @@ async def get_technology(
 
 @router.get("/mentors", response_model=list[MentorRead])
 async def list_mentors(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[MentorRead]:
-    return await svc.list_mentors()
+) -> Response:
+    snapshot = await svc.catalog(MENTORS)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.get("/mentors/{id}", response_model=MentorRead)
+@replica_reads
 async def get_mentor(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
@@ -57,12 +66,15 @@ async def get_mentor(
 
 @router.get("/teams", response_model=list[TeamRead])
 async def list_teams(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[TeamRead]:
-    return await svc.list_teams()
+) -> Response:
+    snapshot = await svc.catalog(TEAMS)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.get("/teams/{id}", response_model=TeamRead)
+@replica_reads
 async def get_team(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
@@ -76,12 +88,15 @@ async def get_team(
 
 @router.get("/skill-levels", response_model=list[SkillLevelRead])
 async def list_skill_levels(
+    request: Request,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
-) -> list[SkillLevelRead]:
-    return await svc.list_skill_levels()
+) -> Response:
+    snapshot = await svc.catalog(SKILL_LEVELS)
+    return json_response(request, snapshot.body, snapshot.etag)
 
 
 @router.get("/skill-levels/{id}", response_model=SkillLevelRead)
+@replica_reads
 async def get_skill_level(
     id: UUID,
     svc: Annotated[ReferenceService, Depends(get_reference_service)],
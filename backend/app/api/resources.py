@@ -3,64 +3,153 @@
 from uuid import UUID
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.api.deps import get_current_user, get_current_user_optional
+from app.api.deps import get_current_principal, get_current_principal_optional
+from app.core.database import replica_reads
 from app.core.dependencies import get_resource_service, get_favorite_repo, get_rating_repo
-from app.models.core import User
+from app.core.etag import is_not_modified, make_etag, not_modified, set_etag
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.security import Principal
+from app.core.static_files import demo_static
 from app.repositories.favorite_repo import FavoriteRepository
 from app.repositories.rating_repo import RatingRepository
-from app.schemas.resource import ResourceRead, ResourceCreate, ResourceUpdate, ResourceFilters, ResourceTypeEnum
+from app.schemas.resource import (
+    ResourceRead,
+    ResourceCard,
+    ResourceCreate,
+    ResourceUpdate,
+    ResourceFilters,
+    ResourceTypeEnum,
+    ResourceSortEnum,
+    ResourceSearchModeEnum,
+    ResourceSuggestion,
+    ResourceFacets,
+)
 from app.services import ResourceService
 
 router = APIRouter(prefix="/resources", tags=["resources"])
 
 
-def _with_is_favorite(
-    read: ResourceRead,
-    resource_id: UUID,
-    favorite_ids: set[UUID],
-) -> ResourceRead:
-    return read.model_copy(update={"is_favorite": resource_id in favorite_ids})
-
-
-@router.get("", response_model=list[ResourceRead])
+@router.get("", response_model=list[ResourceCard])
+@replica_reads
 async def list_resources(
-    search: str | None = Query(None, description="Filter by title or description (case-insensitive)"),
+    request: Request,
+    response: Response,
+    search: str | None = Query(
+        None,
+        description="Full-text search over title and description (prefix match per word); 1–2 characters match as a substring",
+    ),
+    search_mode: ResourceSearchModeEnum = Query(
+        ResourceSearchModeEnum.fulltext,
+        description="fulltext, or fuzzy for typo-tolerant trigram matching",
+    ),
     team_id: UUID | None = None,
     skill_level_id: UUID | None = None,
     mentor_id: UUID | None = None,
     technology_id: UUID | None = None,
     resource_type: ResourceTypeEnum | None = None,
+    sort: ResourceSortEnum = Query(
+        ResourceSortEnum.newest,
+        description="newest, or relevance (ts_rank / trigram similarity; only applies with a search of 3+ characters)",
+    ),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None,
+        description=f"Keyset cursor from the {NEXT_CURSOR_HEADER} header of the previous page (overrides offset; sort=newest only)",
+    ),
     svc: Annotated[ResourceService, Depends(get_resource_service)] = ...,
-    user: Annotated[User | None, Depends(get_current_user_optional)] = None,
+    user: Annotated[Principal | None, Depends(get_current_principal_optional)] = None,
     fav_repo: Annotated[FavoriteRepository, Depends(get_favorite_repo)] = ...,
-) -> list[ResourceRead]:
-    """Vault search: list resources with optional filters."""
+) -> list[ResourceCard]:
+    """
+    Vault search: list resources with optional filters. The next page's cursor is sent in X-Next-Cursor.
+    Conditional: the ETag follows the resources data version (and the caller's favorites).
+    """
     filters = ResourceFilters(
         search=search.strip() if search and search.strip() else None,
+        search_mode=search_mode,
         team_id=team_id,
         skill_level_id=skill_level_id,
         mentor_id=mentor_id,
         technology_id=technology_id,
         resource_type=resource_type,
+        sort=sort,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
-    items = await svc.list_filtered(filters)
-    favorite_ids: set[UUID] = set()
+    etag = make_etag(
+        "resources",
+        await svc.data_version(),
+        user.id if user else None,
+        await fav_repo.favorites_version(user.id) if user else None,
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    try:
+        items, next_cursor = await svc.list_filtered(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     if user:
-        favorite_ids = await fav_repo.get_favorite_resource_ids(user.id)
-    return [_with_is_favorite(r, r.id, favorite_ids) for r in items]
+        favorite_ids = await fav_repo.get_favorited_among(user.id, [card.id for card in items])
+        # Cards may be shared with coalesced requests of other users: annotate copies
+        items = [card.model_copy(update={"is_favorite": card.id in favorite_ids}) for card in items]
+    return items
+
+
+@router.get("/suggest", response_model=list[ResourceSuggestion])
+@replica_reads
+async def suggest_resources(
+    q: str = Query(..., min_length=1, max_length=100, description="Title prefix typed so far"),
+    limit: int = Query(8, ge=1, le=20),
+    svc: Annotated[ResourceService, Depends(get_resource_service)] = ...,
+) -> list[ResourceSuggestion]:
+    """Autocomplete: top title completions for the typed prefix (cached per prefix)."""
+    prefix = q.strip()
+    if not prefix:
+        return []
+    return await svc.suggest(prefix, limit=limit)
+
+
+@router.get("/facets", response_model=ResourceFacets)
+@replica_reads
+async def resource_facets(
+    search: str | None = Query(None, description="Same as GET /resources"),
+    search_mode: ResourceSearchModeEnum = ResourceSearchModeEnum.fulltext,
+    team_id: UUID | None = None,
+    skill_level_id: UUID | None = None,
+    mentor_id: UUID | None = None,
+    technology_id: UUID | None = None,
+    resource_type: ResourceTypeEnum | None = None,
+    svc: Annotated[ResourceService, Depends(get_resource_service)] = ...,
+) -> ResourceFacets:
+    """
+    Filter chip counts: resources per technology, team, skill level, mentor and type. Each facet's
+    counts apply every given filter except its own; total applies them all.
+    """
+    filters = ResourceFilters(
+        search=search.strip() if search and search.strip() else None,
+        search_mode=search_mode,
+        team_id=team_id,
+        skill_level_id=skill_level_id,
+        mentor_id=mentor_id,
+        technology_id=technology_id,
+        resource_type=resource_type,
+    )
+    return await svc.facets(filters)
 
 
 @router.get("/{id}", response_model=ResourceRead)
+@replica_reads
 async def get_resource(
     id: UUID,
     svc: Annotated[ResourceService, Depends(get_resource_service)],
-    user: Annotated[User | None, Depends(get_current_user_optional)] = None,
+    user: Annotated[Principal | None, Depends(get_current_principal_optional)] = None,
     fav_repo: Annotated[FavoriteRepository, Depends(get_favorite_repo)] = ...,
     rating_repo: Annotated[RatingRepository, Depends(get_rating_repo)] = ...,
 ) -> ResourceRead:
@@ -74,15 +163,17 @@ async def get_resource(
         existing = await rating_repo.get_by_user_and_resource(user.id, id)
         if existing:
             user_rating = existing.score
-    return r.model_copy(update={"is_favorite": is_fav, "user_rating": user_rating})
+    file_url = await demo_static.versioned_url(r.file_path)
+    return r.model_copy(update={"is_favorite": is_fav, "user_rating": user_rating, "file_url": file_url})
 
 
 @router.post("", response_model=ResourceRead, status_code=status.HTTP_201_CREATED)
 async def create_resource(
     data: ResourceCreate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ResourceService, Depends(get_resource_service)],
 ) -> ResourceRead:
+    # The file's content extraction is queued once the request's transaction commits (content_changed)
     return await svc.create(user.id, data)
 
 
@@ -90,7 +181,7 @@ async def create_resource(
 async def update_resource(
     id: UUID,
     data: ResourceUpdate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ResourceService, Depends(get_resource_service)],
 ) -> ResourceRead:
     r = await svc.update(id, data)
@@ -2,27 +2,38 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
+from app.core.database import replica_reads
 from app.core.dependencies import get_resource_service
-from app.models.core import User
-from app.schemas.resource import ResourceRead
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.security import Principal
+from app.schemas.resource import ResourceCard
 from app.services import ResourceService
 
 router = APIRouter(prefix="/team-favorites", tags=["team-favorites"])
 
 
-@router.get("", response_model=list[ResourceRead])
+@router.get("", response_model=list[ResourceCard])
+@replica_reads
 async def get_team_favorites(
-    user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    user: Annotated[Principal, Depends(get_current_principal)],
     svc: Annotated[ResourceService, Depends(get_resource_service)],
     limit: int = Query(100, ge=1, le=200),
-) -> list[ResourceRead]:
-    """Resources in user's team that have at least one 5-star. Requires user.team_id."""
+    cursor: str | None = Query(None, description=f"Keyset cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+) -> list[ResourceCard]:
+    """Resources in user's team that have at least one 5-star. Requires user.team_id. Next page cursor in X-Next-Cursor."""
     if user.team_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Set team to see team favorites",
         )
-    return await svc.list_team_favorites(user.team_id, limit=limit)
+    try:
+        items, next_cursor = await svc.list_team_favorites(user.team_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
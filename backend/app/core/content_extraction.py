@@ -0,0 +1,104 @@
+"""Resource file content: resolve a resource's file_path to a local Markdown file and reduce it to searchable text."""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import STATIC_DEMO_DIR
+
+DEMO_URL_PREFIX = "/demo/"
+MARKDOWN_SUFFIXES = {".md", ".markdown"}
+
+# Session.info key: resource id -> file_path of resources whose file changed in the current transaction
+CONTENT_CHANGED = "resource_content_changed"
+
+_FENCE_RE = re.compile(r"^\s*(```|~~~)\s*([\w+#.-]*)")
+_HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_TABLE_RULE_RE = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$")
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_EMPHASIS_RE = re.compile(r"(\*{1,3}|_{1,3}|~~)(\S(?:.*?\S)?)\1")
+_LINE_PREFIX_RE = re.compile(r"^\s*(>\s*)*([-*+]\s+|\d+[.)]\s+)?")
+
+
+@dataclass(frozen=True)
+class ExtractedContent:
+    body: str
+    headings: list[str] = field(default_factory=list)
+    code_languages: list[str] = field(default_factory=list)
+
+
+def content_changed(session: AsyncSession, resource_id: UUID, file_path: str) -> None:
+    """
+    Record a created resource / changed file_path; extraction is queued once this transaction commits
+    (by app.services.content_extraction_service), so the worker's resource_contents row can't
+    reference a resources row that isn't there yet.
+    """
+    session.info.setdefault(CONTENT_CHANGED, {})[resource_id] = file_path
+
+
+def resolve_resource_file(file_path: str) -> Path | None:
+    """Local Markdown file behind a resource's file_path (/demo/<name>.md), or None if it isn't one of ours."""
+    if not file_path.startswith(DEMO_URL_PREFIX):
+        return None
+    path = (STATIC_DEMO_DIR / file_path.removeprefix(DEMO_URL_PREFIX)).resolve()
+    if not path.is_relative_to(STATIC_DEMO_DIR.resolve()) or path.suffix.lower() not in MARKDOWN_SUFFIXES:
+        return None
+    return path
+
+
+def read_file(path: Path) -> tuple[str, bytes]:
+    """(sha256 hex digest, raw bytes) of the file."""
+    data = path.read_bytes()
+    return hashlib.sha256(data).hexdigest(), data
+
+
+def _strip_inline(line: str) -> str:
+    line = _IMAGE_RE.sub(r"\1", line)
+    line = _LINK_RE.sub(r"\1", line)
+    line = _HTML_TAG_RE.sub(" ", line)
+    line = _EMPHASIS_RE.sub(r"\2", line)
+    return line.replace("`", "").replace("|", " ")
+
+
+def extract_markdown(text: str) -> ExtractedContent:
+    """
+    Plain text of a Markdown document. Code blocks are kept verbatim (so snippets are searchable);
+    headings and fenced-code languages are also returned separately.
+    """
+    lines: list[str] = []
+    headings: list[str] = []
+    languages: list[str] = []
+    fence: str | None = None
+    for raw in text.splitlines():
+        fence_match = _FENCE_RE.match(raw)
+        if fence is not None:
+            if fence_match and fence_match.group(1) == fence and not fence_match.group(2):
+                fence = None
+            else:
+                lines.append(raw)
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            language = fence_match.group(2).lower()
+            if language and language not in languages:
+                languages.append(language)
+            continue
+        if _TABLE_RULE_RE.match(raw):
+            continue
+        heading = _HEADING_RE.match(raw)
+        if heading:
+            title = _strip_inline(heading.group(1)).strip()
+            if title:
+                headings.append(title)
+                lines.append(title)
+            continue
+        line = _strip_inline(_LINE_PREFIX_RE.sub("", raw, count=1)).strip()
+        if line:
+            lines.append(line)
+    return ExtractedContent(body="\n".join(lines), headings=headings, code_languages=languages)
@@ -1,19 +1,49 @@
-"""Async SQLAlchemy 2.0 engine and session."""
+"""Async SQLAlchemy 2.0 engine and session, with optional read replicas."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Callable
+from typing import TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.db_pool import InstrumentedPool, pgbouncer_connect_args
+from app.core.security import decode_access_claims
+from app.core.shared_cache import shared_cache
 from app.models.reference import Base as RefBase
 # Import core models so all tables are registered on RefBase.metadata
 from app.models import core  # noqa: F401
 
+logger = logging.getLogger(__name__)
+
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        poolclass=InstrumentedPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=(
+            pgbouncer_connect_args()
+            if settings.db_pgbouncer
+            else {"prepared_statement_cache_size": settings.db_statement_cache_size}
+        ),
+    )
+
+
 # Same metadata: core inherits from reference Base
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-)
+engine = _create_engine(settings.database_url)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -23,14 +53,148 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+_WROTE = "wrote"
+_RECENT_WRITER_KEY = "recent_writer:{}"
+
+F = TypeVar("F", bound=Callable)
+
+
+class ReplicaSet:
+    """Round-robin over replica engines; one that fails to connect is ejected for eject_seconds."""
+
+    def __init__(self, engines: list[AsyncEngine], eject_seconds: float) -> None:
+        self.engines = engines
+        self._eject_seconds = eject_seconds
+        self._ejected_until: dict[AsyncEngine, float] = {}
+        self._next = 0
+
+    def pick(self) -> AsyncEngine | None:
+        """Next healthy replica, or None (none configured or all ejected: use the primary)."""
+        now = time.monotonic()
+        for _ in range(len(self.engines)):
+            candidate = self.engines[self._next % len(self.engines)]
+            self._next += 1
+            if self._ejected_until.get(candidate, 0.0) <= now:
+                return candidate
+        return None
+
+    def eject(self, replica: AsyncEngine) -> None:
+        logger.warning("Read replica %s:%s failed; ejected for %ss", replica.url.host, replica.url.port, self._eject_seconds)
+        self._ejected_until[replica] = time.monotonic() + self._eject_seconds
+
+
+replicas = ReplicaSet(
+    [
+        _create_engine(url.strip())
+        for url in settings.database_replica_urls.split(",")
+        if url.strip()
+    ],
+    eject_seconds=settings.replica_eject_seconds,
+)
+
+
+def all_engines() -> dict[str, AsyncEngine]:
+    """The primary and every replica, by name (pool stats, warmup, shutdown)."""
+    return {
+        "primary": engine,
+        # By position in DATABASE_REPLICA_URLS: names show up in /health/db-pool, hosts shouldn't
+        **{f"replica:{i}": replica for i, replica in enumerate(replicas.engines)},
+    }
+
+
+def pool_stats() -> dict[str, dict]:
+    return {name: each.pool.stats() for name, each in all_engines().items()}
+
+
+async def warm_pools() -> None:
+    """
+    Open db_pool_warmup_connections (at most db_pool_size) per engine at once and return them to the
+    pool. Each connect has its own timeout, so a slow one doesn't discard the others, and every
+    connection that opened is closed (checked back in) whatever happened to the rest.
+    """
+    count = min(settings.db_pool_warmup_connections, settings.db_pool_size)
+    for name, each in all_engines().items():
+        results = await asyncio.gather(
+            *(asyncio.wait_for(each.connect().start(), settings.db_pool_timeout_seconds) for _ in range(count)),
+            return_exceptions=True,
+        )
+        for connection in results:
+            if not isinstance(connection, BaseException):
+                await connection.close()
+        failed = [r for r in results if isinstance(r, BaseException)]
+        if failed:
+            logger.warning("Pool warmup for %s: %d of %d connections failed: %r", name, len(failed), count, failed[0])
+
+
+async def dispose_pools() -> None:
+    for each in all_engines().values():
+        await each.dispose()
+
+
+def reads_replica(session: AsyncSession) -> bool:
+    """Whether get_db bound this session to a replica (callers pinned to the primary must not share its results)."""
+    return session.bind is not None and session.bind is not engine
+
+
+def replica_reads(endpoint: F) -> F:
+    """Mark a read-only endpoint: its get_db session may be bound to a replica."""
+    endpoint.replica_reads = True
+    return endpoint
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_write(session: Session, flush_context) -> None:
+    session.info[_WROTE] = True
+
+
+def _caller_id(request: Request) -> str | None:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    claims = decode_access_claims(token)
+    return str(claims.id) if claims else None
+
+
+async def _read_replica(request: Request, caller_id: str | None) -> AsyncEngine | None:
+    if not replicas.engines or request.method not in ("GET", "HEAD"):
+        return None
+    if not getattr(request.scope.get("endpoint"), "replica_reads", False):
+        return None
+    if caller_id is not None and await shared_cache.get(_RECENT_WRITER_KEY.format(caller_id)) is not None:
+        return None  # read-your-writes: the replica may not have this user's latest write yet
+    return replicas.pick()
+
+
+def _is_connection_error(e: BaseException) -> bool:
+    return isinstance(e, (OSError, asyncio.TimeoutError)) or (
+        isinstance(e, DBAPIError) and (e.connection_invalidated or isinstance(e.orig, OSError))
+    )
+
+
+async def _open_read_your_writes_window(caller_id: str) -> None:
+    await shared_cache.set(_RECENT_WRITER_KEY.format(caller_id), b"1", ttl=settings.replica_read_your_writes_seconds)
+
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    caller_id = _caller_id(request)
+    replica = await _read_replica(request, caller_id)
+    unsafe = request.method not in ("GET", "HEAD")
+    if caller_id is not None and unsafe and replicas.engines:
+        # Before the handler runs: dependency exit (below) only happens after the response has been
+        # sent, so a re-fetch right after a vote could otherwise reach a lagging replica first.
+        # Opening the window for a request that then fails only costs a few primary reads.
+        await _open_read_your_writes_window(caller_id)
+    async with AsyncSessionLocal(bind=replica) if replica is not None else AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
-        except Exception:
+        except Exception as e:
             await session.rollback()
+            if replica is not None and _is_connection_error(e):
+                replicas.eject(replica)
             raise
         finally:
             await session.close()
+        # A safe request that wrote anyway (ORM flush): best effort, after the response
+        if session.info.pop(_WROTE, False) and not unsafe and caller_id is not None and replicas.engines:
+            await _open_read_your_writes_window(caller_id)
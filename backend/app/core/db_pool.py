@@ -0,0 +1,69 @@
+"""
+Connection pool telemetry: a queue pool that records how long checkouts wait for a connection
+and how many time out, next to the pool's own checked-out / overflow counts.
+"""
+
+import bisect
+import time
+from itertools import accumulate
+from uuid import uuid4
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets; the last bucket is unbounded
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool timing every checkout that has to go to the queue (i.e. not a connection
+    the request already holds): the wait for a free connection, or for opening a new one.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self.wait_total = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.wait_counts[bisect.bisect_left(WAIT_BUCKETS, waited)] += 1
+            self.wait_total += waited
+
+    def stats(self) -> dict:
+        checkouts = sum(self.wait_counts)
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(0, self.overflow()),
+            "checkouts": checkouts,
+            "checkout_timeouts": self.timeouts,
+            "wait_seconds_avg": self.wait_total / checkouts if checkouts else 0.0,
+            # Cumulative, Prometheus-style: le_X counts checkouts that waited X seconds or less
+            "wait_seconds_histogram": dict(
+                zip([*(f"le_{bound}" for bound in WAIT_BUCKETS), "le_inf"], accumulate(self.wait_counts))
+            ),
+        }
+
+
+def pgbouncer_connect_args() -> dict:
+    """
+    asyncpg settings for PgBouncer in transaction mode: no statement caches (SQLAlchemy's and
+    asyncpg's own), and unique prepared statement names, since consecutive transactions may
+    land on different server connections.
+    """
+    return {
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
@@ -7,12 +7,14 @@ from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.shared_cache import CacheBackend, shared_cache
 from app.repositories import (
     ReferenceRepository,
     UserRepository,
     ResourceRepository,
     RatingRepository,
     FavoriteRepository,
+    ImportRepository,
 )
 from app.services import (
     ReferenceService,
@@ -21,10 +23,15 @@ from app.services import (
     RatingService,
     RecommendationService,
     ProfileService,
+    ImportService,
 )
 from app.models.core import User
 
 
+async def get_cache() -> CacheBackend:
+    return shared_cache
+
+
 async def get_reference_repo(
     session: Annotated[AsyncSession, Depends(get_db)],
 ) -> ReferenceRepository:
@@ -55,6 +62,12 @@ async def get_favorite_repo(
     return FavoriteRepository(session)
 
 
+async def get_import_repo(
+    session: Annotated[AsyncSession, Depends(get_db)],
+) -> ImportRepository:
+    return ImportRepository(session)
+
+
 # Services (inject repos)
 async def get_reference_service(
     repo: Annotated[ReferenceRepository, Depends(get_reference_repo)],
@@ -98,6 +111,12 @@ async def get_profile_service(
     )
 
 
+async def get_import_service(
+    repo: Annotated[ImportRepository, Depends(get_import_repo)],
+) -> ImportService:
+    return ImportService(repo)
+
+
 # Auth: validate Telegram initData (stub — returns user by X-Telegram-User-Id for dev)
 TELEGRAM_INIT_DATA_HEADER = "X-Telegram-Init-Data"
 TELEGRAM_USER_ID_HEADER = "X-Telegram-User-Id"
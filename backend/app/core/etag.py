@@ -0,0 +1,45 @@
+"""Conditional GET: strong ETags derived from data versions, and If-None-Match handling."""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+# Clients may keep the body but must revalidate (If-None-Match) before reusing it
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag from the data versions (and caller) a response depends on, not from its body."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """True if If-None-Match already names etag (weak comparison, as RFC 9110 requires for GET)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["Vary"] = "Authorization"
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
+
+
+def json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Pre-serialized JSON body with its ETag, or 304 if the client already has it."""
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response = Response(content=body, media_type="application/json")
+    set_etag(response, etag)
+    return response
@@ -0,0 +1,39 @@
+"""Keyset (cursor) pagination: opaque cursors over (sort timestamp, id)."""
+
+import base64
+from collections.abc import Callable
+from datetime import datetime
+from typing import TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, id: UUID) -> str:
+    raw = f"{sort_value.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Inverse of encode_cursor. Raises ValueError on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_part, id_part = raw.split("|", 1)
+        return datetime.fromisoformat(sort_part), UUID(id_part)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def paginate(
+    rows: list[T], limit: int, key: Callable[[T], tuple[datetime, UUID]]
+) -> tuple[list[T], str | None]:
+    """
+    Split rows fetched with LIMIT limit + 1 into the page and the cursor of its last row.
+    next_cursor is None when there is no further page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    items = rows[:limit]
+    return items, encode_cursor(*key(items[-1]))
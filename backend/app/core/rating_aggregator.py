@@ -0,0 +1,70 @@
+"""
+Write-behind rating aggregates: in this mode a vote writes its user_data.ratings row and a
+user_data.rating_deltas journal row in one statement, without touching the resource row; a
+background flusher applies the journaled deltas every flush interval, summed per resource in one
+batched UPDATE. Votes on the same hot resource then stop queueing on its row lock.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RatingAggregator:
+    """
+    The journal is durable and shared: every worker's flusher drains it (each resource's deltas
+    are consumed under that resource's row lock, so they are applied exactly once), deltas of a
+    crashed worker are applied by the others, and exact recounts (reconcile job, bulk import)
+    drop the deltas they already include. A failed flush leaves the journal for the next one;
+    stop() flushes once more.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        # Set by the rating service: applies the journaled deltas in its own session(s) and commits
+        self.flusher: Callable[[], Awaitable[Any]] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self.flusher is None:
+            return
+        try:
+            await self.flusher()
+        except Exception:
+            logger.exception("Rating aggregate flush failed; will retry")
+
+
+def estimate_average(ratings_sum: int, ratings_count: int) -> Decimal:
+    """average_rating as the database derives it (see rating_repo.rating_average)."""
+    if ratings_count <= 0:
+        return Decimal(0)
+    return (Decimal(ratings_sum) / ratings_count).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+rating_aggregator = RatingAggregator(interval=settings.rating_write_behind_flush_ms / 1000)
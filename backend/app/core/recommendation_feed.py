@@ -0,0 +1,126 @@
+"""
+Process-level recommendation feed: the hybrid newest + most popular list is the same for every
+user, so it is built once into a snapshot (validated items + serialized JSON body) and rebuilt
+in the background, debounced, after commits that create or update resources or change ratings.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.etag import make_etag
+
+logger = logging.getLogger(__name__)
+
+_FEED_CHANGED = "recommendation_feed_changed"
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    version: int
+    items: tuple[Any, ...]  # ResourceRead, in feed order
+    body: bytes  # JSON array of items, ready to send
+    etag: str  # content-derived, so workers holding the same feed agree
+    expires_at: float
+
+
+class RecommendationFeed:
+    """
+    invalidate() bumps the version and schedules one refresh after `debounce` seconds; writes
+    landing meanwhile share it, and the previous snapshot keeps being served until it's replaced.
+    A load that started before an invalidation is not stored (the refresh retries), so a
+    concurrent load can't resurrect stale data. The TTL bounds staleness across worker processes
+    and for changes that don't invalidate (e.g. a renamed technology).
+    """
+
+    def __init__(self, ttl: float, debounce: float) -> None:
+        self._ttl = ttl
+        self._debounce = debounce
+        self._version = 0
+        self._snapshot: FeedSnapshot | None = None
+        self._refresh_task: asyncio.Task | None = None
+        # Set by the recommendation service: loads the feed in its own session and put()s it
+        self.refresher: Callable[[], Awaitable[Any]] | None = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self) -> FeedSnapshot | None:
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.expires_at < time.monotonic():
+            return None
+        return snapshot
+
+    def put(self, version: int, items: list[Any], body: bytes) -> FeedSnapshot:
+        """Snapshot of a load that started at `version`; cached only if nothing was invalidated since."""
+        snapshot = FeedSnapshot(
+            version=version,
+            items=tuple(items),
+            body=body,
+            etag=make_etag("recommendations", body),
+            expires_at=time.monotonic() + self._ttl,
+        )
+        if self._version == version:
+            self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self) -> None:
+        self._version += 1
+        if self.refresher is None or (self._refresh_task is not None and not self._refresh_task.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # no loop (scripts): the next read after the TTL reloads
+            self._snapshot = None
+            return
+        self._refresh_task = loop.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self._debounce)
+            version = self._version
+            try:
+                await self.refresher()
+            except Exception:
+                logger.exception("Recommendation feed refresh failed")
+                self._snapshot = None  # fall back to loading on the next request
+                return
+            if self._version == version:
+                return
+
+    async def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+
+recommendation_feed = RecommendationFeed(
+    ttl=settings.recommendation_feed_ttl_seconds,
+    debounce=settings.recommendation_feed_debounce_seconds,
+)
+
+
+def feed_changed(session: AsyncSession) -> None:
+    """Record that this transaction changes the feed's inputs; the feed refreshes once it commits."""
+    session.info[_FEED_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_committed(session: Session) -> None:
+    if session.info.pop(_FEED_CHANGED, False):
+        recommendation_feed.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_FEED_CHANGED, None)
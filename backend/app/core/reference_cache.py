@@ -0,0 +1,74 @@
+"""
+Process-level reference catalog cache: one versioned snapshot per reference list
+(technologies, mentors, teams, skill levels), holding the validated items and their
+serialized JSON body so list endpoints can answer without touching the database.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+from app.core.etag import make_etag
+
+TECHNOLOGIES = "technologies"
+MENTORS = "mentors"
+TEAMS = "teams"
+SKILL_LEVELS = "skill_levels"
+CATALOG_KINDS = (TECHNOLOGIES, MENTORS, TEAMS, SKILL_LEVELS)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    items: tuple[Any, ...]  # *Read schemas, in list order
+    body: bytes  # JSON array of items, ready to send
+    etag: str  # content-derived (worker-local versions aren't comparable across processes), computed once per snapshot
+    expires_at: float
+
+
+class ReferenceCatalogCache:
+    """
+    Snapshots are replaced, never mutated. Each kind has a version counter bumped by
+    invalidate(); a snapshot built from a read that started before an invalidation
+    is not stored, so a concurrent load can't resurrect stale data.
+    The TTL bounds staleness across worker processes, which don't see each other's invalidations.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._versions: dict[str, int] = dict.fromkeys(CATALOG_KINDS, 0)
+        self._snapshots: dict[str, CatalogSnapshot] = {}
+
+    def version(self, kind: str) -> int:
+        return self._versions[kind]
+
+    def get(self, kind: str) -> CatalogSnapshot | None:
+        snapshot = self._snapshots.get(kind)
+        if snapshot is None or snapshot.expires_at < time.monotonic():
+            return None
+        return snapshot
+
+    def put(self, kind: str, version: int, items: list[Any], body: bytes) -> CatalogSnapshot:
+        """Snapshot of a load that started at `version`; cached only if nothing was invalidated since."""
+        snapshot = CatalogSnapshot(
+            version=version,
+            items=tuple(items),
+            body=body,
+            etag=make_etag(kind, body),
+            expires_at=time.monotonic() + self._ttl,
+        )
+        if self._versions[kind] == version:
+            self._snapshots[kind] = snapshot
+        return snapshot
+
+    def invalidate(self, kind: str) -> None:
+        self._versions[kind] += 1
+        self._snapshots.pop(kind, None)
+
+    def clear(self) -> None:
+        for kind in CATALOG_KINDS:
+            self.invalidate(kind)
+
+
+reference_catalog = ReferenceCatalogCache(ttl=settings.reference_cache_ttl_seconds)
@@ -0,0 +1,245 @@
+"""
+In-process BM25 inverted index over resource title, description and technology name.
+
+Optional (settings.search_index_enabled): loaded at app startup. A worker's own creates and
+updates are applied when their transaction commits (index_changed); every worker also picks up
+resources changed elsewhere by a periodic catch-up and rebuild (app.services.search_index_service).
+The index only proposes candidate ids, which are always re-checked against the database.
+"""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Field weights (BM25F-style: a field's term frequency counts this many times)
+TITLE_WEIGHT = 3
+TECHNOLOGY_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+_PENDING = "search_index_pending"
+
+# A short prefix can match thousands of terms; only the first N (alphabetically) are scored
+MAX_PREFIX_EXPANSIONS = 64
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class _Postings:
+    """Posting list of one term: parallel arrays of doc numbers (ascending) and weighted term frequencies."""
+
+    __slots__ = ("docs", "freqs")
+
+    def __init__(self) -> None:
+        self.docs = array("I")
+        self.freqs = array("H")
+
+
+class SearchIndex:
+    """
+    BM25 over (weighted) title + description + technology name, with prefix matching per query word.
+    Documents are internal numbers into an id array; an update tombstones the old number and appends
+    a new one, and tombstones are compacted away once they make up a quarter of the index.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self._k1 = k1
+        self._b = b
+        self.ready = False
+        # Resources updated after this may be missing here or indexed with old text (set by the sync service)
+        self.synced_through: datetime | None = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self._postings: dict[str, _Postings] = {}
+        self._terms: list[str] = []  # sorted, for prefix lookup
+        self._ids: list[UUID | None] = []  # doc number -> resource id (None = tombstone)
+        self._lengths = array("I")  # doc number -> weighted length
+        self._doc_by_id: dict[UUID, int] = {}
+        self._total_length = 0
+        self._deleted = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_by_id)
+
+    def load(self, documents: Iterable[tuple[UUID, str, str | None, str | None]]) -> None:
+        """Replace the index contents with (id, title, description, technology name) rows, then mark it ready."""
+        self._clear()
+        for doc in documents:
+            self._add(*doc)
+        self._terms.sort()
+        self.ready = True
+
+    def swap_in(self, built: "SearchIndex") -> None:
+        """Take over the contents of an index loaded elsewhere (in a thread), in one step."""
+        self._postings = built._postings
+        self._terms = built._terms
+        self._ids = built._ids
+        self._lengths = built._lengths
+        self._doc_by_id = built._doc_by_id
+        self._total_length = built._total_length
+        self._deleted = built._deleted
+        self.ready = True
+
+    def upsert(self, id: UUID, title: str, description: str | None, technology: str | None) -> None:
+        self._remove(id)
+        self._add(id, title, description, technology, keep_sorted=True)
+        if self._deleted * 4 > len(self._ids):
+            self._compact()
+
+    def remove(self, id: UUID) -> None:
+        self._remove(id)
+
+    def search(self, query: str, limit: int) -> list[tuple[UUID, float]]:
+        """
+        Top `limit` (id, score) by BM25, best first. Every query word is a prefix; all words must match.
+        Words are processed rarest first so later posting lists only update surviving candidates.
+        """
+        words = sorted(set(tokenize(query)), key=self._word_frequency)
+        if not words or not self._doc_by_id:
+            return []
+        n_docs = len(self._doc_by_id)
+        avg_length = self._total_length / n_docs
+        k1, b = self._k1, self._b
+        # BM25 length normalisation k1 * (1 - b + b * len / avg_len) = norm_base + norm_slope * len
+        norm_base = k1 * (1 - b)
+        norm_slope = k1 * b / avg_length
+        lengths = self._lengths
+        scores: dict[int, float] | None = None
+        for word in words:
+            word_scores: dict[int, float] = {}
+            for term in self._expand(word):
+                postings = self._postings[term]
+                df = len(postings.docs)
+                scale = math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) * (k1 + 1)
+                get = word_scores.get
+                for doc, tf in zip(postings.docs, postings.freqs):
+                    if scores is None or doc in scores:
+                        word_scores[doc] = get(doc, 0.0) + scale * tf / (tf + norm_base + norm_slope * lengths[doc])
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {doc: scores[doc] + s for doc, s in word_scores.items()}
+            if not scores:
+                return []
+        ids = self._ids
+        ranked = heapq.nlargest(
+            limit,
+            ((doc, s) for doc, s in scores.items() if ids[doc] is not None),
+            key=lambda ds: ds[1],
+        )
+        return [(ids[doc], s) for doc, s in ranked]
+
+    def _expand(self, prefix: str) -> list[str]:
+        terms = self._terms
+        start = bisect_left(terms, prefix)
+        end = start
+        while end < len(terms) and end - start < MAX_PREFIX_EXPANSIONS and terms[end].startswith(prefix):
+            end += 1
+        return terms[start:end]
+
+    def _word_frequency(self, word: str) -> int:
+        return sum(len(self._postings[t].docs) for t in self._expand(word))
+
+    def _add(
+        self,
+        id: UUID,
+        title: str,
+        description: str | None,
+        technology: str | None,
+        keep_sorted: bool = False,
+    ) -> None:
+        freqs: dict[str, int] = {}
+        for tokens, weight in (
+            (tokenize(title), TITLE_WEIGHT),
+            (tokenize(technology), TECHNOLOGY_WEIGHT),
+            (tokenize(description), DESCRIPTION_WEIGHT),
+        ):
+            for t in tokens:
+                freqs[t] = freqs.get(t, 0) + weight
+        doc = len(self._ids)
+        self._ids.append(id)
+        length = sum(freqs.values())
+        self._lengths.append(length)
+        self._total_length += length
+        self._doc_by_id[id] = doc
+        for term, tf in freqs.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+                if keep_sorted:
+                    self._terms.insert(bisect_left(self._terms, term), term)
+                else:
+                    self._terms.append(term)
+            postings.docs.append(doc)
+            postings.freqs.append(min(tf, 0xFFFF))
+
+    def _remove(self, id: UUID) -> None:
+        doc = self._doc_by_id.pop(id, None)
+        if doc is None:
+            return
+        self._ids[doc] = None
+        self._total_length -= self._lengths[doc]
+        self._deleted += 1
+
+    def _compact(self) -> None:
+        """Drop tombstoned documents and renumber the rest (posting lists stay ascending)."""
+        renumber = array("i", [-1]) * len(self._ids)
+        ids: list[UUID | None] = []
+        lengths = array("I")
+        for doc, id in enumerate(self._ids):
+            if id is not None:
+                renumber[doc] = len(ids)
+                ids.append(id)
+                lengths.append(self._lengths[doc])
+        for term in list(self._postings):
+            old = self._postings[term]
+            new = _Postings()
+            for doc, tf in zip(old.docs, old.freqs):
+                if renumber[doc] >= 0:
+                    new.docs.append(renumber[doc])
+                    new.freqs.append(tf)
+            if new.docs:
+                self._postings[term] = new
+            else:
+                del self._postings[term]
+        self._terms = sorted(self._postings)
+        self._ids = ids
+        self._lengths = lengths
+        self._doc_by_id = {id: doc for doc, id in enumerate(ids)}
+        self._deleted = 0
+
+
+search_index = SearchIndex()
+
+
+def index_changed(
+    session: AsyncSession, id: UUID, title: str, description: str | None, technology: str | None
+) -> None:
+    """Record a created / updated resource document; it is indexed once this transaction commits."""
+    session.info.setdefault(_PENDING, {})[id] = (title, description, technology)
+
+
+@event.listens_for(Session, "after_commit")
+def _index_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if pending and search_index.ready:
+        for id, document in pending.items():
+            search_index.upsert(id, *document)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -2,8 +2,10 @@
 Security: Telegram Login Widget validation and JWT (create/decode).
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from typing import Any
+from uuid import UUID
 from jose import JWTError, jwt
 
 from app.core.config import settings
@@ -18,8 +20,30 @@ def validate_telegram_hash(payload: dict[str, Any], bot_token: str) -> bool:
     return validate_telegram_login_hash(payload, bot_token)
 
 
-def create_access_token(user_id: str) -> str:
-    """Issue a JWT access token for the given user id (sub claim)."""
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated caller as carried by the access token: id, team and skill level,
+    for handlers that don't need the full User row.
+    """
+
+    id: UUID
+    team_id: UUID | None = None
+    skill_level_id: UUID | None = None
+    user_version: int | None = None  # None: token without embedded claims
+
+
+def create_access_token(
+    user_id: str,
+    *,
+    team_id: UUID | None = None,
+    skill_level_id: UUID | None = None,
+    user_version: int | None = None,
+) -> str:
+    """
+    Issue a JWT access token for the given user id (sub claim).
+    With a user_version (and settings.jwt_embed_user_claims), team / skill level are embedded too.
+    """
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.access_token_expire_minutes
     )
@@ -28,6 +52,12 @@ def create_access_token(user_id: str) -> str:
         "exp": expire,
         "iat": datetime.now(timezone.utc),
     }
+    if settings.jwt_embed_user_claims and user_version is not None:
+        to_encode.update(
+            team_id=str(team_id) if team_id else None,
+            skill_level_id=str(skill_level_id) if skill_level_id else None,
+            user_version=user_version,
+        )
     return jwt.encode(
         to_encode,
         settings.secret_key,
@@ -52,3 +82,30 @@ def decode_access_token(token: str) -> str | None:
         return str(sub)
     except JWTError:
         return None
+
+
+def decode_access_claims(token: str) -> Principal | None:
+    """
+    Decode JWT into a Principal if valid and not expired. Tokens issued without
+    embedded claims give a Principal with only id set (user_version None).
+    Returns None if invalid or expired.
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            settings.secret_key,
+            algorithms=["HS256"],
+        )
+        user_id = UUID(str(payload["sub"]))
+        if "user_version" not in payload:
+            return Principal(id=user_id)
+        team_id = payload.get("team_id")
+        skill_level_id = payload.get("skill_level_id")
+        return Principal(
+            id=user_id,
+            team_id=UUID(team_id) if team_id else None,
+            skill_level_id=UUID(skill_level_id) if skill_level_id else None,
+            user_version=int(payload["user_version"]),
+        )
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,319 @@
+"""
+Shared cache: one async key/value interface (bytes values, TTLs, tags, atomic increments)
+with an in-process LRU backend and a Redis-protocol (RESP) backend, so caches that must
+agree across uvicorn workers can live in one store. Pick the backend with settings.cache_backend.
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from urllib.parse import unquote, urlparse
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheError(Exception):
+    """The cache server could not be reached or rejected a command."""
+
+
+class CacheBackend(ABC):
+    """
+    Values are bytes (callers serialize). ttl is in seconds (None: no expiry).
+    Tags group keys for invalidate_tags(). get/set/delete/invalidate_tags treat an unreachable
+    server as a miss / no-op; incr raises CacheError, since a counter can't be faked.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float | None = None, tags: Iterable[str] = ()) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> int: ...
+
+    @abstractmethod
+    async def incr(self, key: str, amount: int = 1, ttl: float | None = None) -> int:
+        """Atomically add amount to an integer value (missing = 0); ttl applies when the key is created."""
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key set with any of tags. Returns the number of keys deleted."""
+
+    async def close(self) -> None:
+        pass
+
+
+class LocalCache(CacheBackend):
+    """In-process LRU with per-entry TTL. Not shared between workers."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float | None, bytes, frozenset[str]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _live(self, key: str) -> tuple[float | None, bytes, frozenset[str]] | None:
+        entry = self._data.get(key)
+        if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+            self._remove(key)
+            return None
+        return entry
+
+    def _remove(self, key: str) -> bool:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return True
+
+    def _store(self, key: str, value: bytes, expires_at: float | None, tags: frozenset[str]) -> None:
+        self._remove(key)
+        self._data[key] = (expires_at, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._data) > self._maxsize:
+            self._remove(next(iter(self._data)))
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._live(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None, tags: Iterable[str] = ()) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._store(key, value, expires_at, frozenset(tags))
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self._remove(key) for key in keys)
+
+    async def incr(self, key: str, amount: int = 1, ttl: float | None = None) -> int:
+        entry = self._live(key)
+        if entry is None:
+            value, expires_at, tags = amount, (time.monotonic() + ttl if ttl is not None else None), frozenset()
+        else:
+            try:
+                value = int(entry[1]) + amount
+            except ValueError:
+                raise CacheError(f"Value of {key!r} is not an integer") from None
+            expires_at, tags = entry[0], entry[2]
+        self._store(key, str(value).encode(), expires_at, tags)
+        return value
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+        return sum(self._remove(key) for key in keys)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _RespConnection:
+    """One connection speaking RESP2: commands are sent as bulk-string arrays, pipelined."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @staticmethod
+    def _encode(command: tuple) -> bytes:
+        parts = [b"*%d\r\n" % len(command)]
+        for arg in command:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def _read_reply(self):
+        line = await self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by cache server")
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode()
+        if prefix == b"-":
+            return CacheError(payload.decode())
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            return None if length < 0 else (await self._reader.readexactly(length + 2))[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            return None if length < 0 else [await self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected RESP reply {line[:20]!r}")
+
+    async def execute(self, *commands: tuple) -> list:
+        """Send commands in one write and read their replies in order; error replies raise after all are read."""
+        self._writer.write(b"".join(self._encode(command) for command in commands))
+        await self._writer.drain()
+        replies = [await self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, CacheError):
+                raise reply
+        return replies
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis-protocol backend (any RESP2 server: Redis, Valkey, KeyDB, a local stand-in).
+    Keys are namespaced with prefix; a tag is a set of the keys stored with it.
+    Connections are pooled (up to max_connections) and opened lazily.
+    """
+
+    def __init__(self, url: str, *, prefix: str = "", max_connections: int = 10, timeout: float = 1.0) -> None:
+        parsed = urlparse(url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._prefix = prefix
+        self._timeout = timeout
+        self._idle: list[_RespConnection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self._failing = False  # a failure was logged and no command has succeeded since
+
+    async def _connect(self) -> _RespConnection:
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        conn = _RespConnection(reader, writer)
+        setup = []
+        if self._password is not None:
+            setup.append(("AUTH", self._password))
+        if self._db:
+            setup.append(("SELECT", self._db))
+        if setup:
+            await conn.execute(*setup)
+        return conn
+
+    async def _execute(self, *commands: tuple) -> list:
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else None
+            try:
+                if conn is None:
+                    conn = await asyncio.wait_for(self._connect(), self._timeout)
+                replies = await asyncio.wait_for(conn.execute(*commands), self._timeout)
+            except CacheError:
+                if conn is not None:  # error reply: the connection itself is still in sync
+                    self._idle.append(conn)
+                raise
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError) as e:
+                if conn is not None:
+                    conn.close()
+                raise CacheError(f"Cache server unavailable: {e!r}") from e
+            except BaseException:  # cancelled mid-command: replies may still be in flight
+                if conn is not None:
+                    conn.close()
+                raise
+            self._idle.append(conn)
+            if self._failing:
+                self._failing = False
+                logger.info("Cache server commands succeed again")
+            return replies
+
+    def _log_failure(self, action: str, target) -> None:
+        """Log (from an except block) the first failure of an outage; the rest are logged at DEBUG."""
+        if self._failing:
+            logger.debug("Cache %s failed for %s", action, target, exc_info=True)
+            return
+        self._failing = True
+        logger.warning(
+            "Cache %s failed for %s; further failures are logged at DEBUG until a command succeeds",
+            action, target, exc_info=True,
+        )
+
+    def _key(self, key: str) -> str:
+        return self._prefix + key
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}tag:{tag}"
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            (value,) = await self._execute(("GET", self._key(key)))
+        except CacheError:
+            self._log_failure("get", key)
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None, tags: Iterable[str] = ()) -> None:
+        full_key = self._key(key)
+        command = ("SET", full_key, value) + (("PX", max(1, int(ttl * 1000))) if ttl is not None else ())
+        # Tag sets don't expire: a shorter-lived member must not cut short the tag of longer-lived ones
+        commands = [command, *(("SADD", self._tag_key(tag), full_key) for tag in tags)]
+        try:
+            await self._execute(*commands)
+        except CacheError:
+            self._log_failure("set", key)
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        try:
+            (deleted,) = await self._execute(("DEL", *(self._key(key) for key in keys)))
+        except CacheError:
+            self._log_failure("delete", keys)
+            return 0
+        return deleted
+
+    async def incr(self, key: str, amount: int = 1, ttl: float | None = None) -> int:
+        full_key = self._key(key)
+        if ttl is None:
+            (value,) = await self._execute(("INCRBY", full_key, amount))
+            return value
+        # One transaction: create the key at 0 with its TTL if missing, then add (no window without a TTL)
+        *_, (_, value) = await self._execute(
+            ("MULTI",),
+            ("SET", full_key, 0, "PX", max(1, int(ttl * 1000)), "NX"),
+            ("INCRBY", full_key, amount),
+            ("EXEC",),
+        )
+        if isinstance(value, CacheError):
+            raise value
+        return value
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        if not tags:
+            return 0
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        try:
+            members = await self._execute(*(("SMEMBERS", tag_key) for tag_key in tag_keys))
+            keys = set().union(*members)
+            replies = await self._execute(("DEL", *keys, *tag_keys))
+        except CacheError:
+            self._log_failure("tag invalidation", tags)
+            return 0
+        return max(0, replies[0] - sum(1 for m in members if m))
+
+    async def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+def create_cache() -> CacheBackend:
+    if settings.cache_backend == "redis":
+        return RedisCache(
+            settings.cache_redis_url,
+            prefix=settings.cache_key_prefix,
+            max_connections=settings.cache_redis_max_connections,
+        )
+    return LocalCache(maxsize=settings.cache_local_max_entries)
+
+
+shared_cache = create_cache()
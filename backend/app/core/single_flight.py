@@ -0,0 +1,60 @@
+"""
+Single-flight request coalescing: concurrent calls with the same key share one in-flight
+computation instead of each running the same queries (cold caches after a broadcast).
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    The first caller for a key (the leader) runs fn in its own request context (its DB session);
+    callers arriving while it runs await the same result or exception. Results must be detached
+    values (schemas, not ORM objects). Nothing is cached once the computation finishes.
+    If the leader is cancelled (client went away), waiting callers retry and one of them leads.
+    Not shared between worker processes.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._in_flight: dict[K, asyncio.Task[V]] = {}
+        self.executed = 0
+        self.coalesced = 0
+        _registry.append(self)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        while True:
+            task = self._in_flight.get(key)
+            if task is None:
+                self.executed += 1
+                task = asyncio.ensure_future(fn())
+                self._in_flight[key] = task
+                task.add_done_callback(lambda t: self._forget(key, t))
+                return await task  # cancelling the leader cancels the computation
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if task.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def stats(self) -> dict[str, int]:
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._in_flight)}
+
+
+_registry: list[SingleFlight] = []
+
+
+def single_flight_stats() -> dict[str, dict[str, int]]:
+    """Counters of every SingleFlight in this process, by name."""
+    return {flight.name: flight.stats() for flight in _registry}
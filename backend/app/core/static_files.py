@@ -0,0 +1,195 @@
+"""
+/demo static files: gzip / brotli variants precompressed into a content-hash-keyed disk cache,
+Accept-Encoding negotiation, immutable caching for content-addressed URLs (?v=<hash>)
+and byte ranges on the identity representation.
+"""
+
+import gzip
+import hashlib
+import os
+import stat
+import threading
+import uuid
+from mimetypes import guess_type
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.core.config import STATIC_CACHE_DIR, STATIC_DEMO_DIR
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip variants are produced
+    brotli = None
+
+VERSION_PARAM = "v"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+COMPRESSIBLE_SUFFIXES = {".md", ".markdown", ".txt", ".json", ".yaml", ".yml", ".svg", ".html", ".css", ".js"}
+MIN_COMPRESS_SIZE = 1024  # below this the encoding overhead isn't worth it
+
+_ENCODERS = {"gzip": (".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))}
+if brotli is not None:
+    _ENCODERS = {"br": (".br", lambda data: brotli.compress(data, quality=11)), **_ENCODERS}
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Content codings the client accepts (q > 0)."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles whose compressible files are served from precompressed variants.
+    Variants live in cache_dir as <sha256 prefix>.<gz|br>, so an edited file gets new
+    variants and a new ETag; they are built on first access or by precompress_all().
+    Range requests are answered from the identity file, so offsets stay meaningful.
+    """
+
+    def __init__(self, *, directory: Path, cache_dir: Path) -> None:
+        super().__init__(directory=directory, check_dir=False)
+        self._cache_dir = cache_dir
+        self._digests: dict[str, tuple[int, int, str]] = {}  # path -> (mtime_ns, size, digest)
+        self._incompressible: set[str] = set()  # digest.encoding variants that weren't smaller
+
+    def _digest(self, full_path: str, stat_result: os.stat_result) -> str:
+        cached = self._digests.get(full_path)
+        if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+            return cached[2]
+        hasher = hashlib.sha256()
+        with open(full_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()[:32]
+        self._digests[full_path] = (stat_result.st_mtime_ns, stat_result.st_size, digest)
+        return digest
+
+    def _variant(self, full_path: str, digest: str, encoding: str) -> tuple[Path, os.stat_result] | None:
+        """Compressed variant on disk (built if missing), or None if compression doesn't shrink the file."""
+        if f"{digest}.{encoding}" in self._incompressible:
+            return None
+        suffix, encode = _ENCODERS[encoding]
+        path = self._cache_dir / f"{digest}{suffix}"
+        try:
+            return path, path.stat()
+        except FileNotFoundError:
+            pass
+        data = Path(full_path).read_bytes()
+        compressed = encode(data)
+        if len(compressed) >= len(data):
+            self._incompressible.add(f"{digest}.{encoding}")
+            return None
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, path)
+        return path, path.stat()
+
+    @staticmethod
+    def _compressible(full_path: str, stat_result: os.stat_result) -> bool:
+        return stat_result.st_size >= MIN_COMPRESS_SIZE and Path(full_path).suffix.lower() in COMPRESSIBLE_SUFFIXES
+
+    def _select(
+        self, full_path: str, stat_result: os.stat_result, request_headers: Headers
+    ) -> tuple[str, str | None, Path | None, os.stat_result | None]:
+        """(digest, encoding, variant path, variant stat) for the request; encoding None means identity."""
+        digest = self._digest(full_path, stat_result)
+        if "range" in request_headers or not self._compressible(full_path, stat_result):
+            return digest, None, None, None
+        accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+        for encoding in _ENCODERS:
+            if encoding in accepted:
+                variant = self._variant(full_path, digest, encoding)
+                if variant is not None:
+                    return digest, encoding, *variant
+        return digest, None, None, None
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] in ("GET", "HEAD"):
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+            except (OSError, ValueError):
+                stat_result = None  # let StaticFiles produce the matching error response
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                return await self._file_response(full_path, stat_result, scope)
+        return await super().get_response(path, scope)
+
+    async def _file_response(self, full_path: str, stat_result: os.stat_result, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        digest, encoding, variant_path, variant_stat = await anyio.to_thread.run_sync(
+            self._select, full_path, stat_result, request_headers
+        )
+        version = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(VERSION_PARAM, [None])[0]
+        headers = {
+            "etag": f'"{digest}-{encoding}"' if encoding else f'"{digest}"',
+            "cache-control": IMMUTABLE_CACHE_CONTROL if version == digest else REVALIDATE_CACHE_CONTROL,
+        }
+        if self._compressible(full_path, stat_result):
+            headers["vary"] = "Accept-Encoding"
+        if encoding:
+            headers["content-encoding"] = encoding
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+        return FileResponse(
+            variant_path or full_path,
+            headers=headers,
+            media_type=guess_type(full_path)[0] or "application/octet-stream",
+            stat_result=variant_stat or stat_result,
+        )
+
+    async def versioned_url(self, url_path: str, mount_path: str = "/demo") -> str | None:
+        """url_path (e.g. /demo/x.md) with ?v=<content hash>, which is served with immutable caching."""
+        if not url_path.startswith(mount_path + "/"):
+            return None
+        try:
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, url_path.removeprefix(mount_path + "/")
+            )
+        except (OSError, ValueError):
+            return None
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+        digest = await anyio.to_thread.run_sync(self._digest, full_path, stat_result)
+        return f"{url_path}?{VERSION_PARAM}={digest}"
+
+    def precompress_all(self, stop: threading.Event | None = None) -> int:
+        """
+        Build every missing variant for the directory (blocking; run in a thread), or until stop is set.
+        Returns files visited.
+        """
+        visited = 0
+        for directory in self.all_directories:
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    if stop is not None and stop.is_set():
+                        return visited
+                    full_path = os.path.join(root, name)
+                    stat_result = os.stat(full_path)
+                    if not self._compressible(full_path, stat_result):
+                        continue
+                    digest = self._digest(full_path, stat_result)
+                    for encoding in _ENCODERS:
+                        self._variant(full_path, digest, encoding)
+                    visited += 1
+        return visited
+
+
+demo_static = PrecompressedStaticFiles(directory=STATIC_DEMO_DIR, cache_dir=STATIC_CACHE_DIR)
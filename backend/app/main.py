@@ -1,25 +1,66 @@
 """TechVault API — FastAPI app, CORS, health check."""
 
-from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
-from app.core.config import settings
-from app.api import health, auth, resources, ratings, recommendations, team_favorites, profile, favorites
-from app.api.deps import get_current_user
+from app.core.config import STATIC_DEMO_DIR, settings
+from app.core.database import dispose_pools, warm_pools
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.rating_aggregator import rating_aggregator
+from app.core.recommendation_feed import recommendation_feed
+from app.core.shared_cache import shared_cache
+from app.core.static_files import demo_static
+from app.services.content_extraction_service import content_extraction
+from app.services.search_index_service import search_index_sync
+from app.api import health, auth, resources, ratings, recommendations, team_favorites, profile, favorites, imports
+from app.api.deps import get_current_principal, get_current_user
 from app.api.endpoints import auth as auth_endpoints, mentors, technologies, teams, skill_levels
 
+import asyncio
+import logging
 import os
 import json
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def _log_precompress_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Precompressing /demo static files failed", exc_info=task.exception())
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await warm_pools()
+    if settings.search_index_enabled:
+        await search_index_sync.load()
+        search_index_sync.start()
+    backfill = None
+    if settings.content_extraction_enabled:
+        content_extraction.start()
+        backfill = asyncio.create_task(content_extraction.backfill())
+    if settings.rating_write_behind_enabled:
+        rating_aggregator.start()
+    precompress = None
+    stop_precompress = threading.Event()
+    if settings.static_precompress_on_startup:
+        precompress = asyncio.create_task(asyncio.to_thread(demo_static.precompress_all, stop_precompress))
+        precompress.add_done_callback(_log_precompress_failure)
     yield
-    # shutdown: close pool etc. if needed
+    # shutdown
+    if backfill is not None:
+        backfill.cancel()
+    stop_precompress.set()  # a thread can't be cancelled: it returns after the file in progress
+    await asyncio.gather(*(task for task in (backfill, precompress) if task is not None), return_exceptions=True)
+    await search_index_sync.stop()
+    await content_extraction.stop()
+    await rating_aggregator.stop()  # final flush, before the feed and pools shut down
+    await recommendation_feed.stop()
+    await shared_cache.close()
+    await dispose_pools()
 
 
 app = FastAPI(
@@ -44,6 +85,7 @@ app.add_middleware(
     allow_origins=origins,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 # Public (no JWT required)
@@ -59,23 +101,24 @@ app.include_router(skill_levels.router, prefix="/api")  # GET list/id public
 app.include_router(resources.router, prefix="/api")
 app.include_router(favorites.router, prefix="/api")
 app.include_router(
-    ratings.router, prefix="/api", dependencies=[Depends(get_current_user)]
+    ratings.router, prefix="/api", dependencies=[Depends(get_current_principal)]
 )
 app.include_router(
-    recommendations.router, prefix="/api", dependencies=[Depends(get_current_user)]
+    recommendations.router, prefix="/api", dependencies=[Depends(get_current_principal)]
 )
 app.include_router(
-    team_favorites.router, prefix="/api", dependencies=[Depends(get_current_user)]
+    team_favorites.router, prefix="/api", dependencies=[Depends(get_current_principal)]
 )
 app.include_router(
     profile.router, prefix="/api", dependencies=[Depends(get_current_user)]
 )
+app.include_router(
+    imports.router, prefix="/api", dependencies=[Depends(get_current_principal)]
+)
 
 # Serve static demo files from backend/static/demo at /demo (works locally and in Docker)
-_base_dir = Path(__file__).resolve().parent.parent
-_static_demo_dir = _base_dir / "static" / "demo"
-_static_demo_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/demo", StaticFiles(directory=str(_static_demo_dir)), name="demo")
+STATIC_DEMO_DIR.mkdir(parents=True, exist_ok=True)
+app.mount("/demo", demo_static, name="demo")
 
 
 @app.get("/")
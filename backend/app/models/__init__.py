@@ -1,7 +1,7 @@
 """SQLAlchemy 2.0 models (reference + core schemas)."""
 
 from app.models.reference import Technology, Mentor, Team, SkillLevel
-from app.models.core import User, Resource, Rating, Favorite
+from app.models.core import User, Resource, ResourceCardRow, ResourceContent, Rating, RatingDelta, Favorite, DataVersion
 
 __all__ = [
     "Technology",
@@ -10,6 +10,10 @@ __all__ = [
     "SkillLevel",
     "User",
     "Resource",
+    "ResourceCardRow",
+    "ResourceContent",
     "Rating",
+    "RatingDelta",
     "Favorite",
+    "DataVersion",
 ]
@@ -9,8 +9,8 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import uuid4
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Integer, BigInteger, Numeric, Enum as SQLEnum, PrimaryKeyConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, DateTime, ForeignKey, Text, Integer, BigInteger, SmallInteger, Boolean, Float, Numeric, Enum as SQLEnum, PrimaryKeyConstraint, UniqueConstraint, Computed, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR, ARRAY
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from app.models.reference import Base as RefBase
@@ -26,6 +26,19 @@ class ResourceType(str, enum.Enum):
     SNIPPET = "snippet"
 
 
+# Text search configuration used for the generated search_vector and for queries against it
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+# Extracted file content: headings rank like the description, body text below both
+CONTENT_SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', headings), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', body), 'C')"
+)
+
+
 class Base(RefBase):
     """Inherit same Base so FK to reference schema works."""
     __abstract__ = True
@@ -56,6 +69,8 @@ class User(Base):
         nullable=True,
         index=True,
     )
+    # Bumped when a JWT-embedded claim (team_id, skill_level_id) changes; see app.core.security.Principal
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
@@ -74,7 +89,84 @@ class Resource(Base):
     """Docs / Blueprints / Snippets. Was: uploaded_files."""
 
     __tablename__ = "resources"
-    __table_args__ = {"schema": "user_data"}
+    __table_args__ = (
+        Index(
+            "ix_user_data_resources_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        # pg_trgm: fuzzy search (word_similarity) and title autocomplete (ILIKE 'q%')
+        Index(
+            "ix_user_data_resources_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_user_data_resources_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        # Keyset pagination: ORDER BY created_at DESC, id DESC / team favorites by updated_at
+        Index(
+            "ix_user_data_resources_created_at_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resources_team_updated_at_id",
+            "team_id",
+            text("updated_at DESC"),
+            text("id DESC"),
+        ),
+        # Vault filters: one equality filter + newest first (these replace the single-column filter indexes)
+        Index(
+            "ix_user_data_resources_technology_id_created_at_id",
+            "technology_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resources_team_id_created_at_id",
+            "team_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resources_skill_level_id_created_at_id",
+            "skill_level_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resources_mentor_id_created_at_id",
+            "mentor_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resources_resource_type_created_at_id",
+            "resource_type",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Most popular (recommendations, top by skill level): only rated resources, best first
+        Index(
+            "ix_user_data_resources_popular",
+            text("popularity_score DESC"),
+            text("id DESC"),
+            postgresql_where=text("ratings_count > 0"),
+        ),
+        Index(
+            "ix_user_data_resources_skill_level_popular",
+            "skill_level_id",
+            text("popularity_score DESC"),
+            text("id DESC"),
+            postgresql_where=text("ratings_count > 0"),
+        ),
+        {"schema": "user_data"},
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -91,43 +183,51 @@ class Resource(Base):
         SQLEnum(ResourceType),
         nullable=False,
         default=ResourceType.DOC,
-        index=True,
     )
     technology_id: Mapped[UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("reference.technologies.id"),
         nullable=True,
-        index=True,
     )
     mentor_id: Mapped[UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("reference.mentors.id"),
         nullable=True,
-        index=True,
     )
     team_id: Mapped[UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("reference.teams.id"),
         nullable=True,
-        index=True,
     )
     skill_level_id: Mapped[UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("reference.skill_levels.id"),
         nullable=True,
-        index=True,
     )
     average_rating: Mapped[Decimal] = mapped_column(
         Numeric(3, 2), nullable=False, default=Decimal("0.00")
     )
     ratings_count: Mapped[int] = mapped_column(
         Integer, nullable=False, default=0)
+    # Sum of scores: votes apply (sum, count) deltas and average_rating is derived from them
+    ratings_sum: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0")
+    # Ranking score maintained with the aggregates (rating_repo.popularity_score)
+    popularity_score: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
     )
     meta: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Full-text search document, maintained by Postgres (title weighted above description)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True,
+        deferred=True,
+    )
 
     uploader: Mapped["User"] = relationship("User", back_populates="resources")
     technology: Mapped["Technology | None"] = relationship(
@@ -148,12 +248,130 @@ class Resource(Base):
         "Favorite", back_populates="resource")
 
 
+class ResourceCardRow(Base):
+    """
+    Denormalized list read model: one row per resource with reference names (mentor name pre-split).
+    Maintained by Postgres triggers on resources / technologies / skill_levels / mentors
+    (migration add_resource_cards); never written by the app.
+    """
+
+    __tablename__ = "resource_cards"
+    __table_args__ = (
+        # Same query shapes as the listing indexes on resources (keyset order, one filter + newest first)
+        Index(
+            "ix_user_data_resource_cards_created_at_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resource_cards_team_updated_at_id",
+            "team_id",
+            text("updated_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resource_cards_technology_id_created_at_id",
+            "technology_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resource_cards_team_id_created_at_id",
+            "team_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resource_cards_skill_level_id_created_at_id",
+            "skill_level_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resource_cards_mentor_id_created_at_id",
+            "mentor_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_user_data_resource_cards_resource_type_created_at_id",
+            "resource_type",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        {"schema": "user_data"},
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("user_data.resources.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    title: Mapped[str] = mapped_column(String(512), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    resource_type: Mapped[ResourceType] = mapped_column(SQLEnum(ResourceType), nullable=False)
+    technology_id: Mapped[UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    technology_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    skill_level_id: Mapped[UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    skill_level_name: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    mentor_id: Mapped[UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    mentor_first_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    mentor_last_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    team_id: Mapped[UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    average_rating: Mapped[Decimal] = mapped_column(Numeric(3, 2), nullable=False)
+    ratings_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class ResourceContent(Base):
+    """Searchable text extracted from a resource's Markdown file. Re-extracted only when content_hash changes."""
+
+    __tablename__ = "resource_contents"
+    __table_args__ = (
+        Index(
+            "ix_user_data_resource_contents_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        {"schema": "user_data"},
+    )
+
+    resource_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("user_data.resources.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # sha256 of the file
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    headings: Mapped[str] = mapped_column(Text, nullable=False, default="")  # one per line
+    code_languages: Mapped[list[str]] = mapped_column(
+        ARRAY(String(32)), nullable=False, default=list
+    )
+    extracted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(CONTENT_SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True,
+        deferred=True,
+    )
+
+
 class Favorite(Base):
     """User favorites (likes). Composite PK (user_id, resource_id)."""
 
     __tablename__ = "favorites"
     __table_args__ = (
         PrimaryKeyConstraint("user_id", "resource_id"),
+        # Keyset pagination of a user's favorites (newest first)
+        Index(
+            "ix_user_data_favorites_user_created_at_resource",
+            "user_id",
+            text("created_at DESC"),
+            text("resource_id DESC"),
+        ),
         {"schema": "user_data"},
     )
 
@@ -181,7 +399,17 @@ class Rating(Base):
     """5-star ratings. Was: file_ratings. No deletion allowed per TZ."""
 
     __tablename__ = "ratings"
-    __table_args__ = {"schema": "user_data"}
+    __table_args__ = (
+        # One rating per user and resource; the conflict target of RatingRepository.upsert_rating
+        UniqueConstraint("user_id", "resource_id", name="uq_user_data_ratings_user_resource"),
+        # Team favorites: resource ids with a 5-star
+        Index(
+            "ix_user_data_ratings_five_star_resource_id",
+            "resource_id",
+            postgresql_where=text("score = 5"),
+        ),
+        {"schema": "user_data"},
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -205,3 +433,49 @@ class Rating(Base):
     user: Mapped["User"] = relationship("User", back_populates="ratings")
     resource: Mapped["Resource"] = relationship(
         "Resource", back_populates="ratings")
+
+
+class RatingDelta(Base):
+    """
+    Write-behind rating aggregates (app.core.rating_aggregator): one row per vote whose effect on
+    its resource's ratings_sum / ratings_count is not applied yet. Flushes and recounts consume
+    the rows of a resource while holding its row lock.
+    """
+
+    __tablename__ = "rating_deltas"
+    __table_args__ = {"schema": "user_data"}
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    resource_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("user_data.resources.id"),
+        nullable=False,
+        index=True,
+    )
+    score_delta: Mapped[int] = mapped_column(Integer, nullable=False)
+    count_delta: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Delta unknown (lost a race with a concurrent first vote): recount the resource exactly
+    recount: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="false")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("now()")
+    )
+
+
+# DataVersion.name of the counter bumped by any write to resources, resource_contents or resource_cards
+RESOURCES_DATA_VERSION = "resources"
+
+
+class DataVersion(Base):
+    """
+    Per-table change counters, bumped by row-level triggers in the writing transaction.
+    List ETags are derived from them instead of from the rendered body. Each counter is split
+    into shards (picked by hashtext of the resource id) so concurrent writes to different
+    resources don't queue on one row; its value is the sum over its shards.
+    """
+
+    __tablename__ = "data_versions"
+    __table_args__ = {"schema": "user_data"}
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0, server_default="0")
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
@@ -3,13 +3,17 @@
 from app.repositories.reference_repo import ReferenceRepository
 from app.repositories.user_repo import UserRepository
 from app.repositories.resource_repo import ResourceRepository
+from app.repositories.resource_content_repo import ResourceContentRepository
 from app.repositories.rating_repo import RatingRepository
 from app.repositories.favorite_repo import FavoriteRepository
+from app.repositories.import_repo import ImportRepository
 
 __all__ = [
     "ReferenceRepository",
     "UserRepository",
     "ResourceRepository",
+    "ResourceContentRepository",
     "RatingRepository",
     "FavoriteRepository",
+    "ImportRepository",
 ]
@@ -1,12 +1,16 @@
 """Favorite (like) repository: toggle and list for user_data.favorites."""
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, any_, bindparam, func, select, delete, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.models.core import Favorite, Resource
+from app.core.pagination import decode_cursor, paginate
+from app.models.core import Favorite, Resource, ResourceCardRow
+from app.repositories.resource_repo import select_resource_cards
 
 _RESOURCE_LOAD_OPTIONS = (
     joinedload(Resource.technology),
@@ -34,6 +38,27 @@ class FavoriteRepository:
         )
         return set(result.scalars().all())
 
+    async def get_favorited_among(self, user_id: UUID, resource_ids: list[UUID]) -> set[UUID]:
+        """Which of resource_ids (one page) the user has favorited: PK probes, cost follows the page, not the favorites."""
+        if not resource_ids:
+            return set()
+        ids = bindparam("resource_ids", resource_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+        result = await self._session.execute(
+            select(Favorite.resource_id).where(Favorite.user_id == user_id, Favorite.resource_id == any_(ids))
+        )
+        return set(result.scalars().all())
+
+    async def favorites_version(self, user_id: UUID) -> tuple[int, datetime | None]:
+        """
+        (count, newest created_at) of the user's favorites. Any toggle changes it (an add is always the newest),
+        so favorites ETags derive from it.
+        """
+        result = await self._session.execute(
+            select(func.count(), func.max(Favorite.created_at)).where(Favorite.user_id == user_id)
+        )
+        count, newest = result.one()
+        return count, newest
+
     async def toggle_favorite(self, user_id: UUID, resource_id: UUID) -> bool:
         """If exists, delete; else create. Return new state (True = favorited)."""
         existing = await self._session.execute(
@@ -61,7 +86,31 @@ class FavoriteRepository:
             .join(Favorite, Favorite.resource_id == Resource.id)
             .where(Favorite.user_id == user_id)
             .options(*_RESOURCE_LOAD_OPTIONS)
-            .order_by(Favorite.created_at.desc())
+            .order_by(Favorite.created_at.desc(), Favorite.resource_id.desc())
         )
         result = await self._session.execute(q)
         return list(result.unique().scalars().all())
+
+    async def get_favorite_cards(
+        self, user_id: UUID, limit: int | None = None, cursor: str | None = None
+    ) -> tuple[list[Row], str | None]:
+        """
+        Favorites as card rows, newest favorite first. Without a limit returns all of them;
+        with one, a keyset page on (favorite created_at, resource_id). Returns (rows, next_cursor).
+        """
+        q = (
+            select_resource_cards(Favorite.created_at.label("favorited_at"))
+            .join(Favorite, Favorite.resource_id == ResourceCardRow.id)
+            .where(Favorite.user_id == user_id)
+            .order_by(Favorite.created_at.desc(), Favorite.resource_id.desc())
+        )
+        if cursor is not None:
+            after_value, after_id = decode_cursor(cursor)
+            q = q.where(
+                tuple_(Favorite.created_at, Favorite.resource_id) < tuple_(after_value, after_id)
+            )
+        if limit is None:
+            result = await self._session.execute(q)
+            return list(result.all()), None
+        result = await self._session.execute(q.limit(limit + 1))
+        return paginate(list(result.all()), limit, lambda row: (row.favorited_at, row.id))
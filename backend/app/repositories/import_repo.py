@@ -0,0 +1,122 @@
+"""
+Bulk import of ratings and favorites: rows are COPYed into per-transaction staging tables,
+then merged into user_data.ratings / favorites with one set-based upsert each, and the
+aggregates of every touched resource are recomputed once at the end.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, MetaData, Table, func, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.core import Favorite, Rating, Resource, User
+from app.repositories.rating_repo import RatingRepository
+
+_staging = MetaData()
+# seq keeps arrival order, so the last row for a (user, resource) pair wins
+_rating_import = Table(
+    "rating_import",
+    _staging,
+    Column("seq", BigInteger, primary_key=True, autoincrement=True),
+    Column("user_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("resource_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("score", Integer, nullable=False),
+    Column("rated_at", DateTime(timezone=True)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_favorite_import = Table(
+    "favorite_import",
+    _staging,
+    Column("seq", BigInteger, primary_key=True, autoincrement=True),
+    Column("user_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("resource_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("created_at", DateTime(timezone=True)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_RATING_COLUMNS = ("user_id", "resource_id", "score", "rated_at")
+_FAVORITE_COLUMNS = ("user_id", "resource_id", "created_at")
+
+
+class ImportRepository:
+    """
+    Stage any number of batches (stage_*), then merge_* once; all in one transaction, since the
+    staging tables are dropped on commit. Rows naming an unknown user or resource are skipped.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._staged: set[str] = set()
+
+    async def _copy(self, table: Table, columns: tuple[str, ...], records: Iterable[tuple]) -> None:
+        connection = await self._session.connection()
+        if table.name not in self._staged:
+            await connection.run_sync(table.create)
+            self._staged.add(table.name)
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(table.name, records=records, columns=columns)
+
+    async def stage_ratings(self, rows: Iterable[tuple]) -> None:
+        """COPY (user_id, resource_id, score, rated_at | None) rows into the ratings staging table."""
+        await self._copy(_rating_import, _RATING_COLUMNS, rows)
+
+    async def stage_favorites(self, rows: Iterable[tuple]) -> None:
+        """COPY (user_id, resource_id, created_at | None) rows into the favorites staging table."""
+        await self._copy(_favorite_import, _FAVORITE_COLUMNS, rows)
+
+    async def _staged_count(self, table: Table) -> int:
+        if table.name not in self._staged:
+            return 0
+        return await self._session.scalar(select(func.count()).select_from(table)) or 0
+
+    async def merge_ratings(self, imported_at: datetime) -> tuple[int, int, int]:
+        """Upsert staged ratings, then recompute touched resources. Returns (received, imported, resources recalculated)."""
+        received = await self._staged_count(_rating_import)
+        if not received:
+            return 0, 0, 0
+        s = _rating_import
+        latest = (
+            select(s.c.user_id, s.c.resource_id, s.c.score, func.coalesce(s.c.rated_at, imported_at).label("rated_at"))
+            .join(User, User.id == s.c.user_id)
+            .join(Resource, Resource.id == s.c.resource_id)
+            .distinct(s.c.user_id, s.c.resource_id)
+            .order_by(s.c.user_id, s.c.resource_id, s.c.seq.desc())
+        ).subquery()
+        insert = pg_insert(Rating).from_select(
+            ["id", "user_id", "resource_id", "score", "rating_date"],
+            select(func.gen_random_uuid(), latest.c.user_id, latest.c.resource_id, latest.c.score, latest.c.rated_at),
+        )
+        result = await self._session.execute(
+            insert.on_conflict_do_update(
+                constraint="uq_user_data_ratings_user_resource",
+                set_={"score": insert.excluded.score, "rating_date": insert.excluded.rating_date},
+            )
+        )
+        imported = result.rowcount
+        # One exact recount per touched resource, instead of a recompute per vote
+        touched = (await self._session.execute(select(s.c.resource_id).distinct())).scalars().all()
+        recalculated = await RatingRepository(self._session).recount_resources(list(touched))
+        return received, imported, recalculated
+
+    async def merge_favorites(self, imported_at: datetime) -> tuple[int, int]:
+        """Insert staged favorites (existing pairs are kept as they are). Returns (received, imported)."""
+        received = await self._staged_count(_favorite_import)
+        if not received:
+            return 0, 0
+        s = _favorite_import
+        latest = (
+            select(s.c.user_id, s.c.resource_id, func.coalesce(s.c.created_at, imported_at).label("created_at"))
+            .join(User, User.id == s.c.user_id)
+            .join(Resource, Resource.id == s.c.resource_id)
+            .distinct(s.c.user_id, s.c.resource_id)
+            .order_by(s.c.user_id, s.c.resource_id, s.c.seq.desc())
+        ).subquery()
+        result = await self._session.execute(
+            pg_insert(Favorite)
+            .from_select(["user_id", "resource_id", "created_at"], select(latest))
+            .on_conflict_do_nothing(index_elements=["user_id", "resource_id"])
+        )
+        return received, result.rowcount
@@ -1,14 +1,77 @@
 """Rating repository. No deletion per TZ."""
 
-from uuid import UUID
+import math
+from datetime import datetime
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, func
+from sqlalchemy import ColumnElement, DateTime, Integer, Numeric, any_, bindparam, case, cast, or_, select, func, update
+from sqlalchemy import Float, and_, delete, insert, literal, literal_column
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.core import Rating, Resource
+from app.core.config import settings
+from app.core.recommendation_feed import feed_changed
+from app.models.core import Rating, RatingDelta, Resource
 from decimal import Decimal
 
 
+# SQLSTATE of a foreign key violation (rating of a resource that doesn't exist)
+_FOREIGN_KEY_VIOLATION = "23503"
+
+
+def rating_average(total: ColumnElement, count: ColumnElement) -> ColumnElement:
+    """average_rating from a (sum, count) pair, 0 when there are no ratings."""
+    return func.coalesce(func.round(cast(total, Numeric) / func.nullif(count, 0), 2), 0)
+
+
+# Decay anchor (2024-01-01T00:00:00Z): scores are relative to it, not to now, so they never go stale
+_POPULARITY_EPOCH = 1704067200
+
+
+def popularity_score(total: ColumnElement, count: ColumnElement) -> ColumnElement:
+    """
+    Ranking score of the resource being updated: the Bayesian average of its scores (shrunk toward
+    popularity_prior_mean by popularity_prior_weight phantom votes). With popularity_half_life_days
+    set, older resources weigh half as much per half-life; that is scored as
+    ln(average) + ln 2 * (created_at - epoch) / half_life, which orders like decaying every score by
+    its age (the factor 2^(-age / half_life) shares now() across resources and cancels out) without
+    depending on when the score was written: nothing needs re-decaying as time passes.
+    """
+    weight = settings.popularity_prior_weight
+    prior_total = literal(weight * settings.popularity_prior_mean, Float)
+    score = (prior_total + total) / (literal(weight, Float) + count)
+    if settings.popularity_half_life_days > 0:
+        since_epoch = cast(func.extract("epoch", Resource.created_at), Float) - _POPULARITY_EPOCH
+        half_lives = since_epoch / literal(settings.popularity_half_life_days * 86400, Float)
+        score = func.ln(score) + literal(math.log(2), Float) * half_lives
+    return score
+
+
+def rating_aggregates(total: ColumnElement, count: ColumnElement) -> dict[str, ColumnElement]:
+    """
+    Values for every resources column derived from a (sum, count) pair. updated_at is kept: a vote
+    is not an edit, and team favorites page by (updated_at, id), so bumping it would move rows
+    across keyset cursors mid-scroll.
+    """
+    return {
+        "ratings_sum": total,
+        "ratings_count": count,
+        "average_rating": rating_average(total, count),
+        "popularity_score": popularity_score(total, count),
+        "updated_at": Resource.updated_at,
+    }
+
+
+def _id_array(ids: list[UUID]) -> ColumnElement:
+    return bindparam("resource_ids", ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+
+
+def _drop_deltas(resource_ids: ColumnElement):
+    """CTE deleting the write-behind deltas of resources being recounted (the recount includes those votes)."""
+    return delete(RatingDelta).where(RatingDelta.resource_id == any_(resource_ids)).cte("dropped_deltas")
+
+
 class RatingRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -37,28 +100,334 @@ class RatingRepository:
         await self._session.refresh(rating)
         return rating
 
-    async def recalc_resource_rating(self, resource_id: UUID) -> None:
-        """Recalculate average_rating and ratings_count for resource."""
-        from sqlalchemy import update
-        subq = (
+    def _upsert_vote(self, user_id: UUID, resource_id: UUID, score: int):
+        """
+        CTEs shared by upsert_rating and record_vote:
+          prev:   the current score, row-locked (evaluated before the insert, see the WHERE below)
+          upsert: INSERT ... ON CONFLICT (user_id, resource_id) DO UPDATE, returning whether it inserted
+        Returns (upsert CTE, previous score scalar subquery).
+        """
+        prev = (
+            select(Rating.score)
+            .where(Rating.user_id == user_id, Rating.resource_id == resource_id)
+            .with_for_update()
+            .cte("prev")
+        )
+        previous_score = select(prev.c.score).scalar_subquery()
+        row = select(
+            literal(uuid4(), PG_UUID(as_uuid=True)),
+            literal(user_id, PG_UUID(as_uuid=True)),
+            literal(resource_id, PG_UUID(as_uuid=True)),
+            literal(score, Integer),
+            literal(datetime.utcnow(), DateTime(timezone=True)),
+        )
+        # Uncorrelated, so it runs once before any row is inserted: locks and reads prev first
+        row = row.where(select(func.count()).select_from(prev).scalar_subquery() >= 0)
+        insert = pg_insert(Rating).from_select(["id", "user_id", "resource_id", "score", "rating_date"], row)
+        upsert = (
+            insert.on_conflict_do_update(
+                constraint="uq_user_data_ratings_user_resource",
+                set_={"score": insert.excluded.score},
+            )
+            .returning(Rating.score, literal_column("xmax = 0").label("inserted"))
+            .cte("upsert")
+        )
+        return upsert, previous_score
+
+    async def _execute_vote(self, statement):
+        try:
+            return (await self._session.execute(statement)).one()
+        except IntegrityError as e:
+            if getattr(e.orig, "sqlstate", None) == _FOREIGN_KEY_VIOLATION:
+                return None
+            raise
+
+    async def upsert_rating(self, user_id: UUID, resource_id: UUID, score: int) -> tuple[Decimal, int] | None:
+        """
+        Create or re-score the user's rating and apply it to the resource's aggregates in one statement
+        (see _upsert_vote), with agg: resources += (score - previous score, 1 if inserted), average derived.
+        Returns (average_rating, ratings_count), None if the resource doesn't exist (the transaction
+        is then aborted and must be rolled back).
+        """
+        upsert, previous_score = self._upsert_vote(user_id, resource_id, score)
+        new_sum = Resource.ratings_sum + upsert.c.score - func.coalesce(previous_score, 0)
+        new_count = Resource.ratings_count + case((upsert.c.inserted, 1), else_=0)
+        agg = (
+            update(Resource)
+            .where(Resource.id == resource_id)
+            .values(**rating_aggregates(new_sum, new_count))
+            .returning(Resource.average_rating, Resource.ratings_count)
+            .cte("agg")
+        )
+        result = await self._execute_vote(
+            select(agg.c.average_rating, agg.c.ratings_count, upsert.c.inserted, previous_score.label("previous_score"))
+        )
+        if result is None:
+            return None
+        feed_changed(self._session)
+        if not result.inserted and result.previous_score is None:
+            # Lost a race with a concurrent first vote of the same user: the delta above treated
+            # that vote's score as 0, so recount this resource exactly (rare second round trip)
+            return await self.recalc_resource_rating(resource_id)
+        return result.average_rating, result.ratings_count
+
+    async def record_vote(self, user_id: UUID, resource_id: UUID, score: int) -> tuple[int, int] | None:
+        """
+        Write-behind mode: create or re-score the user's rating and journal its effect on the
+        resource (user_data.rating_deltas) in one statement, without touching the resource row;
+        flush_rating_deltas applies it later. Returns an estimate of (ratings_sum, ratings_count):
+        as stored, plus every journaled delta, plus this vote. None if the resource doesn't exist
+        (the transaction is then aborted and must be rolled back).
+        """
+        upsert, previous_score = self._upsert_vote(user_id, resource_id, score)
+        # Lost a race with a concurrent first vote of the same user: its score is unknown here
+        recount = and_(~upsert.c.inserted, previous_score.is_(None))
+        journal = (
+            insert(RatingDelta)
+            .from_select(
+                ["resource_id", "score_delta", "count_delta", "recount"],
+                select(
+                    literal(resource_id, PG_UUID(as_uuid=True)),
+                    case((recount, 0), else_=upsert.c.score - func.coalesce(previous_score, 0)),
+                    case((upsert.c.inserted, 1), else_=0),
+                    recount,
+                ),
+            )
+            .returning(RatingDelta.score_delta, RatingDelta.count_delta)
+            .cte("journal")
+        )
+        this_resource = Resource.id == resource_id
+        this_journal = RatingDelta.resource_id == resource_id
+        # Same snapshot for all: the stored aggregates and the deltas not yet applied to them
+        result = await self._execute_vote(
+            select(
+                select(Resource.ratings_sum).where(this_resource).scalar_subquery()
+                + select(func.coalesce(func.sum(RatingDelta.score_delta), 0)).where(this_journal).scalar_subquery()
+                + journal.c.score_delta,
+                select(Resource.ratings_count).where(this_resource).scalar_subquery()
+                + select(func.coalesce(func.sum(RatingDelta.count_delta), 0)).where(this_journal).scalar_subquery()
+                + journal.c.count_delta,
+            )
+        )
+        if result is None:
+            return None
+        return result[0], result[1]
+
+    async def flush_rating_deltas(self, batch_size: int) -> int:
+        """
+        Apply the journaled deltas of up to batch_size resources: lock those resources (in id order,
+        like every recount), then one statement deletes their deltas, sums them per resource and
+        adds the sums in a single UPDATE ... FROM; resources with a recount delta are recounted.
+        Returns the number of resources flushed.
+        """
+        locked = await self._session.execute(
+            select(Resource.id)
+            .where(Resource.id.in_(select(RatingDelta.resource_id)))
+            .order_by(Resource.id)
+            .limit(batch_size)
+            .with_for_update(of=Resource)
+        )
+        ids = list(locked.scalars().all())
+        if not ids:
+            return 0
+        applied = (
+            delete(RatingDelta)
+            .where(RatingDelta.resource_id == any_(_id_array(ids)))
+            .returning(RatingDelta.resource_id, RatingDelta.score_delta, RatingDelta.count_delta, RatingDelta.recount)
+            .cte("applied")
+        )
+        totals = (
             select(
-                func.coalesce(func.avg(Rating.score), 0).label("avg"),
-                func.count(Rating.id).label("cnt"),
-            ).where(Rating.resource_id == resource_id)
-        )
-        result = await self._session.execute(subq)
-        row = result.one()
-        avg_val = float(row.avg) if row.avg is not None else 0.0
-        cnt_val = row.cnt or 0
+                applied.c.resource_id,
+                func.sum(applied.c.score_delta).label("score_delta"),
+                func.sum(applied.c.count_delta).label("count_delta"),
+                func.bool_or(applied.c.recount).label("recount"),
+            )
+            .group_by(applied.c.resource_id)
+            .cte("totals")
+        )
+        new_sum = Resource.ratings_sum + totals.c.score_delta
+        new_count = Resource.ratings_count + totals.c.count_delta
+        updated = (
+            update(Resource)
+            .where(Resource.id == totals.c.resource_id, ~totals.c.recount)
+            .values(**rating_aggregates(new_sum, new_count))
+            .returning(Resource.id)
+            .cte("updated")
+        )
+        result = await self._session.execute(
+            select(totals.c.resource_id).where(totals.c.recount).add_cte(updated)
+        )
+        recounts = list(result.scalars().all())
+        if recounts:
+            await self.recount_resources(recounts)
+        feed_changed(self._session)
+        return len(ids)
+
+    async def apply_rating_delta(
+        self, resource_id: UUID, score_delta: int, count_delta: int
+    ) -> tuple[Decimal, int] | None:
+        """
+        Apply one vote to the resource's aggregates: (+score, +1) for a new rating, (new - old, 0) for a
+        changed score. One UPDATE computed from the row itself, so concurrent votes serialize on the row
+        lock instead of overwriting each other. Returns (average_rating, ratings_count), None if no such resource.
+        """
+        new_sum = Resource.ratings_sum + score_delta
+        new_count = Resource.ratings_count + count_delta
+        result = await self._session.execute(
+            update(Resource)
+            .where(Resource.id == resource_id)
+            .values(**rating_aggregates(new_sum, new_count))
+            .returning(Resource.average_rating, Resource.ratings_count)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        feed_changed(self._session)
+        return row.average_rating, row.ratings_count
+
+    async def recount_resources(self, resource_ids: list[UUID]) -> int:
+        """
+        Recompute the aggregates of these resources from their ratings (exact), locking them first
+        (see reconcile_aggregates) and dropping their write-behind deltas in the same statement.
+        Returns the number of resources updated.
+        """
+        if not resource_ids:
+            return 0
+        ids = _id_array(sorted(set(resource_ids)))
         await self._session.execute(
+            select(Resource.id).where(Resource.id == any_(ids)).order_by(Resource.id).with_for_update()
+        )
+        actual = (
+            select(Rating.resource_id, func.sum(Rating.score).label("total"), func.count().label("cnt"))
+            .where(Rating.resource_id == any_(ids))
+            .group_by(Rating.resource_id)
+            .subquery()
+        )
+        total = func.coalesce(actual.c.total, 0)
+        count = func.coalesce(actual.c.cnt, 0)
+        expected = (
+            select(Resource.id, total.label("total"), count.label("cnt"))
+            .outerjoin(actual, actual.c.resource_id == Resource.id)
+            .where(Resource.id == any_(ids))
+            .subquery()
+        )
+        result = await self._session.execute(
+            update(Resource)
+            .where(Resource.id == expected.c.id)
+            .values(**rating_aggregates(expected.c.total, expected.c.cnt))
+            .add_cte(_drop_deltas(ids))
+            .execution_options(synchronize_session=False)
+        )
+        feed_changed(self._session)
+        return result.rowcount
+
+    async def recalc_resource_rating(self, resource_id: UUID) -> tuple[Decimal, int] | None:
+        """
+        Recompute the resource's aggregates from all of its ratings (exact, O(ratings); see apply_rating_delta).
+        Returns (average_rating, ratings_count), None if no such resource.
+        """
+        # Lock first: the recount below then reads a snapshot taken after every vote that already
+        # updated the row, and later votes wait for this transaction (see reconcile_aggregates)
+        await self._session.execute(select(Resource.id).where(Resource.id == resource_id).with_for_update())
+        actual = select(
+            func.coalesce(func.sum(Rating.score), 0).label("total"),
+            func.count(Rating.id).label("cnt"),
+        ).where(Rating.resource_id == resource_id).subquery()
+        result = await self._session.execute(
             update(Resource)
             .where(Resource.id == resource_id)
+            .values(**rating_aggregates(actual.c.total, actual.c.cnt))
+            .add_cte(_drop_deltas(_id_array([resource_id])))
+            .returning(Resource.average_rating, Resource.ratings_count)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        feed_changed(self._session)
+        return (row.average_rating, row.ratings_count) if row is not None else None
+
+    async def reconcile_aggregates(self, after_id: UUID | None, batch_size: int) -> tuple[int, UUID | None]:
+        """
+        Check the next batch of resources (by id, after after_id) against the ratings table and fix
+        any whose ratings_sum / ratings_count / average_rating drifted. Returns (fixed, last id of the
+        batch); last id is None when there are no resources left.
+
+        The batch is row-locked first, in its own statement: the recount then runs on a snapshot
+        taken after every vote that touched these rows had committed, and new votes wait for this
+        transaction. (Computed and applied in one UPDATE, READ COMMITTED would re-check only the
+        target row and write a total that misses a concurrent vote.)
+        """
+        batch = select(Resource.id).order_by(Resource.id).limit(batch_size).with_for_update()
+        if after_id is not None:
+            batch = batch.where(Resource.id > after_id)
+        ids = list((await self._session.execute(batch)).scalars().all())
+        if not ids:
+            return 0, None
+        batch_ids = _id_array(ids)
+        actual = (
+            select(
+                Rating.resource_id,
+                func.sum(Rating.score).label("total"),
+                func.count().label("cnt"),
+            )
+            .where(Rating.resource_id == any_(batch_ids))
+            .group_by(Rating.resource_id)
+            .subquery()
+        )
+        total = func.coalesce(actual.c.total, 0)
+        count = func.coalesce(actual.c.cnt, 0)
+        expected = (
+            select(Resource.id, total.label("total"), count.label("cnt"))
+            .outerjoin(actual, actual.c.resource_id == Resource.id)
+            .where(Resource.id == any_(batch_ids))
+            .where(
+                or_(
+                    Resource.ratings_sum != total,
+                    Resource.ratings_count != count,
+                    Resource.average_rating != rating_average(total, count),
+                )
+            )
+            .subquery()
+        )
+        result = await self._session.execute(
+            update(Resource)
+            .where(Resource.id == expected.c.id)
+            .values(**rating_aggregates(expected.c.total, expected.c.cnt))
+            # Pending write-behind deltas are part of the recount (a resource whose stored counters
+            # match its ratings has none that change them)
+            .add_cte(_drop_deltas(batch_ids))
+            .returning(Resource.id)
+            .execution_options(synchronize_session=False)
+        )
+        fixed = len(result.all())
+        if fixed:
+            feed_changed(self._session)
+        return fixed, ids[-1]
+
+    async def refresh_popularity(self, after_id: UUID | None, batch_size: int) -> tuple[int, UUID | None]:
+        """
+        Recompute popularity_score for the next batch of rated resources (by id, after after_id), after
+        the prior or half-life settings change. Returns (updated, last id of the batch); last id is None
+        when there are no resources left.
+        """
+        batch = select(Resource.id).where(Resource.ratings_count > 0).order_by(Resource.id).limit(batch_size)
+        if after_id is not None:
+            batch = batch.where(Resource.id > after_id)
+        ids = list((await self._session.execute(batch)).scalars().all())
+        if not ids:
+            return 0, None
+        result = await self._session.execute(
+            update(Resource)
+            .where(Resource.id == any_(bindparam("batch_ids", ids, type_=ARRAY(PG_UUID(as_uuid=True)))))
             .values(
-                average_rating=Decimal(str(round(avg_val, 2))),
-                ratings_count=cnt_val,
+                popularity_score=popularity_score(Resource.ratings_sum, Resource.ratings_count),
+                updated_at=Resource.updated_at,  # a bookkeeping refresh, not an edit
             )
+            .execution_options(synchronize_session=False)
         )
-        await self._session.flush()
+        feed_changed(self._session)
+        return result.rowcount, ids[-1]
 
     async def count_by_user(self, user_id: UUID) -> int:
         result = await self._session.execute(
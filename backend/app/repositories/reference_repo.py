@@ -2,16 +2,37 @@
 
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import event, select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.reference_cache import MENTORS, SKILL_LEVELS, TEAMS, TECHNOLOGIES, reference_catalog
 from app.models.reference import Technology, Mentor, Team, SkillLevel
 
+# Session.info key: catalog kinds written in the current transaction
+_CHANGED_KINDS = "reference_catalog_changed"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """Invalidate again once the write is visible, so a load racing the commit can't keep the old list."""
+    for kind in session.info.pop(_CHANGED_KINDS, ()):
+        reference_catalog.invalidate(kind)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_CHANGED_KINDS, None)
+
 
 class ReferenceRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def _changed(self, kind: str) -> None:
+        reference_catalog.invalidate(kind)
+        self._session.info.setdefault(_CHANGED_KINDS, set()).add(kind)
+
     # --- Technology ---
     async def get_technologies(self) -> list[Technology]:
         result = await self._session.execute(select(Technology).order_by(Technology.name))
@@ -26,6 +47,7 @@ class ReferenceRepository:
         self._session.add(obj)
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(TECHNOLOGIES)
         return obj
 
     async def update_technology(
@@ -37,11 +59,14 @@ class ReferenceRepository:
             obj.description = description
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(TECHNOLOGIES)
         return obj
 
     async def delete_technology(self, id: UUID) -> bool:
         result = await self._session.execute(delete(Technology).where(Technology.id == id))
         await self._session.flush()
+        if result.rowcount > 0:
+            self._changed(TECHNOLOGIES)
         return result.rowcount > 0
 
     # --- Mentor ---
@@ -58,6 +83,7 @@ class ReferenceRepository:
         self._session.add(obj)
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(MENTORS)
         return obj
 
     async def update_mentor(
@@ -69,11 +95,14 @@ class ReferenceRepository:
             obj.email = email
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(MENTORS)
         return obj
 
     async def delete_mentor(self, id: UUID) -> bool:
         result = await self._session.execute(delete(Mentor).where(Mentor.id == id))
         await self._session.flush()
+        if result.rowcount > 0:
+            self._changed(MENTORS)
         return result.rowcount > 0
 
     # --- Team ---
@@ -90,6 +119,7 @@ class ReferenceRepository:
         self._session.add(obj)
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(TEAMS)
         return obj
 
     async def update_team(
@@ -101,11 +131,14 @@ class ReferenceRepository:
             obj.description = description
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(TEAMS)
         return obj
 
     async def delete_team(self, id: UUID) -> bool:
         result = await self._session.execute(delete(Team).where(Team.id == id))
         await self._session.flush()
+        if result.rowcount > 0:
+            self._changed(TEAMS)
         return result.rowcount > 0
 
     # --- SkillLevel ---
@@ -126,6 +159,7 @@ class ReferenceRepository:
         self._session.add(obj)
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(SKILL_LEVELS)
         return obj
 
     async def update_skill_level(
@@ -137,9 +171,12 @@ class ReferenceRepository:
             obj.sort_order = sort_order
         await self._session.flush()
         await self._session.refresh(obj)
+        self._changed(SKILL_LEVELS)
         return obj
 
     async def delete_skill_level(self, id: UUID) -> bool:
         result = await self._session.execute(delete(SkillLevel).where(SkillLevel.id == id))
         await self._session.flush()
+        if result.rowcount > 0:
+            self._changed(SKILL_LEVELS)
         return result.rowcount > 0
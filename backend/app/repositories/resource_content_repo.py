@@ -0,0 +1,46 @@
+"""Resource content repository: extracted file text in user_data.resource_contents."""
+
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.content_extraction import ExtractedContent
+from app.models.core import Resource, ResourceContent
+
+
+class ResourceContentRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_hash(self, resource_id: UUID) -> str | None:
+        result = await self._session.execute(
+            select(ResourceContent.content_hash).where(ResourceContent.resource_id == resource_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_file_paths(self) -> list[tuple[UUID, str]]:
+        """(resource id, file_path) of every resource, for the startup extraction backfill."""
+        result = await self._session.execute(select(Resource.id, Resource.file_path))
+        return [(row.id, row.file_path) for row in result]
+
+    async def upsert(self, resource_id: UUID, content_hash: str, content: ExtractedContent) -> None:
+        values = {
+            "content_hash": content_hash,
+            "body": content.body,
+            "headings": "\n".join(content.headings),
+            "code_languages": content.code_languages,
+        }
+        stmt = insert(ResourceContent).values(resource_id=resource_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResourceContent.resource_id],
+            set_={**values, "extracted_at": stmt.excluded.extracted_at},
+        )
+        await self._session.execute(stmt)
+        await self._session.flush()
+
+    async def delete(self, resource_id: UUID) -> None:
+        await self._session.execute(
+            delete(ResourceContent).where(ResourceContent.resource_id == resource_id)
+        )
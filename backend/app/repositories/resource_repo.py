@@ -1,19 +1,52 @@
 """Resource repository: CRUD and list for user_data.resources."""
 
+import re
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import or_, select, func
+from sqlalchemy import ColumnElement, Row, Select, and_, any_, bindparam, case, literal, or_, select, func, true, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.models.core import Resource, ResourceType, Rating
-from app.schemas.resource import ResourceFilters, ResourceTypeEnum, ResourceUpdate
+from app.core.config import settings
+from app.core.content_extraction import content_changed
+from app.core.database import reads_replica
+from app.core.recommendation_feed import feed_changed
+from app.core.pagination import decode_cursor, paginate
+from app.core.search_index import index_changed, search_index
+from app.models.core import RESOURCES_DATA_VERSION, DataVersion, Resource, ResourceCardRow, ResourceContent, ResourceType, Rating, SEARCH_CONFIG
+from app.models.reference import Technology
+from app.schemas.resource import (
+    ResourceFilters,
+    ResourceSearchModeEnum,
+    ResourceSortEnum,
+    ResourceTypeEnum,
+    ResourceUpdate,
+)
+
+# Shorter queries can't form a useful tsquery; they fall back to substring ILIKE
+_FTS_MIN_QUERY_LENGTH = 3
+_SEARCH_TOKEN_RE = re.compile(r"\w+")
 
 
 def _resource_type_from_enum(e: ResourceTypeEnum) -> ResourceType:
     return ResourceType(e.value)
 
 
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_prefix_tsquery(search: str) -> str | None:
+    """Turn free text into a to_tsquery() string: every word is a prefix match, AND-ed ("kub pod" -> "kub:* & pod:*")."""
+    tokens = _SEARCH_TOKEN_RE.findall(search.lower())
+    if not tokens:
+        return None
+    return " & ".join(f"{t}:*" for t in tokens)
+
+
 # Eager-load relationships so ResourceRead (technology, skill_level, mentor) serializes without lazy load
 _RESOURCE_LOAD_OPTIONS = (
     joinedload(Resource.technology),
@@ -21,11 +54,179 @@ _RESOURCE_LOAD_OPTIONS = (
     joinedload(Resource.mentor),
 )
 
+# Partial-index predicates, rendered inline (not as bind params) so the planner can match
+# ix_user_data_resources_*popular (ratings_count > 0) and ix_user_data_ratings_five_star_resource_id (score = 5)
+_RATED = Resource.ratings_count > literal(0, literal_execute=True)
+_FIVE_STAR = Rating.score == literal(5, literal_execute=True)
+
+# Vault filter chips: facet name -> grouped column (order defines the GROUPING() bit layout)
+_FACET_COLUMNS = {
+    "technology": ResourceCardRow.technology_id,
+    "team": ResourceCardRow.team_id,
+    "skill_level": ResourceCardRow.skill_level_id,
+    "mentor": ResourceCardRow.mentor_id,
+    "resource_type": ResourceCardRow.resource_type,
+}
+
+
+def select_resource_cards(*extra_columns) -> Select:
+    """
+    Flat card rows from the resource_cards read model (reference names already denormalized):
+    no joins, entities or identity map. See ResourceCard.
+    """
+    return select(*ResourceCardRow.__table__.columns, *extra_columns)
+
+
+def _created_key(r: Resource | Row) -> tuple[datetime, UUID]:
+    return r.created_at, r.id
+
+
+def _apply_page(
+    q: Select, limit: int, offset: int, cursor: str | None, sort_column, id_column=Resource.id
+) -> Select:
+    """
+    LIMIT limit + 1 (one extra row tells whether there is a next page).
+    With a cursor, seek past (sort_column, id) instead of OFFSET, so any page costs the same as the first.
+    """
+    if cursor is not None:
+        after_value, after_id = decode_cursor(cursor)
+        q = q.where(tuple_(sort_column, id_column) < tuple_(after_value, after_id))
+    elif offset:
+        q = q.offset(offset)
+    return q.limit(limit + 1)
+
+
+def _index_hits(query: str) -> list[tuple[UUID, float]] | None:
+    """
+    All BM25 matches of query, best first; None when the index isn't loaded or synced yet, or the
+    query matches more than search_index_max_hits (too many ids to hand over: full-text search in SQL
+    instead, never a truncated list, which would drop matches from pages and facet counts).
+    """
+    if not search_index.ready or search_index.synced_through is None:
+        return None
+    hits = search_index.search(query, limit=settings.search_index_max_hits + 1)
+    return hits if len(hits) <= settings.search_index_max_hits else None
+
+
+def _content_match(ts_query: ColumnElement) -> Select:
+    """Ids of resources whose extracted file content matches ts_query."""
+    return select(ResourceContent.resource_id).where(ResourceContent.search_vector.op("@@")(ts_query))
+
+
+def _attribute_conditions(filters: ResourceFilters, source=Resource) -> dict[str, ColumnElement]:
+    """The set attribute filters as conditions on `source`, keyed by facet name (see _FACET_COLUMNS)."""
+    conditions = {}
+    if filters.technology_id is not None:
+        conditions["technology"] = source.technology_id == filters.technology_id
+    if filters.team_id is not None:
+        conditions["team"] = source.team_id == filters.team_id
+    if filters.skill_level_id is not None:
+        conditions["skill_level"] = source.skill_level_id == filters.skill_level_id
+    if filters.mentor_id is not None:
+        conditions["mentor"] = source.mentor_id == filters.mentor_id
+    if filters.resource_type is not None:
+        conditions["resource_type"] = source.resource_type == _resource_type_from_enum(filters.resource_type)
+    return conditions
+
+
+def _apply_filters(
+    q: Select, filters: ResourceFilters, source=Resource
+) -> tuple[Select, ColumnElement | None]:
+    """
+    Apply the vault search and attribute filters to q. Returns (q, rank); rank is None unless searching FTS/fuzzy.
+    Attribute filters use `source` (Resource or ResourceCardRow); a search over cards joins resources for its indexes.
+    """
+    q, rank = _apply_search(q, filters, source)
+    return q.where(*_attribute_conditions(filters, source).values()), rank
+
+
+def _apply_search(
+    q: Select, filters: ResourceFilters, source=Resource
+) -> tuple[Select, ColumnElement | None]:
+    """The search part of _apply_filters (attribute filters are left out)."""
+    rank = None
+    if filters.search and source is not Resource:
+        q = q.join(Resource, Resource.id == source.id)
+    if filters.search:
+        long_enough = len(filters.search) >= _FTS_MIN_QUERY_LENGTH
+        ts_query_text = _to_prefix_tsquery(filters.search) if long_enough else None
+        if long_enough and filters.search_mode == ResourceSearchModeEnum.fuzzy:
+            # Trigram word similarity ("Kubernets" ~ "Kubernetes"); `<%` is served by the gin_trgm_ops indexes
+            term = literal(filters.search)
+            q = q.where(
+                or_(
+                    term.op("<%")(Resource.title),
+                    term.op("<%")(Resource.description),
+                )
+            )
+            rank = func.greatest(
+                func.word_similarity(term, Resource.title),
+                func.coalesce(func.word_similarity(term, Resource.description), 0) * 0.5,
+            )
+        elif ts_query_text is not None and (hits := _index_hits(filters.search)) is not None:
+            # In-process BM25 over title/description/technology, trusted for resources it has caught up
+            # with; those updated since (the index may lag other workers' writes) are matched in SQL, as
+            # is file content (not indexed). SQL-only matches rank after the BM25 hits.
+            ts_query = func.to_tsquery(SEARCH_CONFIG, ts_query_text)
+            ranked_ids = bindparam("ranked_ids", [id for id, _ in hits], type_=ARRAY(PG_UUID(as_uuid=True)))
+            recent = Resource.updated_at > search_index.synced_through
+            q = q.where(
+                or_(
+                    and_(Resource.id == any_(ranked_ids), ~recent),
+                    and_(recent, Resource.search_vector.op("@@")(ts_query)),
+                    Resource.id.in_(_content_match(ts_query)),
+                )
+            )
+            sql_rank = func.ts_rank(Resource.search_vector, ts_query, 32)  # 32: scaled into [0, 1)
+            rank = func.coalesce(
+                -func.array_position(ranked_ids, Resource.id), -(len(hits) + 1) + sql_rank
+            )
+        elif ts_query_text is not None:
+            # Full-text over title/description and the extracted file content (GIN indexes on both vectors)
+            ts_query = func.to_tsquery(SEARCH_CONFIG, ts_query_text)
+            q = q.where(
+                or_(
+                    Resource.search_vector.op("@@")(ts_query),
+                    Resource.id.in_(_content_match(ts_query)),
+                )
+            )
+            content_rank = (
+                select(func.ts_rank(ResourceContent.search_vector, ts_query))
+                .where(ResourceContent.resource_id == Resource.id)
+                .scalar_subquery()
+            )
+            rank = func.ts_rank(Resource.search_vector, ts_query) + func.coalesce(content_rank, 0)
+        else:
+            pattern = f"%{filters.search}%"
+            q = q.where(
+                or_(
+                    Resource.title.ilike(pattern),
+                    Resource.description.ilike(pattern),
+                )
+            )
+    return q, rank
+
 
 class ResourceRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @property
+    def reads_replica(self) -> bool:
+        return reads_replica(self._session)
+
+    @property
+    def session_info(self) -> dict:
+        """The session's info dict, where services record work for after its commit (see Session events)."""
+        return self._session.info
+
+    async def data_version(self) -> int:
+        """Change counter of resources / resource_contents / resource_cards (trigger-maintained); list ETags derive from it."""
+        result = await self._session.execute(
+            select(func.sum(DataVersion.version)).where(DataVersion.name == RESOURCES_DATA_VERSION)
+        )
+        return int(result.scalar_one_or_none() or 0)
+
     async def get_by_id(self, id: UUID) -> Resource | None:
         result = await self._session.execute(
             select(Resource)
@@ -34,43 +235,105 @@ class ResourceRepository:
         )
         return result.unique().scalar_one_or_none()
 
-    async def get_all(self, limit: int = 10, offset: int = 0) -> list[Resource]:
-        result = await self._session.execute(
+    async def get_all(
+        self, limit: int = 10, offset: int = 0, cursor: str | None = None
+    ) -> tuple[list[Resource], str | None]:
+        """Newest first. With a cursor, pages by keyset (offset is ignored). Returns (items, next_cursor)."""
+        q = (
             select(Resource)
             .options(*_RESOURCE_LOAD_OPTIONS)
-            .order_by(Resource.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(Resource.created_at.desc(), Resource.id.desc())
         )
-        return list(result.unique().scalars().all())
+        q = _apply_page(q, limit, offset, cursor, Resource.created_at)
+        result = await self._session.execute(q)
+        rows = list(result.unique().scalars().all())
+        return paginate(rows, limit, _created_key)
+
+    async def list_filtered(self, filters: ResourceFilters) -> tuple[list[Row], str | None]:
+        """
+        Vault search as resource_cards rows. Returns (rows, next_cursor).
+        Keyset cursors are only issued for the newest-first order; relevance-ordered pages use offset.
+        """
+        card = ResourceCardRow
+        q, rank = _apply_filters(select_resource_cards(), filters, source=card)
+        by_relevance = filters.sort == ResourceSortEnum.relevance and rank is not None
+        if by_relevance:
+            if filters.cursor is not None:
+                raise ValueError("Cursor pagination requires sort=newest")
+            q = (
+                q.order_by(rank.desc(), card.created_at.desc(), card.id.desc())
+                .offset(filters.offset)
+                .limit(filters.limit)
+            )
+            result = await self._session.execute(q)
+            return list(result.all()), None
+        q = q.order_by(card.created_at.desc(), card.id.desc())
+        q = _apply_page(q, filters.limit, filters.offset, filters.cursor, card.created_at, card.id)
+        result = await self._session.execute(q)
+        return paginate(list(result.all()), filters.limit, _created_key)
+
+    async def facet_counts(
+        self, filters: ResourceFilters
+    ) -> tuple[int, dict[str, list[tuple[UUID | ResourceType | None, int]]]]:
+        """
+        Counts per facet value, in one GROUPING SETS query. Facets are disjunctive: each facet's counts
+        apply the search and every attribute filter except its own (what picking another value of that
+        facet would return), so the other chips of a selected facet keep their counts; total applies
+        them all. Returns (total, {facet name: [(value, count), ...]}), each list ordered by count desc.
+        """
+        card = ResourceCardRow
+        columns = list(_FACET_COLUMNS.values())
+        conditions = _attribute_conditions(filters, card)
 
-    async def list_filtered(self, filters: ResourceFilters) -> list[Resource]:
+        def matching(*except_facets: str) -> ColumnElement:
+            return and_(true(), *(c for name, c in conditions.items() if name not in except_facets))
+
+        q = select(
+            *columns,
+            func.grouping(*columns),
+            func.count().filter(matching()),
+            *(func.count().filter(matching(name)) for name in _FACET_COLUMNS),
+        ).group_by(func.grouping_sets(*(tuple_(c) for c in columns), tuple_()))
+        q, _ = _apply_search(q.select_from(card), filters, source=card)
+        if conditions:
+            # Only rows failing at most one attribute filter count anywhere
+            q = q.where(or_(*(matching(name) for name in conditions)))
+        result = await self._session.execute(q)
+        total = 0
+        facets: dict[str, list[tuple[UUID | ResourceType | None, int]]] = {name: [] for name in _FACET_COLUMNS}
+        all_grouped = (1 << len(columns)) - 1
+        for row in result.all():
+            values, grouping_mask = row[: len(columns)], row[len(columns)]
+            if grouping_mask == all_grouped:
+                total = row[len(columns) + 1]
+                continue
+            # GROUPING() sets bit (n - 1 - i) for every column i *not* in the row's grouping set
+            for i, name in enumerate(_FACET_COLUMNS):
+                if not grouping_mask & (1 << (len(columns) - 1 - i)):
+                    count = row[len(columns) + 2 + i]
+                    if count:  # values seen only on rows failing another facet's filter
+                        facets[name].append((values[i], count))
+                    break
+        for counts in facets.values():
+            counts.sort(key=lambda vc: vc[1], reverse=True)
+        return total, facets
+
+    async def suggest_titles(self, prefix: str, limit: int = 8) -> list[tuple[UUID, str]]:
+        """Title completions: titles starting with prefix first, then titles with a word starting with it."""
+        escaped = _escape_like(prefix)
+        starts_with = Resource.title.ilike(f"{escaped}%")
         q = (
-            select(Resource)
-            .options(*_RESOURCE_LOAD_OPTIONS)
-            .order_by(Resource.created_at.desc())
-        )
-        if filters.search:
-            pattern = f"%{filters.search}%"
-            q = q.where(
-                or_(
-                    Resource.title.ilike(pattern),
-                    Resource.description.ilike(pattern),
-                )
+            select(Resource.id, Resource.title)
+            .where(or_(starts_with, Resource.title.ilike(f"% {escaped}%")))
+            .order_by(
+                case((starts_with, 0), else_=1),
+                func.length(Resource.title),
+                Resource.title,
             )
-        if filters.team_id is not None:
-            q = q.where(Resource.team_id == filters.team_id)
-        if filters.skill_level_id is not None:
-            q = q.where(Resource.skill_level_id == filters.skill_level_id)
-        if filters.mentor_id is not None:
-            q = q.where(Resource.mentor_id == filters.mentor_id)
-        if filters.technology_id is not None:
-            q = q.where(Resource.technology_id == filters.technology_id)
-        if filters.resource_type is not None:
-            q = q.where(Resource.resource_type == _resource_type_from_enum(filters.resource_type))
-        q = q.offset(filters.offset).limit(filters.limit)
+            .limit(limit)
+        )
         result = await self._session.execute(q)
-        return list(result.unique().scalars().all())
+        return [(row.id, row.title) for row in result]
 
     async def list_top_by_rating_for_skill_level(
         self, skill_level_id: UUID, limit: int = 50
@@ -79,8 +342,8 @@ class ResourceRepository:
             select(Resource)
             .options(*_RESOURCE_LOAD_OPTIONS)
             .where(Resource.skill_level_id == skill_level_id)
-            .where(Resource.ratings_count > 0)
-            .order_by(Resource.average_rating.desc(), Resource.ratings_count.desc())
+            .where(_RATED)
+            .order_by(Resource.popularity_score.desc(), Resource.id.desc())
             .limit(limit)
         )
         result = await self._session.execute(q)
@@ -100,25 +363,28 @@ class ResourceRepository:
         q = (
             select(Resource)
             .options(*_RESOURCE_LOAD_OPTIONS)
-            .where(Resource.ratings_count > 0)
-            .order_by(Resource.average_rating.desc(), Resource.ratings_count.desc())
+            .where(_RATED)
+            .order_by(Resource.popularity_score.desc(), Resource.id.desc())
             .limit(limit)
         )
         result = await self._session.execute(q)
         return list(result.unique().scalars().all())
 
-    async def list_team_favorites(self, team_id: UUID, limit: int = 100) -> list[Resource]:
-        subq = select(Rating.resource_id).where(Rating.score == 5).distinct()
+    async def list_team_favorites(
+        self, team_id: UUID, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[Row], str | None]:
+        """Team resources with a 5-star as card rows, most recently updated first. Returns (rows, next_cursor)."""
+        card = ResourceCardRow
+        subq = select(Rating.resource_id).where(_FIVE_STAR).distinct()
         q = (
-            select(Resource)
-            .options(*_RESOURCE_LOAD_OPTIONS)
-            .where(Resource.team_id == team_id)
-            .where(Resource.id.in_(subq))
-            .order_by(Resource.updated_at.desc())
-            .limit(limit)
+            select_resource_cards()
+            .where(card.team_id == team_id)
+            .where(card.id.in_(subq))
+            .order_by(card.updated_at.desc(), card.id.desc())
         )
+        q = _apply_page(q, limit, 0, cursor, card.updated_at, card.id)
         result = await self._session.execute(q)
-        return list(result.unique().scalars().all())
+        return paginate(list(result.all()), limit, lambda r: (r.updated_at, r.id))
 
     async def create(
         self,
@@ -147,6 +413,9 @@ class ResourceRepository:
         self._session.add(r)
         await self._session.flush()
         await self._session.refresh(r)
+        await self._reindex(r)
+        content_changed(self._session, r.id, r.file_path)
+        feed_changed(self._session)
         return r
 
     async def count_by_uploader(self, uploader_id: UUID) -> int:
@@ -174,4 +443,39 @@ class ResourceRepository:
             resource.skill_level_id = data.skill_level_id
         await self._session.flush()
         await self._session.refresh(resource)
+        await self._reindex(resource)
+        if data.file_path is not None:
+            content_changed(self._session, resource.id, resource.file_path)
+        feed_changed(self._session)
         return resource
+
+    async def _reindex(self, r: Resource) -> None:
+        if not search_index.ready:
+            return
+        technology = None
+        if r.technology_id is not None:
+            technology = await self._session.scalar(
+                select(Technology.name).where(Technology.id == r.technology_id)
+            )
+        index_changed(self._session, r.id, r.title, r.description, technology)
+
+    async def max_updated_at(self) -> datetime | None:
+        return await self._session.scalar(select(func.max(Resource.updated_at)))
+
+    async def iter_search_documents(
+        self, updated_after: datetime | None = None
+    ) -> AsyncIterator[tuple[UUID, str, str | None, str | None, datetime]]:
+        """
+        (id, title, description, technology name, updated_at) of every resource (or those updated after
+        updated_after), streamed for the search index.
+        """
+        q = (
+            select(Resource.id, Resource.title, Resource.description, Technology.name, Resource.updated_at)
+            .outerjoin(Technology, Technology.id == Resource.technology_id)
+            .execution_options(yield_per=5000)
+        )
+        if updated_after is not None:
+            q = q.where(Resource.updated_at > updated_after)
+        result = await self._session.stream(q)
+        async for row in result:
+            yield row.id, row.title, row.description, row.name, row.updated_at
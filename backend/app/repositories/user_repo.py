@@ -1,21 +1,115 @@
 """User repository."""
 
+import asyncio
+import logging
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, event, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import reads_replica
+from app.core.shared_cache import shared_cache
 from app.models.core import User
 
+logger = logging.getLogger(__name__)
+
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+# get_current_user runs on every protected request: user id -> column values of the users row
+authenticated_users: TTLCache[UUID, tuple] = TTLCache(
+    maxsize=settings.auth_user_cache_max_entries,
+    ttl=settings.auth_user_cache_ttl_seconds,
+)
+
+# Current users.version per user, shared by workers: tokens carrying an older one are stale
+_USER_VERSION_KEY = "user_version:{}"
+
+
+async def known_user_version(user_id: UUID) -> int | None:
+    """users.version as last read from the database (by any worker), None if not known: verify."""
+    value = await shared_cache.get(_USER_VERSION_KEY.format(user_id))
+    return int(value) if value is not None else None
+
+
+# Session.info keys: user ids written / whose claims changed in the current transaction
+_CHANGED_USERS = "authenticated_users_changed"
+_CHANGED_VERSIONS = "user_versions_changed"
+
+# Post-commit version key deletes in flight (the loop only keeps weak references to tasks)
+_pending_deletes: set[asyncio.Task] = set()
+
+
+def _deleted(task: asyncio.Task) -> None:
+    _pending_deletes.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Post-commit user version invalidation failed", exc_info=task.exception())
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """Drop again once the write is visible, so a lookup racing the commit can't keep the old row."""
+    for user_id in session.info.pop(_CHANGED_USERS, ()):
+        authenticated_users.delete(user_id)
+    changed_versions = session.info.pop(_CHANGED_VERSIONS, None)
+    if changed_versions:
+        # Also dropped before commit; again now, in case a worker re-read the old version in between
+        keys = [_USER_VERSION_KEY.format(user_id) for user_id in changed_versions]
+        task = asyncio.get_running_loop().create_task(shared_cache.delete(*keys))
+        _pending_deletes.add(task)
+        task.add_done_callback(_deleted)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS, None)
+    session.info.pop(_CHANGED_VERSIONS, None)
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def _changed(self, user_id: UUID) -> None:
+        authenticated_users.delete(user_id)
+        self._session.info.setdefault(_CHANGED_USERS, set()).add(user_id)
+
     async def get_by_id(self, id: UUID) -> User | None:
         result = await self._session.execute(select(User).where(User.id == id))
         return result.scalar_one_or_none()
 
+    async def get_authenticated(self, id: UUID) -> User | None:
+        """
+        get_by_id through the authenticated-user cache. Returns a detached copy (not in any session):
+        read its columns, but load through get_by_id before changing it.
+        """
+        values = authenticated_users.get(id)
+        if values is None:
+            user = await self.get_by_id(id)
+            if user is None:
+                return None
+            values = tuple(getattr(user, key) for key in _USER_COLUMNS)
+            authenticated_users.set(id, values)
+        return User(**dict(zip(_USER_COLUMNS, values)))
+
+    async def get_claims(self, id: UUID) -> Row | None:
+        """
+        (id, team_id, skill_level_id, version) from the users row itself (no cache). Read on the primary,
+        it's remembered as the known version; a replica's may predate a claims change (whose update just
+        dropped the key), and caching it would re-validate the outdated tokens.
+        """
+        result = await self._session.execute(
+            select(User.id, User.team_id, User.skill_level_id, User.version).where(User.id == id)
+        )
+        row = result.one_or_none()
+        if row is not None and not reads_replica(self._session):
+            await shared_cache.set(
+                _USER_VERSION_KEY.format(id), str(row.version).encode(), ttl=settings.user_version_ttl_seconds
+            )
+        return row
+
     async def get_by_telegram_id(self, telegram_id: int) -> User | None:
         result = await self._session.execute(
             select(User).where(User.telegram_id == telegram_id)
@@ -47,10 +141,19 @@ class UserRepository:
             user.first_name = first_name
         if last_name is not None:
             user.last_name = last_name
+        claims_changed = (team_id is not None and team_id != user.team_id) or (
+            skill_level_id is not None and skill_level_id != user.skill_level_id
+        )
         if team_id is not None:
             user.team_id = team_id
         if skill_level_id is not None:
             user.skill_level_id = skill_level_id
+        if claims_changed:
+            user.version = User.version + 1
         await self._session.flush()
         await self._session.refresh(user)
+        self._changed(user.id)
+        if claims_changed:
+            await shared_cache.delete(_USER_VERSION_KEY.format(user.id))
+            self._session.info.setdefault(_CHANGED_VERSIONS, set()).add(user.id)
         return user
@@ -9,10 +9,16 @@ from app.schemas.reference import (
 from app.schemas.user import UserRead, UserCreate, UserUpdate
 from app.schemas.resource import (
     ResourceRead,
+    ResourceCard,
     ResourceCreate,
     ResourceUpdate,
     ResourceFilters,
     ResourceTypeEnum,
+    ResourceSortEnum,
+    ResourceSearchModeEnum,
+    ResourceSuggestion,
+    FacetCount,
+    ResourceFacets,
 )
 from app.schemas.rating import RatingRead, RatingCreate, RatingUpdate
 from app.schemas.profile import ProfileStats, TeamStats
@@ -26,10 +32,16 @@ __all__ = [
     "UserCreate",
     "UserUpdate",
     "ResourceRead",
+    "ResourceCard",
     "ResourceCreate",
     "ResourceUpdate",
     "ResourceFilters",
     "ResourceTypeEnum",
+    "ResourceSortEnum",
+    "ResourceSearchModeEnum",
+    "ResourceSuggestion",
+    "FacetCount",
+    "ResourceFacets",
     "RatingRead",
     "RatingCreate",
     "RatingUpdate",
@@ -0,0 +1,29 @@
+"""Bulk import schemas: historical ratings and favorites (POST /api/import/*, scripts/import_votes.py)."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class RatingImportRow(BaseModel):
+    user_id: UUID
+    resource_id: UUID
+    score: int = Field(..., ge=1, le=5)
+    rated_at: datetime | None = None  # default: import time
+
+
+class FavoriteImportRow(BaseModel):
+    user_id: UUID
+    resource_id: UUID
+    created_at: datetime | None = None  # default: import time
+
+
+class ImportResult(BaseModel):
+    """received: rows sent; imported: rows written (later duplicates of a (user, resource) pair win);
+    skipped: duplicates and rows naming an unknown user or resource."""
+
+    received: int
+    imported: int
+    skipped: int
+    resources_recalculated: int = 0
@@ -38,3 +38,4 @@ class RateResponse(BaseModel):
     average_rating: Decimal
     ratings_count: int
     user_rating: int  # the score just set
+    estimated: bool = False  # write-behind mode: stats include this vote but are not stored yet
@@ -15,6 +15,20 @@ class ResourceTypeEnum(str, Enum):
     snippet = "snippet"
 
 
+class ResourceSortEnum(str, Enum):
+    """List ordering: newest first, or full-text relevance when searching."""
+
+    newest = "newest"
+    relevance = "relevance"
+
+
+class ResourceSearchModeEnum(str, Enum):
+    """fulltext: tsvector prefix match; fuzzy: typo-tolerant trigram match (pg_trgm)."""
+
+    fulltext = "fulltext"
+    fuzzy = "fuzzy"
+
+
 class TechnologyNested(BaseModel):
     """Technology snippet for list/detail: id, name."""
 
@@ -87,6 +101,53 @@ class ResourceRead(BaseModel):
     mentor: Optional[MentorNested] = None
     is_favorite: bool = False
     user_rating: int | None = None  # current user's rating 1-5, if any
+    file_url: str | None = None  # file_path with ?v=<content hash> (immutable caching); detail view only
+
+
+class ResourceCard(BaseModel):
+    """Slim list item (vault search, favorites): card fields plus technology / skill level / mentor names."""
+
+    id: UUID
+    title: str
+    description: str | None = None
+    resource_type: ResourceTypeEnum
+    technology_id: UUID | None = None
+    mentor_id: UUID | None = None
+    team_id: UUID | None = None
+    skill_level_id: UUID | None = None
+    average_rating: Decimal
+    ratings_count: int
+    created_at: datetime
+    updated_at: datetime
+    technology: Optional[TechnologyNested] = None
+    skill_level: Optional[SkillLevelNested] = None
+    mentor: Optional[MentorNested] = None
+    is_favorite: bool = False
+
+
+class ResourceSuggestion(BaseModel):
+    """Title completion for GET /resources/suggest."""
+
+    id: UUID
+    title: str
+
+
+class FacetCount(BaseModel):
+    """One filter chip: facet value (id or resource type; null = not set) and how many resources match it."""
+
+    value: str | None = None
+    count: int
+
+
+class ResourceFacets(BaseModel):
+    """Counts per filter value for GET /resources/facets."""
+
+    total: int
+    technology: list[FacetCount] = []
+    team: list[FacetCount] = []
+    skill_level: list[FacetCount] = []
+    mentor: list[FacetCount] = []
+    resource_type: list[FacetCount] = []
 
 
 class ResourceCreate(BaseModel):
@@ -113,10 +174,13 @@ class ResourceUpdate(BaseModel):
 
 class ResourceFilters(BaseModel):
     search: str | None = None
+    search_mode: ResourceSearchModeEnum = ResourceSearchModeEnum.fulltext
     team_id: UUID | None = None
     skill_level_id: UUID | None = None
     mentor_id: UUID | None = None
     technology_id: UUID | None = None
     resource_type: ResourceTypeEnum | None = None
+    sort: ResourceSortEnum = ResourceSortEnum.newest
     limit: int = Field(default=50, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    cursor: str | None = None  # opaque keyset cursor (X-Next-Cursor of the previous page); overrides offset
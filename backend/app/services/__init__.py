@@ -6,6 +6,7 @@ from app.services.resource_service import ResourceService
 from app.services.rating_service import RatingService
 from app.services.recommendation_service import RecommendationService
 from app.services.profile_service import ProfileService
+from app.services.import_service import ImportService
 
 __all__ = [
     "ReferenceService",
@@ -14,4 +15,5 @@ __all__ = [
     "RatingService",
     "RecommendationService",
     "ProfileService",
+    "ImportService",
 ]
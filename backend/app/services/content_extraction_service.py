@@ -0,0 +1,101 @@
+"""Background extraction of resource Markdown files into user_data.resource_contents."""
+
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.content_extraction import CONTENT_CHANGED, extract_markdown, read_file, resolve_resource_file
+from app.core.database import AsyncSessionLocal
+from app.repositories.resource_content_repo import ResourceContentRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ContentExtractionQueue:
+    """
+    Bounded queue drained by a fixed number of worker tasks; file reads and Markdown parsing
+    run in threads, so requests only pay for an enqueue. Each job hashes the file and skips
+    extraction when the stored hash is unchanged.
+    """
+
+    def __init__(self, workers: int, maxsize: int) -> None:
+        self._workers = workers
+        self._queue: asyncio.Queue[tuple[UUID, str]] = asyncio.Queue(maxsize=maxsize)
+        self._pending: set[UUID] = set()
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self._workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def enqueue(self, resource_id: UUID, file_path: str) -> bool:
+        """Schedule (re-)extraction without waiting. False if the queue is full (the next backfill catches up)."""
+        if not self._tasks or resource_id in self._pending:
+            return False
+        try:
+            self._queue.put_nowait((resource_id, file_path))
+        except asyncio.QueueFull:
+            logger.warning("Content extraction queue full; skipped resource %s", resource_id)
+            return False
+        self._pending.add(resource_id)
+        return True
+
+    async def backfill(self) -> None:
+        """Queue every resource (waiting for room); unchanged files cost a hash, not an extraction."""
+        async with AsyncSessionLocal() as session:
+            rows = await ResourceContentRepository(session).list_file_paths()
+        for resource_id, file_path in rows:
+            if resource_id not in self._pending:
+                self._pending.add(resource_id)
+                await self._queue.put((resource_id, file_path))
+
+    async def _run(self) -> None:
+        while True:
+            resource_id, file_path = await self._queue.get()
+            try:
+                await self._extract(resource_id, file_path)
+            except Exception:
+                logger.exception("Content extraction failed for resource %s", resource_id)
+            finally:
+                self._pending.discard(resource_id)
+                self._queue.task_done()
+
+    async def _extract(self, resource_id: UUID, file_path: str) -> None:
+        path = resolve_resource_file(file_path)
+        async with AsyncSessionLocal() as session:
+            repo = ResourceContentRepository(session)
+            if path is None or not path.is_file():
+                await repo.delete(resource_id)
+            else:
+                content_hash, data = await asyncio.to_thread(read_file, path)
+                if await repo.get_hash(resource_id) == content_hash:
+                    return
+                content = await asyncio.to_thread(extract_markdown, data.decode("utf-8", errors="replace"))
+                await repo.upsert(resource_id, content_hash, content)
+            await session.commit()
+
+
+content_extraction = ContentExtractionQueue(
+    workers=settings.content_extraction_workers,
+    maxsize=settings.content_extraction_queue_size,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _extract_committed(session: Session) -> None:
+    for resource_id, file_path in session.info.pop(CONTENT_CHANGED, {}).items():
+        content_extraction.enqueue(resource_id, file_path)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(CONTENT_CHANGED, None)
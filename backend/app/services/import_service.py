@@ -0,0 +1,29 @@
+"""Bulk import of historical ratings and favorites (wiki migration)."""
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from app.repositories.import_repo import ImportRepository
+from app.schemas.imports import FavoriteImportRow, ImportResult, RatingImportRow
+
+
+class ImportService:
+    def __init__(self, repo: ImportRepository) -> None:
+        self._repo = repo
+
+    async def import_ratings(self, rows: Iterable[RatingImportRow]) -> ImportResult:
+        """Upsert ratings (a re-imported pair takes the new score), recomputing each touched resource once."""
+        await self._repo.stage_ratings((r.user_id, r.resource_id, r.score, r.rated_at) for r in rows)
+        received, imported, recalculated = await self._repo.merge_ratings(datetime.now(timezone.utc))
+        return ImportResult(
+            received=received,
+            imported=imported,
+            skipped=received - imported,
+            resources_recalculated=recalculated,
+        )
+
+    async def import_favorites(self, rows: Iterable[FavoriteImportRow]) -> ImportResult:
+        """Add favorites; pairs that already exist are counted as skipped."""
+        await self._repo.stage_favorites((r.user_id, r.resource_id, r.created_at) for r in rows)
+        received, imported = await self._repo.merge_favorites(datetime.now(timezone.utc))
+        return ImportResult(received=received, imported=imported, skipped=received - imported)
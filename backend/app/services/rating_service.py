@@ -2,10 +2,27 @@
 
 from uuid import UUID
 
+from app.core.database import AsyncSessionLocal
+from app.core.rating_aggregator import estimate_average, rating_aggregator
 from app.repositories.rating_repo import RatingRepository
-from app.models.core import User, Resource
+from app.core.security import Principal
 from app.schemas.rating import RatingRead, RateResponse
-from decimal import Decimal
+
+
+# Resources per flush transaction (each holds their row locks until it commits)
+_FLUSH_BATCH = 500
+
+
+async def _flush_rating_deltas() -> None:
+    while True:
+        async with AsyncSessionLocal() as session:
+            flushed = await RatingRepository(session).flush_rating_deltas(_FLUSH_BATCH)
+            await session.commit()
+        if flushed < _FLUSH_BATCH:
+            return
+
+
+rating_aggregator.flusher = _flush_rating_deltas
 
 
 class RatingService:
@@ -18,20 +35,32 @@ class RatingService:
         r = await self._repo.get_by_user_and_resource(user_id, resource_id)
         return RatingRead.model_validate(r) if r else None
 
-    async def set_rating(self, user: User, resource_id: UUID, score: int) -> RateResponse:
-        """Create or update rating (1–5). Recalculates resource average. Returns new stats."""
-        resource = await self._repo._session.get(Resource, resource_id)
-        if not resource:
+    async def set_rating(self, user: Principal, resource_id: UUID, score: int) -> RateResponse:
+        """
+        Create or update rating (1–5) and the resource's aggregates in one statement. Returns new stats.
+        With rating_write_behind_enabled the aggregates are updated later, and the stats are an estimate.
+        """
+        if rating_aggregator.running:
+            return await self._record_rating(user, resource_id, score)
+        stats = await self._repo.upsert_rating(user.id, resource_id, score)
+        if stats is None:
+            raise ValueError("Resource not found")
+        average_rating, ratings_count = stats
+        return RateResponse(
+            average_rating=average_rating,
+            ratings_count=ratings_count,
+            user_rating=score,
+        )
+
+    async def _record_rating(self, user: Principal, resource_id: UUID, score: int) -> RateResponse:
+        """Write-behind: store and journal the vote; answer with an estimate (stored aggregates + pending deltas + this vote)."""
+        stats = await self._repo.record_vote(user.id, resource_id, score)
+        if stats is None:
             raise ValueError("Resource not found")
-        existing = await self._repo.get_by_user_and_resource(user.id, resource_id)
-        if existing:
-            await self._repo.update_score(existing, score)
-        else:
-            await self._repo.create(user.id, resource_id, score)
-        await self._repo.recalc_resource_rating(resource_id)
-        await self._repo._session.refresh(resource)
+        ratings_sum, ratings_count = stats
         return RateResponse(
-            average_rating=resource.average_rating,
-            ratings_count=resource.ratings_count,
+            average_rating=estimate_average(ratings_sum, ratings_count),
+            ratings_count=ratings_count,
             user_rating=score,
+            estimated=True,
         )
@@ -1,33 +1,66 @@
 """Recommendations: hybrid of newest + most popular resources."""
 
+from pydantic import TypeAdapter
+
+from app.core.database import AsyncSessionLocal
+from app.core.recommendation_feed import FeedSnapshot, recommendation_feed
+from app.core.single_flight import SingleFlight
 from app.repositories.resource_repo import ResourceRepository
-from app.models.core import User, Resource
+from app.core.security import Principal
+from app.models.core import Resource
 from app.schemas.resource import ResourceRead
 
+_FEED_ADAPTER = TypeAdapter(list[ResourceRead])
+
+# Requests finding no snapshot (cold start, expiry) share one load
+_feed_flight: SingleFlight[None, FeedSnapshot] = SingleFlight("recommendations.feed")
+
+
+async def _load_feed(repo: ResourceRepository) -> FeedSnapshot:
+    """
+    Hybrid: 3 newest + 3 most popular, deduplicated.
+    Safe when DB is empty (empty feed).
+    """
+    version = recommendation_feed.version
+    newest = await repo.list_newest(limit=3)
+    popular = await repo.list_most_popular(limit=3)
+
+    seen_ids = set()
+    combined: list[Resource] = []
+    for r in newest:
+        if r.id not in seen_ids:
+            seen_ids.add(r.id)
+            combined.append(r)
+    for r in popular:
+        if r.id not in seen_ids:
+            seen_ids.add(r.id)
+            combined.append(r)
+
+    items = [ResourceRead.model_validate(r) for r in combined]
+    return recommendation_feed.put(version, items, _FEED_ADAPTER.dump_json(items))
+
+
+async def _refresh_feed() -> None:
+    async with AsyncSessionLocal() as session:
+        await _load_feed(ResourceRepository(session))
+
+
+recommendation_feed.refresher = _refresh_feed
+
 
 class RecommendationService:
     def __init__(self, resource_repo: ResourceRepository) -> None:
         self._repo = resource_repo
 
+    async def feed(self) -> FeedSnapshot:
+        """The shared feed snapshot; loaded here only when none is cached (first request, expiry, failed refresh)."""
+        snapshot = recommendation_feed.get()
+        if snapshot is None:
+            snapshot = await _feed_flight.do(None, lambda: _load_feed(self._repo))
+        return snapshot
+
     async def get_recommendations(
-        self, user: User | None, limit: int = 50
+        self, user: Principal | None, limit: int = 50
     ) -> list[ResourceRead]:
-        """
-        Hybrid: 3 newest + 3 most popular, deduplicated.
-        Safe when DB is empty (returns []).
-        """
-        newest = await self._repo.list_newest(limit=3)
-        popular = await self._repo.list_most_popular(limit=3)
-
-        seen_ids = set()
-        combined: list[Resource] = []
-        for r in newest:
-            if r.id not in seen_ids:
-                seen_ids.add(r.id)
-                combined.append(r)
-        for r in popular:
-            if r.id not in seen_ids:
-                seen_ids.add(r.id)
-                combined.append(r)
-
-        return [ResourceRead.model_validate(r) for r in combined[:limit]]
+        """The feed is the same for every user."""
+        return list((await self.feed()).items[:limit])
@@ -3,7 +3,16 @@
 from uuid import UUID
 
 from fastapi import HTTPException, status
-
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.reference_cache import (
+    MENTORS,
+    SKILL_LEVELS,
+    TEAMS,
+    TECHNOLOGIES,
+    CatalogSnapshot,
+    reference_catalog,
+)
 from app.repositories.reference_repo import ReferenceRepository
 from app.models.reference import Technology, Mentor, Team, SkillLevel
 from app.schemas.reference import (
@@ -22,14 +31,41 @@ from app.schemas.reference import (
 )
 
 
+_CATALOG_SCHEMAS: dict[str, type[BaseModel]] = {
+    TECHNOLOGIES: TechnologyRead,
+    MENTORS: MentorRead,
+    TEAMS: TeamRead,
+    SKILL_LEVELS: SkillLevelRead,
+}
+# ReferenceRepository method that loads each kind, in list order
+_CATALOG_LOADERS = {
+    TECHNOLOGIES: "get_technologies",
+    MENTORS: "get_mentors",
+    TEAMS: "get_teams",
+    SKILL_LEVELS: "get_skill_levels",
+}
+_CATALOG_ADAPTERS = {kind: TypeAdapter(list[schema]) for kind, schema in _CATALOG_SCHEMAS.items()}
+
+
 class ReferenceService:
     def __init__(self, repo: ReferenceRepository) -> None:
         self._repo = repo
 
+    # --- Catalog snapshots (list endpoints) ---
+    async def catalog(self, kind: str) -> CatalogSnapshot:
+        """Cached list of one reference kind; only a cache miss queries the database."""
+        snapshot = reference_catalog.get(kind)
+        if snapshot is not None:
+            return snapshot
+        version = reference_catalog.version(kind)
+        schema = _CATALOG_SCHEMAS[kind]
+        rows = await getattr(self._repo, _CATALOG_LOADERS[kind])()
+        items = [schema.model_validate(obj) for obj in rows]
+        return reference_catalog.put(kind, version, items, _CATALOG_ADAPTERS[kind].dump_json(items))
+
     # --- Technology ---
     async def list_technologies(self) -> list[TechnologyRead]:
-        items = await self._repo.get_technologies()
-        return [TechnologyRead.model_validate(t) for t in items]
+        return list((await self.catalog(TECHNOLOGIES)).items)
 
     async def get_technology(self, id: UUID) -> TechnologyRead | None:
         t = await self._repo.get_technology(id)
@@ -58,8 +94,7 @@ class ReferenceService:
 
     # --- Mentor ---
     async def list_mentors(self) -> list[MentorRead]:
-        items = await self._repo.get_mentors()
-        return [MentorRead.model_validate(m) for m in items]
+        return list((await self.catalog(MENTORS)).items)
 
     async def get_mentor(self, id: UUID) -> MentorRead | None:
         m = await self._repo.get_mentor(id)
@@ -84,8 +119,7 @@ class ReferenceService:
 
     # --- Team ---
     async def list_teams(self) -> list[TeamRead]:
-        items = await self._repo.get_teams()
-        return [TeamRead.model_validate(t) for t in items]
+        return list((await self.catalog(TEAMS)).items)
 
     async def get_team(self, id: UUID) -> TeamRead | None:
         t = await self._repo.get_team(id)
@@ -110,8 +144,7 @@ class ReferenceService:
 
     # --- SkillLevel ---
     async def list_skill_levels(self) -> list[SkillLevelRead]:
-        items = await self._repo.get_skill_levels()
-        return [SkillLevelRead.model_validate(s) for s in items]
+        return list((await self.catalog(SKILL_LEVELS)).items)
 
     async def get_skill_level(self, id: UUID) -> SkillLevelRead | None:
         s = await self._repo.get_skill_level(id)
@@ -2,9 +2,22 @@
 
 from uuid import UUID
 
+from sqlalchemy import Row, event
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.single_flight import SingleFlight
 from app.repositories.resource_repo import ResourceRepository
 from app.models.core import Resource, ResourceType
 from app.schemas.resource import (
+    FacetCount,
+    MentorNested,
+    ResourceCard,
+    ResourceFacets,
+    SkillLevelNested,
+    TechnologyNested,
+    ResourceSuggestion,
     ResourceRead,
     ResourceCreate,
     ResourceUpdate,
@@ -17,17 +30,165 @@ def _resource_type_enum_to_model(e: ResourceTypeEnum) -> ResourceType:
     return ResourceType(e.value)
 
 
+def resource_card_from_row(row: Row) -> ResourceCard:
+    """ResourceCard from a resource_cards row (ResourceRepository.list_filtered and friends)."""
+    return ResourceCard(
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        resource_type=row.resource_type.value,
+        technology_id=row.technology_id,
+        mentor_id=row.mentor_id,
+        team_id=row.team_id,
+        skill_level_id=row.skill_level_id,
+        average_rating=row.average_rating,
+        ratings_count=row.ratings_count,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        technology=(
+            TechnologyNested(id=row.technology_id, name=row.technology_name)
+            if row.technology_name is not None
+            else None
+        ),
+        skill_level=(
+            SkillLevelNested(id=row.skill_level_id, name=row.skill_level_name)
+            if row.skill_level_name is not None
+            else None
+        ),
+        mentor=(
+            MentorNested(id=row.mentor_id, first_name=row.mentor_first_name, last_name=row.mentor_last_name)
+            if row.mentor_id is not None
+            else None
+        ),
+    )
+
+
+# Autocomplete fires on every keystroke: cache completions per (normalized prefix, limit)
+_suggest_cache: TTLCache[tuple[str, int], list[ResourceSuggestion]] = TTLCache(
+    maxsize=settings.suggest_cache_max_entries,
+    ttl=settings.suggest_cache_ttl_seconds,
+)
+
+# Session.info key: caches (below) that the current transaction's resource writes make stale
+_STALE_CACHES = "resource_caches_stale"
+_SUGGEST = "suggest"
+_FACETS = "facets"
+# Bumped when a cache is cleared: a load that started before then mustn't store its result
+_cache_generations = {_SUGGEST: 0, _FACETS: 0}
+
+
+def _clear_cache(name: str) -> None:
+    _cache_generations[name] += 1
+    if name == _SUGGEST:
+        _suggest_cache.clear()
+    elif name == _FACETS:
+        _facets_cache.clear()
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_committed(session: Session) -> None:
+    """Clear once the write is visible; cleared before, a concurrent load could re-cache the old data."""
+    for name in session.info.pop(_STALE_CACHES, ()):
+        _clear_cache(name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_STALE_CACHES, None)
+
+
+# Filter chip counts are re-requested on every filter change: cache per filter combination
+_FacetKey = tuple[str | None, str, UUID | None, UUID | None, UUID | None, UUID | None, str | None]
+_facets_cache: TTLCache[_FacetKey, ResourceFacets] = TTLCache(
+    maxsize=settings.facets_cache_max_entries,
+    ttl=settings.facets_cache_ttl_seconds,
+)
+
+
+# Identical concurrent reads (broadcast bursts) share one query; keys are every field the result depends on,
+# including whether the session reads a replica (a caller pinned to the primary must not get a replica's result)
+_list_flight: SingleFlight[tuple, tuple[list[ResourceCard], str | None]] = SingleFlight("resources.list")
+_facets_flight: SingleFlight[tuple[bool, int, _FacetKey], ResourceFacets] = SingleFlight("resources.facets")
+_team_favorites_flight: SingleFlight[tuple, tuple[list[ResourceCard], str | None]] = SingleFlight("team_favorites")
+
+
+def _facets_key(filters: ResourceFilters) -> _FacetKey:
+    """Only the fields that narrow the matched set; sort and paging don't change the counts."""
+    return (
+        " ".join(filters.search.lower().split()) if filters.search else None,
+        filters.search_mode.value,
+        filters.team_id,
+        filters.skill_level_id,
+        filters.mentor_id,
+        filters.technology_id,
+        filters.resource_type.value if filters.resource_type else None,
+    )
+
+
 class ResourceService:
     def __init__(self, repo: ResourceRepository) -> None:
         self._repo = repo
 
+    def _caches_stale(self, *names: str) -> None:
+        """Clear these caches once the current transaction commits."""
+        self._repo.session_info.setdefault(_STALE_CACHES, set()).update(names)
+
+    async def data_version(self) -> int:
+        return await self._repo.data_version()
+
     async def get_by_id(self, id: UUID) -> ResourceRead | None:
         r = await self._repo.get_by_id(id)
         return ResourceRead.model_validate(r) if r else None
 
-    async def list_filtered(self, filters: ResourceFilters) -> list[ResourceRead]:
-        items = await self._repo.list_filtered(filters)
-        return [ResourceRead.model_validate(r) for r in items]
+    async def list_filtered(
+        self, filters: ResourceFilters
+    ) -> tuple[list[ResourceCard], str | None]:
+        """Returns (page, next_cursor). Raises ValueError on an invalid cursor."""
+
+        async def load() -> tuple[list[ResourceCard], str | None]:
+            rows, next_cursor = await self._repo.list_filtered(filters)
+            return [resource_card_from_row(row) for row in rows], next_cursor
+
+        return await _list_flight.do((self._repo.reads_replica, *filters.model_dump().values()), load)
+
+    async def suggest(self, prefix: str, limit: int = 8) -> list[ResourceSuggestion]:
+        key = (" ".join(prefix.lower().split()), limit)
+        cached = _suggest_cache.get(key)
+        if cached is not None:
+            return cached
+        generation = _cache_generations[_SUGGEST]
+        rows = await self._repo.suggest_titles(key[0], limit=limit)
+        items = [ResourceSuggestion(id=id, title=title) for id, title in rows]
+        if _cache_generations[_SUGGEST] == generation:
+            _suggest_cache.set(key, items)
+        return items
+
+    async def facets(self, filters: ResourceFilters) -> ResourceFacets:
+        key = _facets_key(filters)
+        cached = _facets_cache.get(key)
+        if cached is not None:
+            return cached
+        # Keyed by cache generation too: callers after a commit don't join a load that started before it
+        generation = _cache_generations[_FACETS]
+        return await _facets_flight.do(
+            (self._repo.reads_replica, generation, key), lambda: self._load_facets(key, filters, generation)
+        )
+
+    async def _load_facets(self, key: _FacetKey, filters: ResourceFilters, generation: int) -> ResourceFacets:
+        total, counts = await self._repo.facet_counts(filters)
+        facets = ResourceFacets(
+            total=total,
+            **{
+                name: [
+                    FacetCount(value=None if value is None else str(getattr(value, "value", value)), count=count)
+                    for value, count in values
+                ]
+                for name, values in counts.items()
+            },
+        )
+        if _cache_generations[_FACETS] == generation:
+            _facets_cache.set(key, facets)
+        return facets
 
     async def create(self, uploader_id: UUID, data: ResourceCreate) -> ResourceRead:
         r = await self._repo.create(
@@ -41,12 +202,16 @@ class ResourceService:
             team_id=data.team_id,
             skill_level_id=data.skill_level_id,
         )
+        self._caches_stale(_SUGGEST, _FACETS)
         return ResourceRead.model_validate(r)
 
     async def update(self, id: UUID, data: ResourceUpdate) -> ResourceRead | None:
         r = await self._repo.get_by_id(id)
         if not r:
             return None
+        if data.title is not None:
+            self._caches_stale(_SUGGEST)
+        self._caches_stale(_FACETS)
         return ResourceRead.model_validate(
             await self._repo.update(r, data)
         )
@@ -59,6 +224,13 @@ class ResourceService:
         )
         return [ResourceRead.model_validate(r) for r in items]
 
-    async def list_team_favorites(self, team_id: UUID, limit: int = 100) -> list[ResourceRead]:
-        items = await self._repo.list_team_favorites(team_id, limit=limit)
-        return [ResourceRead.model_validate(r) for r in items]
+    async def list_team_favorites(
+        self, team_id: UUID, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[ResourceCard], str | None]:
+        async def load() -> tuple[list[ResourceCard], str | None]:
+            rows, next_cursor = await self._repo.list_team_favorites(
+                team_id, limit=limit, cursor=cursor
+            )
+            return [resource_card_from_row(row) for row in rows], next_cursor
+
+        return await _team_favorites_flight.do((self._repo.reads_replica, team_id, limit, cursor), load)
@@ -0,0 +1,98 @@
+"""Loading and cross-worker synchronisation of the in-process search index (app.core.search_index)."""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.search_index import SearchIndex, search_index
+from app.repositories.resource_repo import ResourceRepository
+
+logger = logging.getLogger(__name__)
+
+# Catch-up re-reads this much before the last watermark: a transaction can commit after a later
+# one with an earlier updated_at
+_SYNC_OVERLAP = timedelta(seconds=60)
+
+
+class SearchIndexSync:
+    """
+    Each worker indexes its own writes on commit; writes of other workers reach it through a
+    catch-up every sync_seconds (resources updated since the last watermark) and a full rebuild
+    every reload_seconds (e.g. renamed technologies, which don't touch resources). Rebuilds
+    tokenize in a thread into a new index that is then swapped in, so the event loop keeps
+    serving; catch-ups skip resources whose updated_at the index already has.
+    """
+
+    def __init__(self, sync_seconds: float, reload_seconds: float) -> None:
+        self._sync_seconds = sync_seconds
+        self._reload_seconds = reload_seconds
+        self._watermark: datetime | None = None
+        self._versions: dict[UUID, datetime] = {}  # resource id -> updated_at as indexed
+        self._loaded_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def load(self) -> None:
+        async with AsyncSessionLocal() as session:
+            repo = ResourceRepository(session)
+            watermark = await repo.max_updated_at()
+            rows = [row async for row in repo.iter_search_documents()]
+        built = SearchIndex()
+        await asyncio.to_thread(built.load, [row[:4] for row in rows])
+        # Own commits indexed into the old index during the build are re-read by the next catch-up (overlap)
+        search_index.swap_in(built)
+        self._versions = {row[0]: row[4] for row in rows}
+        self._set_watermark(watermark)
+        self._loaded_at = time.monotonic()
+
+    async def catch_up(self) -> int:
+        """Re-index resources updated since the last watermark. Returns how many were indexed."""
+        if self._watermark is None:
+            await self.load()
+            return len(search_index)
+        async with AsyncSessionLocal() as session:
+            repo = ResourceRepository(session)
+            watermark = await repo.max_updated_at()
+            rows = [row async for row in repo.iter_search_documents(self._watermark - _SYNC_OVERLAP)]
+        changed = 0
+        for id, title, description, technology, updated_at in rows:
+            if self._versions.get(id) != updated_at:
+                search_index.upsert(id, title, description, technology)
+                self._versions[id] = updated_at
+                changed += 1
+        self._set_watermark(watermark or self._watermark)
+        return changed
+
+    def _set_watermark(self, watermark: datetime | None) -> None:
+        self._watermark = watermark
+        # Resources updated within the overlap may not be indexed (or indexed with old text) yet
+        search_index.synced_through = watermark - _SYNC_OVERLAP if watermark is not None else None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._sync_seconds)
+            try:
+                if time.monotonic() - self._loaded_at >= self._reload_seconds:
+                    await self.load()
+                else:
+                    await self.catch_up()
+            except Exception:
+                logger.exception("Search index sync failed")
+
+
+search_index_sync = SearchIndexSync(
+    sync_seconds=settings.search_index_sync_seconds,
+    reload_seconds=settings.search_index_reload_seconds,
+)
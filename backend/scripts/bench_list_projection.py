@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serialized list rows per second, full ORM entities + ResourceRead (before)
+vs. resource_cards read-model rows + ResourceCard (after).
+
+Default mode runs both paths end to end (query, mapping, JSON) against the configured
+database, 100-row pages, so seed enough resources first. --offline skips the database
+and times only mapping + JSON serialization of in-memory rows.
+
+Usage (from backend directory):
+  python scripts/bench_list_projection.py [--pages 200] [--offline]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+# Ensure backend is on path so "app" resolves
+_backend = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from app.core.database import AsyncSessionLocal
+from app.models.core import Resource, ResourceType
+from app.models.reference import Mentor, SkillLevel, Technology
+from app.repositories import ResourceRepository
+from app.schemas.resource import ResourceCard, ResourceFilters, ResourceRead
+from app.services.resource_service import resource_card_from_row
+
+PAGE_SIZE = 100
+_read_list = TypeAdapter(list[ResourceRead])
+_card_list = TypeAdapter(list[ResourceCard])
+
+
+def _report(name: str, rows: int, seconds: float) -> float:
+    rate = rows / seconds
+    print(f"{name:<10} {rows:>8} rows  {seconds:8.3f} s  {rate:>12,.0f} rows/s")
+    return rate
+
+
+async def bench_db(pages: int) -> None:
+    async with AsyncSessionLocal() as session:
+        entity_query = (
+            select(Resource)
+            .options(
+                joinedload(Resource.technology),
+                joinedload(Resource.skill_level),
+                joinedload(Resource.mentor),
+            )
+            .order_by(Resource.created_at.desc(), Resource.id.desc())
+            .limit(PAGE_SIZE)
+        )
+        rows = 0
+        start = time.perf_counter()
+        for _ in range(pages):
+            result = await session.execute(entity_query)
+            items = [ResourceRead.model_validate(r) for r in result.unique().scalars().all()]
+            _read_list.dump_json(items)
+            rows += len(items)
+            session.expunge_all()
+        before = _report("before", rows, time.perf_counter() - start)
+
+        repo = ResourceRepository(session)
+        rows = 0
+        start = time.perf_counter()
+        for _ in range(pages):
+            page, _ = await repo.list_filtered(ResourceFilters(limit=PAGE_SIZE))
+            cards = [resource_card_from_row(row) for row in page]
+            _card_list.dump_json(cards)
+            rows += len(cards)
+        after = _report("after", rows, time.perf_counter() - start)
+    if rows:
+        print(f"speedup    {after / before:.2f}x")
+    else:
+        print("No resources: seed the database first.")
+
+
+def bench_offline(pages: int) -> None:
+    now = datetime.now(timezone.utc)
+    technology = Technology(id=uuid4(), name="Kubernetes")
+    skill_level = SkillLevel(id=uuid4(), name="Middle")
+    mentor = Mentor(id=uuid4(), name="Alice Smith")
+    fields = dict(
+        title="Kubernetes Quick Start",
+        description="Deploy your first pod and service.",
+        file_path="/demo/kubernetes_quick_start.md",
+        resource_type=ResourceType.DOC,
+        technology_id=technology.id,
+        mentor_id=mentor.id,
+        team_id=None,
+        skill_level_id=skill_level.id,
+        average_rating=Decimal("4.20"),
+        ratings_count=5,
+        created_at=now,
+        updated_at=now,
+    )
+    entities = [
+        Resource(id=uuid4(), uploader_id=uuid4(), technology=technology, skill_level=skill_level, mentor=mentor, **fields)
+        for _ in range(PAGE_SIZE)
+    ]
+    card_rows = [
+        SimpleNamespace(
+            id=uuid4(),
+            technology_name=technology.name,
+            skill_level_name=skill_level.name,
+            mentor_first_name="Alice",
+            mentor_last_name="Smith",
+            **fields,
+        )
+        for _ in range(PAGE_SIZE)
+    ]
+    start = time.perf_counter()
+    for _ in range(pages):
+        _read_list.dump_json([ResourceRead.model_validate(r) for r in entities])
+    before = _report("before", pages * PAGE_SIZE, time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(pages):
+        _card_list.dump_json([resource_card_from_row(row) for row in card_rows])
+    after = _report("after", pages * PAGE_SIZE, time.perf_counter() - start)
+    print(f"speedup    {after / before:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="100-row pages per path")
+    parser.add_argument("--offline", action="store_true", help="mapping + serialization only, no database")
+    args = parser.parse_args()
+    if args.offline:
+        bench_offline(args.pages)
+    else:
+        asyncio.run(bench_db(args.pages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression check: EXPLAIN every listing query the repositories issue and fail
+if any of them scans resources/resource_cards/favorites/ratings sequentially or sorts at the top of the plan.
+
+Runs against a migrated, seeded database (alembic upgrade head + scripts/seed.py).
+Sequential scans are disabled for the session, so on a small seed database the check proves
+a matching index exists rather than what the planner would pick for that data volume.
+Exit code 1 on any regression.
+
+Usage (from backend directory):
+  python scripts/check_query_plans.py
+"""
+import asyncio
+import json
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+# Ensure backend is on path so "app" resolves
+_backend = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import encode_cursor
+from app.models.core import User
+from app.models.reference import Mentor, SkillLevel, Team, Technology
+from app.repositories import FavoriteRepository, ResourceRepository
+from app.schemas.resource import ResourceFilters, ResourceTypeEnum
+
+CHECKED_TABLES = {"resources", "resource_cards", "favorites", "ratings"}
+# Plan nodes that only pass rows through; a Sort directly beneath them still orders the whole result
+_PASSTHROUGH_NODES = {"Limit", "Unique", "Result"}
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class PlanRecorder:
+    """AsyncSession wrapper for repositories: EXPLAINs each SELECT before running it."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self.plans: list[dict] = []
+
+    async def execute(self, statement, *args, **kwargs):
+        if isinstance(statement, Select):
+            result = await self._session.execute(_Explain(statement), *args, **kwargs)
+            plan = result.scalar_one()
+            self.plans.append((json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"])
+        return await self._session.execute(statement, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._session, name)
+
+
+def _walk(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def plan_problems(plan: dict) -> list[str]:
+    problems = [
+        f"Seq Scan on {node['Relation Name']}"
+        for node in _walk(plan)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in CHECKED_TABLES
+    ]
+    top = plan
+    while top["Node Type"] in _PASSTHROUGH_NODES and top.get("Plans"):
+        top = top["Plans"][0]
+    if top["Node Type"] == "Sort":
+        problems.append(f"top-level Sort on {', '.join(top.get('Sort Key', []))}")
+    return problems
+
+
+async def _first_id(session: AsyncSession, model) -> object:
+    value = await session.scalar(select(model.id).limit(1))
+    if value is None:
+        raise SystemExit(f"No {model.__tablename__} rows: migrate and run scripts/seed.py first.")
+    return value
+
+
+async def check(session: AsyncSession) -> int:
+    await session.execute(text("SET enable_seqscan = off"))
+    technology_id = await _first_id(session, Technology)
+    team_id = await _first_id(session, Team)
+    skill_level_id = await _first_id(session, SkillLevel)
+    mentor_id = await _first_id(session, Mentor)
+    user_id = await _first_id(session, User)
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid4())
+
+    recorder = PlanRecorder(session)
+    resources = ResourceRepository(recorder)
+    favorites = FavoriteRepository(recorder)
+    cases: dict[str, Callable[[], Awaitable[object]]] = {
+        "get_all": lambda: resources.get_all(limit=20),
+        "get_all (cursor)": lambda: resources.get_all(limit=20, cursor=cursor),
+        "list_filtered": lambda: resources.list_filtered(ResourceFilters()),
+        "list_filtered (cursor)": lambda: resources.list_filtered(ResourceFilters(cursor=cursor)),
+        "list_filtered technology_id": lambda: resources.list_filtered(ResourceFilters(technology_id=technology_id)),
+        "list_filtered team_id": lambda: resources.list_filtered(ResourceFilters(team_id=team_id)),
+        "list_filtered skill_level_id": lambda: resources.list_filtered(ResourceFilters(skill_level_id=skill_level_id)),
+        "list_filtered mentor_id": lambda: resources.list_filtered(ResourceFilters(mentor_id=mentor_id)),
+        "list_filtered resource_type": lambda: resources.list_filtered(
+            ResourceFilters(resource_type=ResourceTypeEnum.snippet)
+        ),
+        "list_top_by_rating_for_skill_level": lambda: resources.list_top_by_rating_for_skill_level(skill_level_id),
+        "list_newest": lambda: resources.list_newest(),
+        "list_most_popular": lambda: resources.list_most_popular(),
+        "list_team_favorites": lambda: resources.list_team_favorites(team_id),
+        "list_team_favorites (cursor)": lambda: resources.list_team_favorites(team_id, cursor=cursor),
+        "get_favorites": lambda: favorites.get_favorites(user_id),
+        "get_favorite_cards": lambda: favorites.get_favorite_cards(user_id),
+        "get_favorite_cards (cursor)": lambda: favorites.get_favorite_cards(user_id, 20, cursor),
+    }
+
+    failures = 0
+    for name, run in cases.items():
+        recorder.plans.clear()
+        await run()
+        problems = [p for plan in recorder.plans for p in plan_problems(plan)]
+        if problems:
+            failures += 1
+            print(f"FAIL  {name}: {'; '.join(problems)}")
+            for plan in recorder.plans:
+                print(json.dumps(plan, indent=2))
+        else:
+            print(f"ok    {name}")
+    return failures
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as session:
+        try:
+            failures = await check(session)
+        finally:
+            await session.rollback()
+    if failures:
+        raise SystemExit(f"{failures} query plan regression(s).")
+    print("All query plans use indexes.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
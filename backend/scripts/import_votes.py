@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Bulk-import historical ratings and favorites (e.g. from the old wiki) from CSV files.
+
+ratings CSV columns:   user_id,resource_id,score[,rated_at]
+favorites CSV columns: user_id,resource_id[,created_at]
+(header row required; ids are user_data UUIDs, timestamps ISO 8601, empty = import time)
+
+Rows are streamed in chunks through COPY into staging tables, merged with one upsert per file,
+and every touched resource's rating aggregates are recomputed once at the end, all in a single
+transaction: an interrupted run imports nothing. Malformed rows are reported and skipped.
+
+Usage (from backend directory):
+  python scripts/import_votes.py --ratings ratings.csv --favorites favorites.csv [--chunk-size 50000]
+"""
+import argparse
+import asyncio
+import csv
+import sys
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from uuid import UUID
+
+# Ensure backend is on path so "app" resolves
+_backend = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from app.core.database import AsyncSessionLocal
+from app.repositories import ImportRepository
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _rating(row: dict) -> tuple:
+    score = int(row["score"])
+    if not 1 <= score <= 5:
+        raise ValueError(f"score {score} not in 1..5")
+    return UUID(row["user_id"]), UUID(row["resource_id"]), score, _timestamp(row.get("rated_at"))
+
+
+def _favorite(row: dict) -> tuple:
+    return UUID(row["user_id"]), UUID(row["resource_id"]), _timestamp(row.get("created_at"))
+
+
+def _read(path: Path, parse: Callable[[dict], tuple], malformed: list[int]) -> Iterator[tuple]:
+    with path.open(newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                yield parse(row)
+            except (KeyError, TypeError, ValueError) as e:
+                if len(malformed) < 10:
+                    print(f"  {path.name}:{line}: skipped ({e})")
+                malformed.append(line)
+
+
+async def _stage(
+    label: str, rows: Iterator[tuple], stage: Callable, chunk_size: int, started: float
+) -> int:
+    total = 0
+    while chunk := list(islice(rows, chunk_size)):
+        await stage(chunk)
+        total += len(chunk)
+        elapsed = time.perf_counter() - started
+        print(f"  {label}: {total:,} rows staged ({total / elapsed:,.0f} rows/s)")
+    return total
+
+
+async def run(ratings: Path | None, favorites: Path | None, chunk_size: int) -> None:
+    started = time.perf_counter()
+    malformed: list[int] = []
+    async with AsyncSessionLocal() as session:
+        repo = ImportRepository(session)
+        if ratings:
+            await _stage("ratings", _read(ratings, _rating, malformed), repo.stage_ratings, chunk_size, started)
+        if favorites:
+            await _stage("favorites", _read(favorites, _favorite, malformed), repo.stage_favorites, chunk_size, started)
+        now = datetime.now().astimezone()
+        received, imported, recalculated = await repo.merge_ratings(now)
+        print(f"Ratings: {imported:,} of {received:,} imported; {recalculated:,} resources recalculated.")
+        received, imported = await repo.merge_favorites(now)
+        print(f"Favorites: {imported:,} of {received:,} imported.")
+        await session.commit()
+    if malformed:
+        print(f"Malformed rows skipped: {len(malformed):,}.")
+    print(f"Done in {time.perf_counter() - started:.1f}s.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ratings", type=Path, help="ratings CSV")
+    parser.add_argument("--favorites", type=Path, help="favorites CSV")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="rows per COPY")
+    args = parser.parse_args()
+    if not args.ratings and not args.favorites:
+        parser.error("nothing to import: pass --ratings and/or --favorites")
+    asyncio.run(run(args.ratings, args.favorites, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
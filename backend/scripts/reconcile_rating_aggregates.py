@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Reconcile resources.ratings_sum / ratings_count / average_rating with the ratings table.
+
+Votes update the aggregates incrementally (RatingRepository.upsert_rating); this job
+walks every resource in id order, one batch per transaction, and rewrites any whose counters
+drifted from the ratings rows (e.g. after manual SQL edits). Safe to run while the app
+serves traffic: each batch is row-locked before it is recounted, so votes on it wait for
+that short transaction instead of being lost. Also safe with write-behind rating aggregation:
+the write-behind deltas of a recounted batch are dropped in the same statement.
+Exit code 1 if anything had to be fixed.
+
+Usage (from backend directory):
+  python scripts/reconcile_rating_aggregates.py [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Ensure backend is on path so "app" resolves
+_backend = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from app.core.database import AsyncSessionLocal
+from app.repositories import RatingRepository
+
+
+async def reconcile(batch_size: int) -> int:
+    fixed_total = 0
+    checked_batches = 0
+    after_id = None
+    while True:
+        async with AsyncSessionLocal() as session:
+            fixed, after_id = await RatingRepository(session).reconcile_aggregates(after_id, batch_size)
+            await session.commit()
+        if after_id is None:
+            break
+        checked_batches += 1
+        fixed_total += fixed
+    print(f"Checked {checked_batches} batch(es) of up to {batch_size} resources; fixed {fixed_total}.")
+    return fixed_total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000, help="resources per transaction")
+    args = parser.parse_args()
+    fixed = asyncio.run(reconcile(args.batch_size))
+    sys.exit(1 if fixed else 0)
+
+
+if __name__ == "__main__":
+    main()
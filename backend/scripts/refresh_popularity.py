@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Recompute resources.popularity_score for every rated resource.
+
+Votes keep the score current as they land (RatingRepository.upsert_rating), and decay is
+anchored to a fixed epoch rather than the time of writing, so scores do not go stale as
+resources age. Run it once after changing POPULARITY_PRIOR_MEAN, POPULARITY_PRIOR_WEIGHT or
+POPULARITY_HALF_LIFE_DAYS. One batch per transaction, in id order; safe to run while the app
+serves traffic.
+
+Usage (from backend directory):
+  python scripts/refresh_popularity.py [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Ensure backend is on path so "app" resolves
+_backend = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+from app.core.database import AsyncSessionLocal
+from app.repositories import RatingRepository
+
+
+async def refresh(batch_size: int) -> int:
+    updated_total = 0
+    after_id = None
+    while True:
+        async with AsyncSessionLocal() as session:
+            updated, after_id = await RatingRepository(session).refresh_popularity(after_id, batch_size)
+            await session.commit()
+        if after_id is None:
+            break
+        updated_total += updated
+    print(f"Refreshed popularity_score of {updated_total} resource(s).")
+    return updated_total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000, help="resources per transaction")
+    args = parser.parse_args()
+    asyncio.run(refresh(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
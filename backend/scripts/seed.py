@@ -25,6 +25,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import AsyncSessionLocal
 from app.models.core import Resource, ResourceType, User
 from app.models.reference import Mentor, SkillLevel, Team, Technology
+from app.repositories import RatingRepository
 
 
 DEMO_TELEGRAM_ID = 999000111  # Demo user for seeding
@@ -126,9 +127,12 @@ async def seed(session: AsyncSession) -> None:
             skill_level_id=skill_levels[level_idx].id,
             average_rating=Decimal("4.20") if tech_idx % 2 == 0 else Decimal("3.80"),
             ratings_count=tech_idx + 1,
+            # Synthetic stats (no ratings rows): a matching sum so new votes move the average sensibly
+            ratings_sum=round((Decimal("4.20") if tech_idx % 2 == 0 else Decimal("3.80")) * (tech_idx + 1)),
         )
         session.add(r)
     await session.flush()
+    await RatingRepository(session).refresh_popularity(None, len(resources_data))
 
     print("Seeded: 5 technologies, 3 skill levels, 2 mentors, 1 team, 1 user, 10 resources.")
 
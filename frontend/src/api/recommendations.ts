@@ -39,6 +39,7 @@ export interface Resource {
   mentor?: MentorNested | null;
   is_favorite?: boolean;
   user_rating?: number | null;
+  file_url?: string | null;
 }
 
 export async function fetchRecommendations(): Promise<Resource[]> {
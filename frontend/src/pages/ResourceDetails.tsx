@@ -117,12 +117,14 @@ export default function ResourceDetails() {
 		return 'http://localhost:8000'
 	})()
 
+	// file_url is the content-addressed (immutably cached) form of file_path, when the backend serves the file
+	const filePath = resource.file_url ?? resource.file_path
 	const fileUrl =
-		resource.file_path.startsWith('http') || resource.file_path.startsWith('//')
-			? resource.file_path
-			: resource.file_path.startsWith('/')
-			? `${backendOrigin}${resource.file_path}`
-			: resource.file_path
+		filePath.startsWith('http') || filePath.startsWith('//')
+			? filePath
+			: filePath.startsWith('/')
+			? `${backendOrigin}${filePath}`
+			: filePath
 
 	return (
 		<div className='py-6'>